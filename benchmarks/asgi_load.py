@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+asgi_load.py - Local load driver for the scores ASGI application.
+
+Drives the app in-process with concurrent synthetic ASGI requests, so it measures
+the application itself without a server or network in the way.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/asgi_load.py [--requests N] [--batch N] [--concurrency N]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from pyscored.adapters.asgi import create_asgi_app
+from pyscored.adapters.web_frameworks import WebFrameworkAdapter
+from pyscored.core.scoring_engine import ScoringEngine
+
+
+async def call(app, method: str, path: str, body: bytes = b"", query: bytes = b"") -> int:
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app({"type": "http", "method": method, "path": path, "query_string": query}, receive, send)
+    return status
+
+
+async def drive(name: str, requests, concurrency: int, updates_per_request: int) -> None:
+    queue = list(requests)
+    start = time.perf_counter()
+
+    async def worker():
+        while queue:
+            status = await call(*queue.pop())
+            assert status == 200, status
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    total = len(requests)
+    print(f"{name:<12} {total / elapsed:>10,.0f} requests/sec {total * updates_per_request / elapsed:>12,.0f} updates/sec")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--players", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--batch", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    engine = ScoringEngine()
+    player_ids = [f"player{i}" for i in range(args.players)]
+    for player_id in player_ids:
+        engine.initialize_score(player_id)
+    app = create_asgi_app(WebFrameworkAdapter(engine))
+
+    single = [(app, "POST", f"/scores/{random.choice(player_ids)}", b'{"points": 1}')
+              for _ in range(args.requests)]
+    bulk_count = max(1, args.requests // args.batch)
+    bulk = [(app, "POST", "/scores", json.dumps(
+        {"updates": [[random.choice(player_ids), 1] for _ in range(args.batch)]}).encode())
+        for _ in range(bulk_count)]
+    pages = [(app, "GET", "/scores", b"", b"offset=0&limit=50") for _ in range(args.requests)]
+
+    asyncio.run(drive("single", single, args.concurrency, 1))
+    asyncio.run(drive("bulk", bulk, args.concurrency, args.batch))
+    asyncio.run(drive("leaderboard", pages, args.concurrency, 0))
+
+
+if __name__ == "__main__":
+    main()
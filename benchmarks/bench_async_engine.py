@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+bench_async_engine.py - Measures AsyncScoringEngine throughput with many concurrent client coroutines.
+
+Each client awaits its own writes one after another and reads its score back, the
+way a request handler would, while a dashboard coroutine reads a full snapshot
+every ``--snapshot-interval`` seconds.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/bench_async_engine.py [--clients N] [--updates N] [--players N] [--snapshot-interval S]
+"""
+
+import argparse
+import asyncio
+import time
+
+from pyscored.core.async_engine import AsyncScoringEngine
+from pyscored.core.scoring_engine import ScoringEngine
+
+
+async def run(clients: int, updates: int, players: int, max_batch: int, snapshot_interval: float) -> None:
+    engine = ScoringEngine()
+    for i in range(players):
+        engine.initialize_score(f"player{i}")
+    async with AsyncScoringEngine(engine, max_batch=max_batch) as scores:
+        done = False
+        snapshots = 0
+
+        async def client(index: int) -> None:
+            player_id = f"player{index % players}"
+            for _ in range(updates):
+                await scores.update_score(player_id, 1.0)
+                scores.get_score(player_id)
+
+        async def dashboard() -> None:
+            nonlocal snapshots
+            while not done:
+                scores.snapshot()
+                snapshots += 1
+                await asyncio.sleep(snapshot_interval)
+
+        batches = scores.batches
+        reader = asyncio.ensure_future(dashboard()) if snapshot_interval > 0 else None
+        start = time.perf_counter()
+        await asyncio.gather(*(client(i) for i in range(clients)))
+        elapsed = time.perf_counter() - start
+        done = True
+        if reader is not None:
+            await reader
+        total = clients * updates
+        assert sum(scores.snapshot().values()) == total
+        print(f"{players:,} players  {clients:,} clients  {total / elapsed:>10,.0f} updates/sec  "
+              f"{(scores.batches - batches):,} batches (avg {total / (scores.batches - batches):,.0f} per batch)  "
+              f"{snapshots:,} snapshots read")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=10_000)
+    parser.add_argument("--updates", type=int, default=20)
+    parser.add_argument("--players", type=int, default=1_000_000)
+    parser.add_argument("--max-batch", type=int, default=1024)
+    parser.add_argument("--snapshot-interval", type=float, default=0.1)
+    args = parser.parse_args()
+    asyncio.run(run(args.clients, args.updates, args.players, args.max_batch, args.snapshot_interval))
+
+
+if __name__ == "__main__":
+    main()
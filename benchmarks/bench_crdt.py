@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+bench_crdt.py - Measures CRDT score merge throughput for full-state and delta exchanges.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/bench_crdt.py [--players N] [--changed FRACTION]
+"""
+
+import argparse
+import random
+import time
+
+from pyscored.core.crdt import CRDTScores
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--players", type=int, default=1_000_000)
+    parser.add_argument("--changed", type=float, default=0.01)
+    args = parser.parse_args()
+
+    a, b = CRDTScores("node-a"), CRDTScores("node-b")
+    player_ids = [f"player{i}" for i in range(args.players)]
+    start = time.perf_counter()
+    for player_id in player_ids:
+        a.assign(player_id, 0)
+    print(f"assign      {args.players / (time.perf_counter() - start):>12,.0f} players/sec")
+
+    start = time.perf_counter()
+    delta, seen_a = a.delta()
+    b.merge(delta)
+    seen_b = b.version
+    print(f"full merge  {args.players / (time.perf_counter() - start):>12,.0f} players/sec")
+
+    changed = random.sample(player_ids, int(args.players * args.changed))
+    for player_id in changed:
+        a.increment(player_id, 3)
+        b.increment(player_id, -1)
+    start = time.perf_counter()
+    delta, seen_a = a.delta(seen_a)
+    b.merge(delta)
+    delta, seen_b = b.delta(seen_b)
+    a.merge(delta)
+    elapsed = time.perf_counter() - start
+    print(f"delta sync  {len(changed) / elapsed:>12,.0f} changed players/sec "
+          f"({len(changed):,} of {args.players:,} players, {elapsed * 1000:.0f} ms)")
+    assert dict(a.items()) == dict(b.items())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+bench_dedup.py - Measures the per-event cost of event-id deduplication.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/bench_dedup.py [--events N] [--duplicates FRACTION]
+"""
+
+import argparse
+import itertools
+import random
+import time
+
+from pyscored.core.dedup import EventDeduplicator
+from pyscored.core.scoring_engine import ScoringEngine
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--duplicates", type=float, default=0.05)
+    args = parser.parse_args()
+
+    event_ids = [f"evt-{i}" for i in range(args.events)]
+    # One clock tick per event spreads the events evenly over the window.
+    dedup = EventDeduplicator(window=float(args.events), expected_events=args.events,
+                              recent=args.events / 60, clock=itertools.count().__next__)
+    seen = dedup.seen
+    start = time.perf_counter()
+    for event_id in event_ids:
+        seen(event_id)
+    print(f"new ids       {(time.perf_counter() - start) / args.events * 1e9:>8,.0f} ns/event")
+
+    retried = random.sample(event_ids, int(args.events * args.duplicates))
+    start = time.perf_counter()
+    caught = sum(map(seen, retried))
+    print(f"retried ids   {(time.perf_counter() - start) / len(retried) * 1e9:>8,.0f} ns/event "
+          f"({caught:,} of {len(retried):,} caught)")
+    false_positives = sum(f"fresh-{i}" in dedup for i in range(100_000))
+    print(f"false positives {false_positives / 100_000:.2e}")
+
+    engine = ScoringEngine()
+    engine.enable_dedup(expected_events=args.events)
+    players = [f"player{i}" for i in range(1000)]
+    for player_id in players:
+        engine.initialize_score(player_id)
+    updates = [(players[i % 1000], 1.0) for i in range(args.events)]
+    start = time.perf_counter()
+    for player_id, points in updates:
+        engine.update_score(player_id, points)
+    plain = time.perf_counter() - start
+    start = time.perf_counter()
+    for (player_id, points), event_id in zip(updates, event_ids):
+        engine.update_score(player_id, points, event_id)
+    with_ids = time.perf_counter() - start
+    print(f"update_score  {plain / args.events * 1e9:>8,.0f} ns without ids, "
+          f"{with_ids / args.events * 1e9:,.0f} ns with ids")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+bench_query.py - Times ScoringEngine.query() aggregations over a large array-backed store.
+
+Compares each vectorized query with the equivalent Python loop over the snapshot.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/bench_query.py [--players N] [--no-baseline]
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable
+
+from pyscored.core.scoring_engine import ScoringEngine
+from pyscored.storage.array import ArrayStore
+
+
+def timed(label: str, function: Callable[[], Any]) -> Any:
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:<28} {time.perf_counter() - start:>8.3f}s")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--players", type=int, default=10_000_000)
+    parser.add_argument("--no-baseline", action="store_true", help="skip the Python-loop comparison")
+    args = parser.parse_args()
+
+    store = ArrayStore("d")
+    rng = random.Random(1)
+    timed(f"load {args.players:,} players",
+          lambda: store.update((f"player{i}", rng.random() * 1000) for i in range(args.players)))
+    engine = ScoringEngine(store=store)
+
+    query = timed("query() snapshot", engine.query)
+    timed("sum", query.sum)
+    timed("mean", query.mean)
+    timed("count_where > 900", lambda: query.count_where(">", 900))
+    timed("histogram(10)", lambda: query.histogram(10))
+    timed("filter > 999.99 (first run)", lambda: query.filter(">", 999.99))
+    timed("filter > 999.99", lambda: query.filter(">", 999.99))
+    timed("select 1,000 players", lambda: query.select(f"player{i}" for i in range(0, args.players, max(1, args.players // 1000))))
+
+    if not args.no_baseline:
+        snapshot = engine.snapshot()
+        timed("python loop sum", lambda: sum(score for _, score in snapshot.items()))
+        timed("python loop count > 900", lambda: sum(1 for _, score in snapshot.items() if score > 900))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+bench_replication.py - Measures leader-to-follower replication throughput on localhost.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/bench_replication.py [--players N] [--updates N] [--followers N]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from pyscored.core.replication import ReplicationFollower, ReplicationLeader
+from pyscored.core.scoring_engine import ScoringEngine
+
+
+async def run(players: int, updates: int, followers: int, batch: int) -> None:
+    engine = ScoringEngine()
+    player_ids = [f"player{i}" for i in range(players)]
+    for player_id in player_ids:
+        engine.initialize_score(player_id)
+    leader = ReplicationLeader(engine)
+    host, port = await leader.serve()
+
+    replicas = [ReplicationFollower(ScoringEngine()) for _ in range(followers)]
+    start = time.perf_counter()
+    for replica in replicas:
+        replica.connect(host, port)
+    for replica in replicas:
+        await replica.wait_for(leader.sequence)
+    print(f"initial sync of {players:,} players: {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    max_lag = 0
+    for i in range(0, updates, batch):
+        with engine.transaction():
+            for player_id in random.choices(player_ids, k=batch):
+                engine.update_score(player_id, 1)
+        # Yield to the event loop so the leader can ship what was written.
+        await asyncio.sleep(0)
+        max_lag = max(max_lag, leader.lag)
+    for replica in replicas:
+        await replica.wait_for(leader.sequence)
+    elapsed = time.perf_counter() - start
+    print(f"{updates:,} updates to {followers} follower(s): {updates / elapsed:,.0f} changes/sec, "
+          f"max acknowledged lag {max_lag:,} changes")
+
+    for replica in replicas:
+        await replica.close()
+    await leader.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--players", type=int, default=100_000)
+    parser.add_argument("--updates", type=int, default=500_000)
+    parser.add_argument("--followers", type=int, default=2)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(run(args.players, args.updates, args.followers, args.batch))
+
+
+if __name__ == "__main__":
+    main()
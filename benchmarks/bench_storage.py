@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+bench_storage.py - Compares ScoringEngine update throughput across score stores.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/bench_storage.py [--players N] [--updates N]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from pyscored.core.scoring_engine import ScoringEngine
+from pyscored.storage.memory import InMemoryStore
+from pyscored.storage.shared import SharedMemoryStore
+from pyscored.storage.sqlite import SQLiteStore
+from pyscored.storage.tiered import TieredStore
+
+
+def run(name: str, engine: ScoringEngine, players: int, updates: int) -> None:
+    player_ids = [f"player{i}" for i in range(players)]
+    for player_id in player_ids:
+        engine.initialize_score(player_id)
+    engine.flush()
+    picks = [random.choice(player_ids) for _ in range(updates)]
+    start = time.perf_counter()
+    for player_id in picks:
+        engine.update_score(player_id, 1.0)
+    engine.flush()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<12} {updates / elapsed:>12,.0f} updates/sec ({elapsed:.3f}s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--players", type=int, default=10_000)
+    parser.add_argument("--updates", type=int, default=500_000)
+    args = parser.parse_args()
+
+    run("memory", ScoringEngine(store=InMemoryStore()), args.players, args.updates)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = ScoringEngine(store=SQLiteStore(os.path.join(tmp, "scores.db")))
+        run("sqlite", engine, args.players, args.updates)
+        engine.close()
+        store = TieredStore(os.path.join(tmp, "tiered.db"))
+        engine = ScoringEngine(store=store)
+        run("tiered", engine, args.players, args.updates)
+        store.evict(idle_after=0.0)
+        for player_id in random.sample(range(args.players), min(1000, args.players)):
+            engine.get_score(f"player{player_id}")
+        metrics = store.metrics()
+        print(f"{'':<12} {metrics.evictions:,} evicted, {metrics.faults:,} faults, "
+              f"fault latency avg {metrics.fault_latency_avg * 1e6:.0f}us max {metrics.fault_latency_max * 1e6:.0f}us")
+        engine.close()
+    engine = ScoringEngine(store=SharedMemoryStore(capacity=args.players))
+    run("shared", engine, args.players, args.updates)
+    engine.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+bench_wire.py - Compares the binary wire format with JSON for snapshots and event batches.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/bench_wire.py [--players N] [--events N]
+"""
+
+import argparse
+import json
+import random
+import time
+
+from pyscored.core.wire import WireDecoder, WireEncoder, dumps_snapshot, loads_snapshot
+
+
+def measure(name: str, encode, decode, count: int) -> None:
+    start = time.perf_counter()
+    data = encode()
+    encoded = time.perf_counter()
+    decode(data)
+    decoded = time.perf_counter()
+    size = len(data) if isinstance(data, bytes) else sum(map(len, data))
+    print(f"{name:<18} {size:>12,} bytes  encode {count / (encoded - start):>12,.0f}/s"
+          f"  decode {count / (decoded - encoded):>12,.0f}/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--players", type=int, default=1_000_000)
+    parser.add_argument("--events", type=int, default=100_000)
+    args = parser.parse_args()
+
+    player_ids = [f"player{i}" for i in range(args.players)]
+    whole = {player_id: float(random.randint(0, 1_000_000)) for player_id in player_ids}
+    fractional = {player_id: random.random() * 1000 for player_id in player_ids}
+    fixed = {player_id: random.randint(0, 10 ** 9) for player_id in player_ids}
+    events = [(random.choice(player_ids), float(random.randint(1, 100))) for _ in range(args.events)]
+
+    for label, scores in (("whole floats", whole), ("float64", fractional), ("fixed-point", fixed)):
+        print(f"snapshot of {args.players:,} players, {label}:")
+        measure("  json", lambda: json.dumps(scores).encode(), json.loads, args.players)
+        measure("  wire", lambda: dumps_snapshot(scores), loads_snapshot, args.players)
+
+    print(f"{args.events:,} events in batches of 1,000:")
+    batches = [events[i:i + 1000] for i in range(0, len(events), 1000)]
+    measure("  json", lambda: [json.dumps(batch).encode() for batch in batches],
+            lambda data: [json.loads(batch) for batch in data], args.events)
+
+    def encode_events():
+        encoder = WireEncoder()
+        return b"".join(encoder.encode_events(batch) for batch in batches)
+
+    measure("  wire", encode_events, lambda data: list(WireDecoder().decode(data)), args.events)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,5 +7,6 @@ game and web frameworks.
 
 from .game_frameworks import GameFrameworkAdapter
 from .web_frameworks import WebFrameworkAdapter
+from .asgi import create_asgi_app
 
-__all__ = ["GameFrameworkAdapter", "WebFrameworkAdapter"]
+__all__ = ["GameFrameworkAdapter", "WebFrameworkAdapter", "create_asgi_app"]
@@ -0,0 +1,225 @@
+# pyscored/adapters/asgi.py
+
+import json
+from typing import Any, Awaitable, Callable, Dict, List, MutableMapping, Optional, Tuple
+from urllib.parse import parse_qs, unquote
+
+from pyscored.adapters.web_frameworks import WebFrameworkAdapter
+from pyscored.core.admission import RateLimitExceeded
+from pyscored.core.snapshot import ScoreSnapshot
+
+Scope = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[MutableMapping[str, Any]]]
+Send = Callable[[MutableMapping[str, Any]], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+JSON_HEADERS = [(b"content-type", b"application/json")]
+NDJSON_HEADERS = [(b"content-type", b"application/x-ndjson")]
+
+
+class HTTPError(Exception):
+    """Error that is rendered as a JSON response with the given status code."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class ScoresApp:
+    """Dependency-free ASGI application serving a WebFrameworkAdapter over HTTP.
+
+    Routes:
+
+    - ``GET /scores/{player_id}``: a player's score.
+    - ``PUT /scores/{player_id}``: initialize a player, body ``{"score": 0}``.
+    - ``POST /scores/{player_id}``: add points, body ``{"points": 10}`` with an optional
+      ``"event_id"``; a duplicate event is answered with ``"duplicate": true``.
+    - ``POST /scores``: atomic bulk update, body ``{"updates": [["player1", 10], ...]}``;
+      updates may carry an event id as a third element.
+    - ``GET /scores?offset=0&limit=100``: a page of the leaderboard.
+    - ``GET /export/scores``: every score as streamed newline-delimited JSON.
+
+    Non-streamed responses always carry a content length so connections can be kept alive.
+    Events rejected by the adapter's admission control are answered with 429 and a
+    ``retry-after`` header.
+    """
+
+    def __init__(self, adapter: WebFrameworkAdapter, page_size: int = 100, max_page_size: int = 1000,
+                 export_chunk_size: int = 1000, max_body_size: int = 1 << 20):
+        self.adapter = adapter
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+        self.export_chunk_size = export_chunk_size
+        self.max_body_size = max_body_size
+        self._ranking_source: Optional[ScoreSnapshot] = None
+        self._ranking: List[Tuple[str, float]] = []
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        try:
+            await self._route(scope, receive, send)
+        except RateLimitExceeded as e:
+            retry_after = str(max(1, int(e.retry_after + 0.999))).encode()
+            await self._send_json(send, {"error": str(e), "retry_after": e.retry_after}, status=429,
+                                  headers=[(b"retry-after", retry_after)])
+        except HTTPError as e:
+            await self._send_json(send, {"error": e.message}, status=e.status)
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.adapter.engine.flush()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _route(self, scope: Scope, receive: Receive, send: Send) -> None:
+        method = scope["method"]
+        parts = [unquote(part) for part in scope["path"].strip("/").split("/")]
+        if parts == ["scores"]:
+            if method == "GET":
+                await self._leaderboard(scope, send)
+            elif method == "POST":
+                await self._bulk_update(await self._read_json(receive), send)
+            else:
+                raise HTTPError(405, "Method not allowed.")
+        elif len(parts) == 2 and parts[0] == "scores" and parts[1]:
+            player_id = parts[1]
+            if method == "GET":
+                await self._send_score(send, player_id)
+            elif method == "POST":
+                body = await self._read_json(receive)
+                event_id = self._event_id(body.get("event_id"))
+                try:
+                    applied = await self.adapter.update_user_score(player_id, self._number(body, "points"), event_id)
+                except ValueError as e:
+                    raise HTTPError(404, str(e)) from e
+                await self._send_score(send, player_id, duplicate=not applied)
+            elif method == "PUT":
+                body = await self._read_json(receive)
+                await self.adapter.setup_user(player_id, self._number(body, "score", 0.0))
+                await self._send_score(send, player_id)
+            else:
+                raise HTTPError(405, "Method not allowed.")
+        elif parts == ["export", "scores"] and method == "GET":
+            await self._export(send)
+        else:
+            raise HTTPError(404, "Not found.")
+
+    async def _read_json(self, receive: Receive) -> Dict[str, Any]:
+        body = bytearray()
+        more_body = True
+        while more_body:
+            message = await receive()
+            body.extend(message.get("body", b""))
+            more_body = message.get("more_body", False)
+            if len(body) > self.max_body_size:
+                raise HTTPError(413, "Request body too large.")
+        try:
+            data = json.loads(body) if body else {}
+        except ValueError as e:
+            raise HTTPError(400, "Request body is not valid JSON.") from e
+        if not isinstance(data, dict):
+            raise HTTPError(400, "Request body must be a JSON object.")
+        return data
+
+    @staticmethod
+    def _number(body: Dict[str, Any], field: str, default: Optional[float] = None) -> float:
+        value = body.get(field, default)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise HTTPError(400, f"Field '{field}' must be a number.")
+        return value
+
+    @staticmethod
+    def _event_id(value: Any) -> Optional[str]:
+        if value is not None and not isinstance(value, str):
+            raise HTTPError(400, "Field 'event_id' must be a string.")
+        return value
+
+    async def _send_json(self, send: Send, payload: Any, status: int = 200,
+                         headers: Optional[List[Tuple[bytes, bytes]]] = None) -> None:
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        headers = JSON_HEADERS + [(b"content-length", str(len(body)).encode())] + (headers or [])
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    async def _send_score(self, send: Send, player_id: str, duplicate: bool = False) -> None:
+        score = await self.adapter.get_user_score(player_id)
+        payload: Dict[str, Any] = {"player_id": player_id, "score": score}
+        if duplicate:
+            payload["duplicate"] = True
+        await self._send_json(send, payload)
+
+    async def _bulk_update(self, body: Dict[str, Any], send: Send) -> None:
+        updates = body.get("updates")
+        if not isinstance(updates, list):
+            raise HTTPError(400, "Field 'updates' must be a list of [player_id, points] pairs.")
+        parsed: List[Tuple[str, float, Optional[str]]] = []
+        for update in updates:
+            if isinstance(update, dict):
+                update = (update.get("player_id"), update.get("points"), update.get("event_id"))
+            if (not isinstance(update, (list, tuple)) or not 2 <= len(update) <= 3 or not isinstance(update[0], str)
+                    or isinstance(update[1], bool) or not isinstance(update[1], (int, float))):
+                raise HTTPError(400, "Each update must be a [player_id, points] or [player_id, points, event_id] list.")
+            parsed.append((update[0], update[1], self._event_id(update[2]) if len(update) == 3 else None))
+        try:
+            applied = await self.adapter.update_user_scores(parsed)
+        except ValueError as e:
+            raise HTTPError(404, str(e)) from e
+        await self._send_json(send, {"updated": applied})
+
+    def _ranked(self) -> List[Tuple[str, float]]:
+        engine = self.adapter.engine
+        snapshot = engine.snapshot()
+        # Stores hand out the same snapshot until they are written to, so the sorted
+        # ranking is reused across page requests between writes.
+        if snapshot is not self._ranking_source:
+            ranking = sorted(snapshot.items(), key=lambda item: item[1], reverse=True)
+            if engine.fixed_point is not None:
+                to_float = engine.fixed_point.to_float
+                ranking = [(player_id, to_float(score)) for player_id, score in ranking]
+            self._ranking, self._ranking_source = ranking, snapshot
+        return self._ranking
+
+    async def _leaderboard(self, scope: Scope, send: Send) -> None:
+        query = parse_qs(scope.get("query_string", b"").decode())
+        try:
+            offset = int(query.get("offset", ["0"])[0])
+            limit = int(query.get("limit", [str(self.page_size)])[0])
+        except ValueError as e:
+            raise HTTPError(400, "offset and limit must be integers.") from e
+        if offset < 0 or not 0 < limit <= self.max_page_size:
+            raise HTTPError(400, f"offset must be >= 0 and limit between 1 and {self.max_page_size}.")
+        ranking = self._ranked()
+        entries = [{"rank": offset + i + 1, "player_id": player_id, "score": score}
+                   for i, (player_id, score) in enumerate(ranking[offset:offset + limit])]
+        await self._send_json(send, {"offset": offset, "limit": limit, "total": len(ranking), "entries": entries})
+
+    async def _export(self, send: Send) -> None:
+        engine = self.adapter.engine
+        to_float = engine.fixed_point.to_float if engine.fixed_point is not None else None
+        await send({"type": "http.response.start", "status": 200, "headers": NDJSON_HEADERS})
+        chunk: List[str] = []
+        dumps = json.dumps
+        for player_id, score in engine.snapshot().items():
+            if to_float is not None:
+                score = to_float(score)
+            chunk.append(dumps({"player_id": player_id, "score": score}))
+            if len(chunk) >= self.export_chunk_size:
+                await send({"type": "http.response.body", "body": ("\n".join(chunk) + "\n").encode(),
+                            "more_body": True})
+                chunk = []
+        body = ("\n".join(chunk) + "\n").encode() if chunk else b""
+        await send({"type": "http.response.body", "body": body, "more_body": False})
+
+
+def create_asgi_app(adapter: WebFrameworkAdapter, **options: Any) -> ASGIApp:
+    """Creates the scores ASGI application, e.g. ``uvicorn module:app``."""
+    return ScoresApp(adapter, **options)
@@ -1,32 +1,80 @@
 # pyscored/adapters/web_frameworks.py
 
-from typing import Any, Dict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple, Union
+from pyscored.core.admission import AdmissionControl
+from pyscored.core.async_engine import AsyncScoringEngine
+from pyscored.core.feed import Subscription
 from pyscored.core.scoring_engine import ScoringEngine
 
 
 class WebFrameworkAdapter:
-    """Adapter for integrating the ScoringEngine with modern web frameworks like FastAPI."""
+    """Adapter for integrating the ScoringEngine with modern web frameworks like FastAPI.
 
-    def __init__(self, engine: ScoringEngine):
-        self.engine = engine
+    With an ``admission`` stage, every score event is checked against its player's
+    rate limit first. Single events over the limit raise RateLimitExceeded; rejected
+    events in a batch are dropped before they reach the engine.
+
+    Given an AsyncScoringEngine, writes are queued to its actor task and reads are
+    served from its published snapshot; the started actor must be running on the
+    same event loop as the web framework.
+    """
+
+    def __init__(self, engine: Union[ScoringEngine, AsyncScoringEngine], admission: Optional[AdmissionControl] = None):
+        if isinstance(engine, AsyncScoringEngine):
+            self.actor: Optional[AsyncScoringEngine] = engine
+            self.engine = engine.engine
+        else:
+            self.actor = None
+            self.engine = engine
+        self.admission = admission
+
+    async def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        if self.actor is not None:
+            return await getattr(self.actor, method)(*args, **kwargs)
+        return getattr(self.engine, method)(*args, **kwargs)
 
     async def setup_user(self, user_id: str, initial_score: float = 0.0) -> None:
         """Asynchronously sets up initial scoring for a new user in a web application."""
-        self.engine.initialize_score(user_id, initial_score)
+        await self._call("initialize_score", user_id, initial_score)
 
-    async def update_user_score(self, user_id: str, points: float) -> None:
-        """Asynchronously updates the user's score based on web interactions."""
-        self.engine.update_score(user_id, points)
+    async def update_user_score(self, user_id: str, points: float, event_id: Optional[Hashable] = None) -> bool:
+        """Asynchronously updates the user's score; returns False if the event id was a duplicate."""
+        if self.admission is not None:
+            self.admission.check(user_id)
+        return await self._call("update_score", user_id, points, event_id)
+
+    async def update_user_scores(self, updates: Iterable[Tuple[Any, ...]]) -> int:
+        """Asynchronously applies a batch of ``(user_id, points[, event_id])`` updates atomically.
+
+        Returns how many updates were applied, excluding rate-limited and duplicate events.
+        """
+        if self.admission is not None:
+            updates, _ = self.admission.partition(updates)
+        return await self._call("update_scores", updates)
 
     async def get_user_score(self, user_id: str) -> float:
         """Asynchronously retrieves the current score of a user."""
+        if self.actor is not None:
+            return self.actor.get_score(user_id)
         return self.engine.get_score(user_id)
 
     async def apply_web_rule(self, rule_name: str, **kwargs) -> Any:
         """Asynchronously applies web-specific scoring rules dynamically."""
-        return self.engine.apply_rule(rule_name, **kwargs)
+        if self.admission is not None and "player_id" in kwargs:
+            self.admission.check(kwargs["player_id"])
+        return await self._call("apply_rule", rule_name, **kwargs)
 
     async def execute_plugin_feature(self, plugin_name: str, **kwargs) -> Any:
         """Asynchronously executes additional features provided by registered plugins."""
-        return self.engine.execute_plugin(plugin_name, **kwargs)
+        if self.admission is not None and "player_id" in kwargs:
+            self.admission.check(kwargs["player_id"])
+        return await self._call("execute_plugin", plugin_name, **kwargs)
+
+    async def subscribe_user_scores(self, user_ids: Optional[Iterable[str]] = None,
+                                    on_lag: str = "conflate") -> Subscription:
+        """Subscribes to coalesced score changes for the given users, or all users when None."""
+        return self.engine.subscribe(players=user_ids, on_lag=on_lag)
 
+    async def subscribe_leaderboard(self, top_k: int = 10, on_lag: str = "conflate") -> Subscription:
+        """Subscribes to updates of the top-k leaderboard view."""
+        return self.engine.subscribe(top_k=top_k, on_lag=on_lag)
@@ -0,0 +1,14 @@
+"""
+Streaming analytics for the pyscored library.
+
+This package provides incrementally maintained summaries of engine scores.
+"""
+
+from pyscored.analytics.groups import GroupAggregates
+from pyscored.analytics.heavy_hitters import HeavyHitters
+from pyscored.analytics.quantiles import QuantileSketch
+from pyscored.analytics.query import ScoreQuery
+from pyscored.analytics.triggers import Firing, Trigger, TriggerIndex
+from pyscored.analytics.windows import WindowedScores
+
+__all__ = ["Firing", "GroupAggregates", "HeavyHitters", "QuantileSketch", "ScoreQuery", "Trigger", "TriggerIndex", "WindowedScores"]
@@ -0,0 +1,269 @@
+# pyscored/analytics/groups.py
+
+import math
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from pyscored.utils.sorted_list import SortedList
+
+METRICS = ("sum", "mean", "top")
+
+
+class GroupStats(NamedTuple):
+    """Aggregates of one group's member scores."""
+
+    total: float
+    count: int
+    mean: float
+    top: float
+
+
+class _Group:
+    __slots__ = ("members", "total", "scores", "top")
+
+    def __init__(self) -> None:
+        self.members: Set[str] = set()
+        self.total = 0.0
+        # Scores of the scored members in ascending order, for top-N sums.
+        self.scores = SortedList()
+        self.top = 0.0
+
+
+class GroupAggregates:
+    """Incrementally maintained sum, mean and top-N sum of member scores per group (team, guild).
+
+    Players may belong to several groups. Registered as an engine listener, every
+    score change is applied to the player's groups as a delta, so an update costs
+    O(groups of the player * (log members + top_n)) instead of a pass over every
+    member. Each group keeps its member scores in a ``SortedList``, so the sum of its
+    ``top_n`` best members is only recomputed when a change reaches the top N.
+
+    ``top_groups`` and ``rank`` use a sorted index of groups per metric (``"sum"``,
+    ``"mean"`` or ``"top"``), built on first use and maintained with the groups.
+    Sums accumulate floating-point rounding over many deltas; ``rebuild``
+    recomputes them exactly from the engine.
+    """
+
+    def __init__(self, engine: Any = None, top_n: int = 10):
+        if top_n < 1:
+            raise ValueError("top_n must be at least 1.")
+        self.top_n = top_n
+        self.engine = engine
+        self._groups: Dict[str, _Group] = {}
+        self._memberships: Dict[str, Set[str]] = {}
+        # Last score seen for every scored member, so it can be found in the sorted lists.
+        self._scores: Dict[str, float] = {}
+        # Sorted (metric value, group) lists, one per metric ranked so far.
+        self._indexes: Dict[str, SortedList] = {}
+        if engine is not None:
+            engine.add_listener(self.observe)
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def __contains__(self, group_name: object) -> bool:
+        return group_name in self._groups
+
+    @staticmethod
+    def _metric(group: _Group, metric: str) -> float:
+        if metric == "sum":
+            return group.total
+        if metric == "top":
+            return group.top
+        return group.total / len(group.scores) if group.scores else 0.0
+
+    def _unindex(self, name: str, group: _Group) -> None:
+        for metric, index in self._indexes.items():
+            index.remove((self._metric(group, metric), name))
+
+    def _reindex(self, name: str, group: _Group) -> None:
+        for metric, index in self._indexes.items():
+            index.add((self._metric(group, metric), name))
+
+    def _refresh_top(self, group: _Group) -> None:
+        group.top = sum(group.scores.last(self.top_n))
+
+    def _engine_scores(self, player_ids: Iterable[str]) -> Dict[str, float]:
+        if self.engine is None:
+            return {}
+        snapshot = self.engine.snapshot()
+        fixed_point = self.engine.fixed_point
+        scores = {}
+        for player_id in player_ids:
+            raw = snapshot.get(player_id)
+            if raw is not None:
+                scores[player_id] = fixed_point.to_float(raw) if fixed_point is not None else raw
+        return scores
+
+    def _group(self, group_name: str) -> _Group:
+        group = self._groups.get(group_name)
+        if group is None:
+            group = self._groups[group_name] = _Group()
+            self._reindex(group_name, group)
+        return group
+
+    def add_members(self, group_name: str, player_ids: Iterable[str]) -> None:
+        """Adds players to a group, creating it if needed, with one sort of the member scores.
+
+        Players without a score join unscored and are counted once they get one.
+        """
+        group = self._group(group_name)
+        new = [player_id for player_id in dict.fromkeys(player_ids) if player_id not in group.members]
+        if not new:
+            return
+        self._unindex(group_name, group)
+        unknown = [player_id for player_id in new if player_id not in self._scores]
+        self._scores.update(self._engine_scores(unknown))
+        added = []
+        for player_id in new:
+            group.members.add(player_id)
+            self._memberships.setdefault(player_id, set()).add(group_name)
+            score = self._scores.get(player_id)
+            if score is not None:
+                added.append(score)
+        if added:
+            group.total += sum(added)
+            added.sort()
+            group.scores.update(added)
+            self._refresh_top(group)
+        self._reindex(group_name, group)
+
+    def _forget(self, player_id: str, group_name: str) -> None:
+        memberships = self._memberships[player_id]
+        memberships.discard(group_name)
+        if not memberships:
+            del self._memberships[player_id]
+            self._scores.pop(player_id, None)
+
+    def remove_members(self, group_name: str, player_ids: Iterable[str]) -> None:
+        """Removes players from a group; the group remains, possibly empty, until ``drop_group``."""
+        group = self._groups[group_name]
+        self._unindex(group_name, group)
+        for player_id in player_ids:
+            if player_id not in group.members:
+                continue
+            group.members.discard(player_id)
+            score = self._scores.get(player_id)
+            if score is not None:
+                group.total -= score
+                group.scores.remove(score)
+            self._forget(player_id, group_name)
+        self._refresh_top(group)
+        self._reindex(group_name, group)
+
+    def drop_group(self, group_name: str) -> None:
+        """Deletes a group and its memberships."""
+        group = self._groups.pop(group_name)
+        self._unindex(group_name, group)
+        for player_id in group.members:
+            self._forget(player_id, group_name)
+
+    def merge_groups(self, target: str, source: str) -> None:
+        """Moves every member of ``source`` into ``target`` (a guild merge) and drops ``source``.
+
+        The groups' aggregates are combined and their sorted scores merged in linear
+        time, so the cost depends on the groups' sizes only.
+        """
+        if target == source:
+            return
+        src = self._groups.pop(source)
+        self._unindex(source, src)
+        dst = self._group(target)
+        self._unindex(target, dst)
+        shared = []
+        for player_id in src.members:
+            memberships = self._memberships[player_id]
+            memberships.discard(source)
+            if player_id in dst.members:
+                score = self._scores.get(player_id)
+                if score is not None:
+                    shared.append(score)
+            else:
+                memberships.add(target)
+        dst.members |= src.members
+        dst.total += src.total - sum(shared)
+        dst.scores.update(src.scores)
+        # Players in both groups are only counted once.
+        for score in shared:
+            dst.scores.remove(score)
+        self._refresh_top(dst)
+        self._reindex(target, dst)
+
+    def members(self, group_name: str) -> Set[str]:
+        """Players in a group."""
+        return set(self._groups[group_name].members)
+
+    def groups_of(self, player_id: str) -> Set[str]:
+        """Groups a player belongs to."""
+        return set(self._memberships.get(player_id, ()))
+
+    def observe(self, player_id: str, old: Optional[float], new: Optional[float], points: Optional[float]) -> None:
+        """Engine listener applying a score change to the player's groups."""
+        memberships = self._memberships.get(player_id)
+        if not memberships:
+            return
+        previous = self._scores.get(player_id)
+        if new is None:
+            self._scores.pop(player_id, None)
+        else:
+            self._scores[player_id] = new
+        top_n = self.top_n
+        groups = self._groups
+        indexed = bool(self._indexes)
+        for group_name in memberships:
+            group = groups[group_name]
+            if indexed:
+                self._unindex(group_name, group)
+            scores = group.scores
+            # Only a change at or above the N-th best score can move the top-N sum.
+            cutoff = scores[-top_n] if len(scores) >= top_n else None
+            if previous is not None:
+                group.total -= previous
+                scores.remove(previous)
+            if new is not None:
+                group.total += new
+                scores.add(new)
+            if (cutoff is None or (previous is not None and previous >= cutoff)
+                    or (new is not None and new >= cutoff)):
+                group.top = sum(scores.last(top_n))
+            if indexed:
+                self._reindex(group_name, group)
+
+    def stats(self, group_name: str) -> GroupStats:
+        """Returns a group's score sum, scored member count, mean and top-N sum."""
+        group = self._groups[group_name]
+        count = len(group.scores)
+        return GroupStats(group.total, count, group.total / count if count else 0.0, group.top)
+
+    def _index(self, metric: str) -> SortedList:
+        index = self._indexes.get(metric)
+        if index is None:
+            if metric not in METRICS:
+                raise ValueError(f"Unknown metric '{metric}'; expected one of {', '.join(METRICS)}.")
+            index = self._indexes[metric] = SortedList(
+                (self._metric(group, metric), name) for name, group in self._groups.items())
+        return index
+
+    def top_groups(self, k: int = 10, by: str = "sum") -> List[Tuple[str, float]]:
+        """The ``k`` best groups by ``"sum"``, ``"mean"`` or ``"top"`` as ``(group, value)`` pairs."""
+        index = self._index(by)
+        return [(name, value) for value, name in reversed(index.last(k))] if k > 0 else []
+
+    def rank(self, group_name: str, by: str = "sum") -> int:
+        """1-based rank of a group by a metric; tied groups share the better rank."""
+        index = self._index(by)
+        value = self._metric(self._groups[group_name], by)
+        above = len(index) - index.bisect_left((value, "\U0010ffff"))
+        return above + 1
+
+    def rebuild(self) -> None:
+        """Re-reads member scores from the engine and recomputes every aggregate exactly."""
+        if self.engine is not None:
+            self._scores = self._engine_scores(self._memberships)
+        for group in self._groups.values():
+            group.scores = SortedList(self._scores[p] for p in group.members if p in self._scores)
+            group.total = math.fsum(group.scores)
+            self._refresh_top(group)
+        metrics = list(self._indexes)
+        self._indexes = {}
+        for metric in metrics:
+            self._index(metric)
@@ -0,0 +1,119 @@
+# pyscored/analytics/heavy_hitters.py
+
+import heapq
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class HeavyHitters:
+    """Space-Saving summary of the players generating the most score events.
+
+    At most ``capacity`` players are tracked. An untracked player replaces the
+    tracked player with the smallest count and inherits that count as its error,
+    so estimates never undercount and overcount by at most ``total / capacity``.
+    Tracked counts are bumped in O(1); the min-heap used for evictions is refreshed
+    lazily, so only evictions pay O(log capacity). With ``window`` set, counts
+    restart every ``window`` seconds so rates reflect recent activity.
+    """
+
+    def __init__(self, capacity: int = 1024, window: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        if capacity < 1:
+            raise ValueError("The capacity must be at least 1.")
+        self.capacity = capacity
+        self.window = window
+        self._clock = clock
+        self._counts: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+        self._heap: List[Tuple[int, str]] = []
+        self._total = 0
+        self._started = clock()
+
+    @property
+    def total(self) -> int:
+        """Number of events offered since the window started."""
+        return self._total
+
+    def reset(self) -> None:
+        """Forgets all counts and starts a new window."""
+        self._counts = {}
+        self._errors = {}
+        self._heap = []
+        self._total = 0
+        self._started = self._clock()
+
+    def offer(self, player_id: str, count: int = 1) -> None:
+        """Records ``count`` events for a player."""
+        if self.window is not None and self._clock() - self._started >= self.window:
+            self.reset()
+        self._total += count
+        counts = self._counts
+        current = counts.get(player_id)
+        if current is not None:
+            counts[player_id] = current + count
+            return
+        heap = self._heap
+        if len(counts) < self.capacity:
+            counts[player_id] = count
+            self._errors[player_id] = 0
+            heapq.heappush(heap, (count, player_id))
+            return
+        # Heap entries go stale as counts grow; refresh them until the minimum is accurate.
+        while True:
+            smallest, victim = heap[0]
+            actual = counts[victim]
+            if actual == smallest:
+                break
+            heapq.heapreplace(heap, (actual, victim))
+        del counts[victim]
+        del self._errors[victim]
+        counts[player_id] = smallest + count
+        self._errors[player_id] = smallest
+        heapq.heapreplace(heap, (smallest + count, player_id))
+
+    def observe(self, player_id: str, old: Optional[float], new: Optional[float], points: Optional[float]) -> None:
+        """Engine listener counting every score update as one event; assignments are not events."""
+        if points is None:
+            return
+        self.offer(player_id)
+
+    def _floor(self) -> int:
+        # Any untracked player has occurred at most as often as the smallest tracked count.
+        if len(self._counts) < self.capacity:
+            return 0
+        return min(self._counts.values())
+
+    def estimate(self, player_id: str) -> Tuple[int, int]:
+        """Returns ``(estimated_count, max_overestimate)``; the true count lies in ``[estimate - error, estimate]``."""
+        count = self._counts.get(player_id)
+        if count is None:
+            floor = self._floor()
+            return floor, floor
+        return count, self._errors[player_id]
+
+    def rate(self, player_id: str) -> Tuple[float, float]:
+        """Returns ``(events_per_second, max_overestimate_per_second)`` over the current window."""
+        elapsed = max(self._clock() - self._started, 1e-9)
+        count, error = self.estimate(player_id)
+        return count / elapsed, error / elapsed
+
+    def top_active(self, k: int = 10) -> List[Tuple[str, int, int]]:
+        """Returns the ``k`` most active players as ``(player_id, estimated_count, max_overestimate)``."""
+        top = heapq.nlargest(k, self._counts.items(), key=lambda item: item[1])
+        return [(player_id, count, self._errors[player_id]) for player_id, count in top]
+
+    def merge(self, other: "HeavyHitters") -> None:
+        """Combines another summary into this one, keeping the ``capacity`` largest counts."""
+        floor, other_floor = self._floor(), other._floor()
+        merged: Dict[str, Tuple[int, int]] = {}
+        for player_id in set(self._counts) | set(other._counts):
+            count, error = self._counts.get(player_id, floor), self._errors.get(player_id, floor)
+            other_count = other._counts.get(player_id, other_floor)
+            other_error = other._errors.get(player_id, other_floor)
+            merged[player_id] = (count + other_count, error + other_error)
+        kept = heapq.nlargest(self.capacity, merged.items(), key=lambda item: item[1][0])
+        self._counts = {player_id: count for player_id, (count, _) in kept}
+        self._errors = {player_id: error for player_id, (_, error) in kept}
+        self._heap = [(count, player_id) for player_id, count in self._counts.items()]
+        heapq.heapify(self._heap)
+        self._total += other._total
@@ -0,0 +1,204 @@
+# pyscored/analytics/quantiles.py
+
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+
+class QuantileSketch:
+    """Mergeable DDSketch-style quantile sketch over a changing set of scores.
+
+    Values fall into logarithmic buckets whose width guarantees ``relative_accuracy``
+    on every returned quantile. Unlike t-digest, buckets support removal, so a score
+    change is a move between two buckets. Bucket counts sit in a Fenwick tree, making
+    updates, ranks and quantiles O(log buckets). Sketches with the same parameters
+    merge by adding their counts.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-9, max_value: float = 1e15):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("The relative accuracy must be between 0 and 1.")
+        if not 0 < min_value < max_value:
+            raise ValueError("The tracked value range must satisfy 0 < min_value < max_value.")
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.max_value = max_value
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._min_key = math.ceil(math.log(min_value) / self._log_gamma)
+        self._max_key = math.ceil(math.log(max_value) / self._log_gamma)
+        # Positions: negative buckets (largest magnitude first), zero bucket, positive buckets.
+        self._zero = self._max_key - self._min_key + 1
+        self._size = 2 * self._zero + 1
+        self._tree = [0] * (self._size + 1)
+        self._count = 0
+        self._top_bit = 1 << (self._size.bit_length() - 1)
+
+    def _position(self, value: float) -> int:
+        magnitude = abs(value)
+        if magnitude < self.min_value:
+            return self._zero
+        key = math.ceil(math.log(magnitude) / self._log_gamma)
+        key = min(max(key, self._min_key), self._max_key)
+        if value > 0:
+            return self._zero + 1 + key - self._min_key
+        return self._max_key - key
+
+    def _value_at(self, position: int) -> float:
+        if position == self._zero:
+            return 0.0
+        if position > self._zero:
+            key = position - self._zero - 1 + self._min_key
+            return 2 * self._gamma ** key / (self._gamma + 1)
+        key = self._max_key - position
+        return -2 * self._gamma ** key / (self._gamma + 1)
+
+    def _add_at(self, position: int, count: int) -> None:
+        tree, size = self._tree, self._size
+        index = position + 1
+        while index <= size:
+            tree[index] += count
+            index += index & -index
+
+    def _prefix(self, position: int) -> int:
+        """Number of values in buckets up to and including ``position``."""
+        tree = self._tree
+        total = 0
+        index = position + 1
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+    def _find(self, rank: int) -> int:
+        """Position of the bucket holding the value with the given zero-based rank."""
+        tree, size = self._tree, self._size
+        position = 0
+        bit = self._top_bit
+        while bit:
+            candidate = position + bit
+            if candidate <= size and tree[candidate] <= rank:
+                position = candidate
+                rank -= tree[candidate]
+            bit >>= 1
+        return position
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def count(self) -> int:
+        """Number of values currently in the sketch."""
+        return self._count
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Adds a value to the sketch."""
+        self._add_at(self._position(value), count)
+        self._count += count
+
+    def remove(self, value: float, count: int = 1) -> None:
+        """Removes a previously added value from the sketch."""
+        self._add_at(self._position(value), -count)
+        self._count -= count
+
+    def move(self, old: float, new: float) -> None:
+        """Replaces one value with another, skipping the work when both share a bucket."""
+        old_position, new_position = self._position(old), self._position(new)
+        if old_position != new_position:
+            self._add_at(old_position, -1)
+            self._add_at(new_position, 1)
+
+    def observe(self, player_id: str, old: Optional[float], new: Optional[float], points: Optional[float]) -> None:
+        """Engine listener keeping the sketch in step with score changes."""
+        if old is None:
+            if new is not None:
+                self.add(new)
+        elif new is None:
+            self.remove(old)
+        else:
+            self.move(old, new)
+
+    def rank(self, score: float) -> int:
+        """Approximate number of values less than or equal to ``score``."""
+        return self._prefix(self._position(score))
+
+    def percentile_of(self, score: float) -> float:
+        """Approximate fraction of values less than or equal to ``score``, between 0 and 1."""
+        if not self._count:
+            return 0.0
+        return self.rank(score) / self._count
+
+    def quantile(self, q: float) -> float:
+        """Approximate value at quantile ``q`` (0 to 1), within the sketch's relative accuracy."""
+        if not 0 <= q <= 1:
+            raise ValueError("The quantile must be between 0 and 1.")
+        if not self._count:
+            raise ValueError("The sketch is empty.")
+        return self._value_at(self._find(int(q * (self._count - 1))))
+
+    def histogram(self, bins: Union[int, Sequence[float]] = 10) -> List[Tuple[float, float, int]]:
+        """Counts values per bin as ``(low, high, count)`` tuples.
+
+        ``bins`` is either a number of equal-width bins spanning the current minimum
+        and maximum, or a sorted sequence of bin edges. The first bin is closed on both
+        ends; later bins are half-open ``(low, high]``. When all values are equal, a
+        single ``(value, value, count)`` bin is returned.
+        """
+        if isinstance(bins, int):
+            if bins < 1:
+                raise ValueError("bins must be at least 1.")
+            if not self._count:
+                return []
+            low, high = self.quantile(0.0), self.quantile(1.0)
+            if low == high:
+                edges = [low, high]
+            else:
+                width = (high - low) / bins
+                edges = [low + width * i for i in range(bins)] + [high]
+        else:
+            edges = list(bins)
+        if len(edges) < 2:
+            raise ValueError("A histogram needs at least two bin edges.")
+        result = []
+        previous = self._prefix(self._position(edges[0]) - 1)
+        for low, high in zip(edges, edges[1:]):
+            current = self.rank(high)
+            result.append((low, high, current - previous))
+            previous = current
+        return result
+
+    def _compatible(self, other: "QuantileSketch") -> bool:
+        return (self.relative_accuracy, self.min_value, self.max_value) == (
+            other.relative_accuracy, other.min_value, other.max_value)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Adds another sketch's values into this one, e.g. from another shard or process."""
+        if not self._compatible(other):
+            raise ValueError("Only sketches with the same accuracy and range can be merged.")
+        # Fenwick trees are linear in the bucket counts, so they add elementwise.
+        self._tree = [a + b for a, b in zip(self._tree, other._tree)]
+        self._count += other._count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializes the sketch as its parameters and non-empty bucket counts."""
+        buckets = {}
+        previous = 0
+        for position in range(self._size):
+            current = self._prefix(position)
+            if current != previous:
+                buckets[position] = current - previous
+            previous = current
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "min_value": self.min_value,
+            "max_value": self.max_value,
+            "buckets": buckets,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        """Rebuilds a sketch serialized with ``to_dict``."""
+        sketch = cls(data["relative_accuracy"], data["min_value"], data["max_value"])
+        for position, count in data["buckets"].items():
+            sketch._add_at(int(position), count)
+            sketch._count += count
+        return sketch
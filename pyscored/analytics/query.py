@@ -0,0 +1,166 @@
+# pyscored/analytics/query.py
+
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from decimal import Decimal
+from itertools import compress, count, repeat
+from math import floor
+from operator import is_not
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from pyscored.storage.array import ArraySnapshot
+from pyscored.utils.fixed_point import FixedPoint
+
+# Comparison operators as the method of the threshold ``t`` that tests a score ``x``.
+_OPERATORS: Dict[str, str] = {
+    ">": "__lt__",   # t < x
+    ">=": "__le__",
+    "<": "__gt__",
+    "<=": "__ge__",
+    "==": "__eq__",
+    "!=": "__ne__",
+}
+
+
+class ScoreQuery:
+    """Aggregations and filters over one consistent snapshot of an engine's scores.
+
+    Scores are processed as typed arrays with builtins that run in C (``sum``,
+    ``min``, ``map`` with bound comparison methods, ``compress``, ``Counter``), so
+    no Python code runs per player. Over an ``ArrayStore`` the snapshot's value
+    chunks are used as they are; other stores are copied into an array once. Player
+    ids are only materialized, once per query object, by ``filter``.
+    """
+
+    def __init__(self, snapshot: Mapping[str, Any], fixed_point: Optional[FixedPoint] = None):
+        self._fixed_point = fixed_point
+        self._scale = fixed_point.scale if fixed_point is not None else 1
+        self._snapshot = snapshot
+        self._ids: Optional[List[str]] = None
+        if isinstance(snapshot, ArraySnapshot):
+            columns = snapshot.columns()
+            if len(snapshot) != snapshot.slots:
+                # Drop the zeros of freed slots; ids are needed to tell them apart.
+                slot_ids = snapshot.slot_ids()
+                live = list(map(is_not, slot_ids, repeat(None)))
+                offset = 0
+                kept = []
+                for column in columns:
+                    kept.append(array(column.typecode, compress(column, live[offset:offset + len(column)])))
+                    offset += len(column)
+                columns = kept
+                self._ids = list(compress(slot_ids, live))
+        else:
+            columns = [array("q" if fixed_point is not None else "d", snapshot.values())]
+        self._columns: List[array] = columns
+        self._count = sum(map(len, columns))
+
+    def _to_float(self, raw: Any) -> float:
+        return raw / self._scale if self._fixed_point is not None else raw
+
+    def _threshold(self, value: float) -> Union[int, float]:
+        """A score bound in the units of the stored scores, comparing exactly with them."""
+        if self._fixed_point is None:
+            return float(value)
+        # Quantized like the scores themselves, so 4.35 matches a score entered as 4.35
+        # even though 4.35 * 100 is 434.99999999999994 in binary.
+        raw = self._fixed_point.to_fixed(value)
+        exact = Decimal(repr(value) if isinstance(value, float) else value) * self._scale
+        if exact == raw:
+            return raw
+        # Between two representable scores: any value strictly between them orders the same.
+        return floor(exact) + 0.5
+
+    def _test(self, op: str, value: float) -> Callable[[Any], bool]:
+        name = _OPERATORS.get(op)
+        if name is None:
+            raise ValueError(f"Unknown operator '{op}'; expected one of {', '.join(_OPERATORS)}.")
+        return getattr(self._threshold(value), name)
+
+    def _player_ids(self) -> List[str]:
+        if self._ids is None:
+            snapshot = self._snapshot
+            if isinstance(snapshot, ArraySnapshot):
+                self._ids = snapshot.slot_ids()
+            else:
+                self._ids = list(snapshot.keys())
+        return self._ids
+
+    def count(self) -> int:
+        """Number of players."""
+        return self._count
+
+    def sum(self) -> float:
+        """Total of all scores; exact in fixed-point mode."""
+        return self._to_float(sum(map(sum, self._columns), 0))
+
+    def mean(self) -> float:
+        """Mean score, 0.0 without players."""
+        return self.sum() / self._count if self._count else 0.0
+
+    def min(self) -> float:
+        """Lowest score; raises ValueError without players."""
+        return self._to_float(min(map(min, filter(None, self._columns))))
+
+    def max(self) -> float:
+        """Highest score; raises ValueError without players."""
+        return self._to_float(max(map(max, filter(None, self._columns))))
+
+    def count_where(self, op: str, value: float) -> int:
+        """Number of players whose score compares to ``value`` with ``op`` (``">"``, ``">="``, ``"<"``, ``"<="``, ``"=="``, ``"!="``)."""
+        test = self._test(op, value)
+        return sum(sum(map(test, column)) for column in self._columns)
+
+    def histogram(self, bins: Union[int, Sequence[float]] = 10) -> List[Tuple[float, float, int]]:
+        """Exact score histogram as ``(low, high, count)`` tuples.
+
+        ``bins`` is a number of equal-width bins over the score range or a sequence of
+        bin edges. Bins include their lower edge; the last one also its upper edge.
+        Scores outside explicit edges are not counted.
+        """
+        if isinstance(bins, int):
+            if bins < 1:
+                raise ValueError("bins must be at least 1.")
+            if not self._count:
+                return []
+            low, high = self.min(), self.max()
+            width = (high - low) / bins
+            edges = [low + width * i for i in range(bins)] + [high]
+        else:
+            edges = list(bins)
+            if len(edges) < 2 or edges != sorted(edges):
+                raise ValueError("bin edges must be at least two ascending values.")
+        raw_edges = [self._threshold(edge) for edge in edges]
+        counts: Counter = Counter()
+        for column in self._columns:
+            counts.update(map(bisect_right, repeat(raw_edges), column))
+        result = [(edges[i - 1], edges[i], counts[i]) for i in range(1, len(edges))]
+        last_low, last_high, last_count = result[-1]
+        result[-1] = (last_low, last_high, last_count + self.count_where("==", last_high))
+        return result
+
+    def filter(self, op: str, value: float, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """``(player_id, score)`` of the players whose score compares to ``value`` with ``op``, up to ``limit``."""
+        test = self._test(op, value)
+        ids = self._player_ids()
+        result: List[Tuple[str, float]] = []
+        offset = 0
+        for column in self._columns:
+            for index in compress(count(offset), map(test, column)):
+                result.append((ids[index], self._to_float(column[index - offset])))
+                if limit is not None and len(result) >= limit:
+                    return result
+            offset += len(column)
+        return result
+
+    def select(self, player_ids: Iterable[str]) -> Dict[str, float]:
+        """Scores of the given players that exist in the snapshot."""
+        get = self._snapshot.get
+        to_float = self._to_float
+        result = {}
+        for player_id in player_ids:
+            raw = get(player_id)
+            if raw is not None:
+                result[player_id] = to_float(raw)
+        return result
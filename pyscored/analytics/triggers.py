@@ -0,0 +1,146 @@
+# pyscored/analytics/triggers.py
+
+from bisect import bisect_right, insort
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+Change = Tuple[str, Optional[float], Optional[float], Optional[float]]
+
+
+class Trigger(NamedTuple):
+    """A score threshold that fires when a player's score crosses it."""
+
+    name: str
+    threshold: float
+    direction: str = "up"
+    once: bool = True
+
+
+class Firing(NamedTuple):
+    """One trigger fired for one player by a score change."""
+
+    trigger: Trigger
+    player_id: str
+    old: float
+    new: float
+
+
+TriggerCallback = Callable[[List[Firing]], None]
+
+
+class TriggerIndex:
+    """Threshold and achievement triggers checked against every score change.
+
+    Upward triggers fire when a score rises from below the threshold to at least it;
+    downward triggers fire when it falls from at least the threshold to below it.
+    Thresholds are kept sorted per direction, so a change from ``old`` to ``new`` only
+    looks at the thresholds between the two, in O(log k + fired). New players (no
+    previous score) and removals do not fire.
+
+    Firings of one committed update or transaction are delivered to every callback
+    as one list. A ``once`` trigger fires at most once per player; the set of
+    players it fired for is part of ``to_dict`` so a restored index keeps that promise.
+    """
+
+    def __init__(self, engine: Any = None):
+        self.engine = engine
+        self._triggers: Dict[str, Trigger] = {}
+        # Ascending (threshold, name) pairs per direction.
+        self._up: List[Tuple[float, str]] = []
+        self._down: List[Tuple[float, str]] = []
+        self._fired: Dict[str, Set[str]] = {}
+        self._callbacks: List[TriggerCallback] = []
+        if engine is not None:
+            engine.add_batch_listener(self.observe_batch)
+
+    def __len__(self) -> int:
+        return len(self._triggers)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._triggers
+
+    def add_trigger(self, name: str, threshold: float, direction: str = "up", once: bool = True) -> Trigger:
+        """Adds a trigger; names are unique."""
+        if direction not in ("up", "down"):
+            raise ValueError("direction must be 'up' or 'down'.")
+        if name in self._triggers:
+            raise ValueError(f"Trigger '{name}' already exists.")
+        trigger = self._triggers[name] = Trigger(name, threshold, direction, once)
+        insort(self._up if direction == "up" else self._down, (threshold, name))
+        if once:
+            self._fired[name] = set()
+        return trigger
+
+    def remove_trigger(self, name: str) -> None:
+        """Removes a trigger and forgets whom it fired for."""
+        trigger = self._triggers.pop(name)
+        index = self._up if trigger.direction == "up" else self._down
+        index.remove((trigger.threshold, name))
+        self._fired.pop(name, None)
+
+    def on_fire(self, callback: TriggerCallback) -> None:
+        """Registers ``callback(firings)``, called once per batch of changes that fired triggers."""
+        self._callbacks.append(callback)
+
+    def fired_for(self, name: str) -> Set[str]:
+        """Players a once-only trigger has fired for."""
+        return set(self._fired.get(name, ()))
+
+    def check(self, player_id: str, old: float, new: float) -> List[Firing]:
+        """Returns the triggers a change from ``old`` to ``new`` fires, recording once-only ones."""
+        if new > old:
+            index = self._up
+        elif new < old:
+            index = self._down
+        else:
+            return []
+        if not index:
+            return []
+        # Thresholds t with old < t <= new (rising) or new < t <= old (falling).
+        low, high = (old, new) if new > old else (new, old)
+        start = bisect_right(index, (low, "\U0010ffff"))
+        stop = bisect_right(index, (high, "\U0010ffff"))
+        firings = []
+        for _, name in index[start:stop]:
+            trigger = self._triggers[name]
+            if trigger.once:
+                fired = self._fired[name]
+                if player_id in fired:
+                    continue
+                fired.add(player_id)
+            firings.append(Firing(trigger, player_id, old, new))
+        if new < old:
+            # Falling scores cross the highest threshold first.
+            firings.reverse()
+        return firings
+
+    def observe_batch(self, changes: Iterable[Change]) -> None:
+        """Engine batch listener checking a batch of changes and delivering their firings together."""
+        firings: List[Firing] = []
+        for player_id, old, new, _ in changes:
+            if old is not None and new is not None and old != new:
+                firings.extend(self.check(player_id, old, new))
+        if firings:
+            for callback in self._callbacks:
+                callback(firings)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializes the triggers and the players once-only triggers fired for."""
+        return {
+            "triggers": [list(trigger) for trigger in self._triggers.values()],
+            "fired": {name: sorted(players) for name, players in self._fired.items() if players},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], engine: Any = None) -> "TriggerIndex":
+        """Rebuilds an index serialized with ``to_dict``, optionally attached to an engine."""
+        index = cls(engine)
+        index.load(data)
+        return index
+
+    def load(self, data: Dict[str, Any]) -> None:
+        """Adds the triggers and fired sets from a ``to_dict`` payload."""
+        for name, threshold, direction, once in data["triggers"]:
+            self.add_trigger(name, threshold, direction, once)
+        for name, players in data.get("fired", {}).items():
+            if name in self._fired:
+                self._fired[name].update(players)
@@ -0,0 +1,145 @@
+# pyscored/analytics/windows.py
+
+import heapq
+import time
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class WindowedScores:
+    """Points earned per player over a sliding time window, such as the last 15 minutes.
+
+    The window is split into ``buckets`` fixed-width time buckets. Each player has a
+    slot of ``buckets`` counters in one flat array plus a running total, so memory is
+    ``8 * (buckets + 2)`` bytes per player whatever the event rate. Buckets that slid
+    out of the window are cleared lazily, when the player is next updated or read.
+
+    Window sums have the resolution of one bucket: the oldest bucket is dropped as a
+    whole, so a sum covers between ``window - window / buckets`` and ``window`` seconds.
+    Registered as an engine listener, every ``update_score`` increment is counted;
+    assignments and resets are not points earned and are ignored.
+    """
+
+    def __init__(self, window: float = 900.0, buckets: int = 60, engine: Any = None,
+                 clock: Callable[[], float] = time.monotonic):
+        if window <= 0:
+            raise ValueError("window must be positive.")
+        if buckets < 1:
+            raise ValueError("buckets must be at least 1.")
+        self.window = window
+        self.buckets = buckets
+        self.width = window / buckets
+        self.engine = engine
+        self._clock = clock
+        self._slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        # Bucket counters of slot s at [s * buckets, (s + 1) * buckets), indexed by epoch % buckets.
+        self._counts = array("d")
+        self._totals = array("d")
+        # Epoch (bucket number since the clock's origin) each slot was last brought up to date.
+        self._epochs = array("q")
+        self._empty = array("d", bytes(8 * buckets))
+        if engine is not None:
+            engine.add_listener(self.observe)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self._slots
+
+    def _epoch(self) -> int:
+        return int(self._clock() // self.width)
+
+    def _expire(self, slot: int, epoch: int) -> None:
+        last = self._epochs[slot]
+        if epoch <= last:
+            return
+        buckets = self.buckets
+        base = slot * buckets
+        counts = self._counts
+        if epoch - last >= buckets:
+            counts[base:base + buckets] = self._empty
+            self._totals[slot] = 0.0
+        else:
+            for e in range(last + 1, epoch + 1):
+                counts[base + e % buckets] = 0.0
+            # Re-summing the live buckets keeps the total free of accumulated rounding.
+            self._totals[slot] = sum(counts[base:base + buckets])
+        self._epochs[slot] = epoch
+
+    def _slot(self, player_id: str, epoch: int) -> int:
+        slot = self._slots.get(player_id)
+        if slot is not None:
+            self._expire(slot, epoch)
+            return slot
+        if self._free:
+            slot = self._free.pop()
+            self._counts[slot * self.buckets:(slot + 1) * self.buckets] = self._empty
+            self._totals[slot] = 0.0
+            self._epochs[slot] = epoch
+        else:
+            slot = len(self._totals)
+            self._counts.extend(self._empty)
+            self._totals.append(0.0)
+            self._epochs.append(epoch)
+        self._slots[player_id] = slot
+        return slot
+
+    def add(self, player_id: str, points: float) -> None:
+        """Counts ``points`` for a player in the current bucket."""
+        epoch = self._epoch()
+        slot = self._slot(player_id, epoch)
+        self._counts[slot * self.buckets + epoch % self.buckets] += points
+        self._totals[slot] += points
+
+    def discard(self, player_id: str) -> None:
+        """Forgets a player and frees its slot for reuse."""
+        slot = self._slots.pop(player_id, None)
+        if slot is not None:
+            self._free.append(slot)
+
+    def observe(self, player_id: str, old: Optional[float], new: Optional[float], points: Optional[float]) -> None:
+        """Engine listener counting score increments."""
+        if new is None:
+            self.discard(player_id)
+        elif points is not None:
+            self.add(player_id, points)
+
+    def score(self, player_id: str) -> float:
+        """Points a player earned within the window."""
+        slot = self._slots.get(player_id)
+        if slot is None:
+            return 0.0
+        self._expire(slot, self._epoch())
+        return self._totals[slot]
+
+    def scores(self) -> Dict[str, float]:
+        """Window sums of every player with points in the window."""
+        epoch = self._epoch()
+        expire = self._expire
+        totals = self._totals
+        result = {}
+        for player_id, slot in self._slots.items():
+            expire(slot, epoch)
+            if totals[slot]:
+                result[player_id] = totals[slot]
+        return result
+
+    def top(self, k: int = 10) -> List[Tuple[str, float]]:
+        """The ``k`` players who earned the most points within the window, as ``(player_id, points)``."""
+        return heapq.nlargest(k, self.scores().items(), key=lambda item: item[1])
+
+    def compact(self) -> int:
+        """Frees the slots of players with no points left in the window and returns how many."""
+        epoch = self._epoch()
+        buckets = self.buckets
+        counts = self._counts
+        idle = []
+        for player_id, slot in self._slots.items():
+            self._expire(slot, epoch)
+            if not any(counts[slot * buckets:(slot + 1) * buckets]):
+                idle.append(player_id)
+        for player_id in idle:
+            self.discard(player_id)
+        return len(idle)
@@ -6,5 +6,6 @@ This package contains the central functionality of the scoring system.
 
 from pyscored.core.scoring_engine import ScoringEngine
 from pyscored.core.sandbox import Sandbox
+from pyscored.core.namespaces import NamespacedEngine
 
-__all__ = ["ScoringEngine", "Sandbox"]
\ No newline at end of file
+__all__ = ["ScoringEngine", "Sandbox", "NamespacedEngine"]
\ No newline at end of file
@@ -0,0 +1,135 @@
+# pyscored/core/admission.py
+
+import sys
+import time
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T", bound=Sequence)
+
+
+class RateLimitExceeded(Exception):
+    """Raised when an event is rejected by admission control."""
+
+    def __init__(self, player_id: str, retry_after: float):
+        super().__init__(f"Rate limit exceeded for player '{player_id}'; retry in {retry_after:.3f}s.")
+        self.player_id = player_id
+        self.retry_after = retry_after
+
+
+class AdmissionControl:
+    """Per-player token buckets that admit or reject score events before they reach the engine.
+
+    Each player may spend ``burst`` events at once and regains ``rate`` events per
+    second. Buckets live in two flat ``array('d')`` columns (tokens and last refill
+    time) indexed by a slot per interned player id, and are refilled lazily when the
+    player is checked, so idle players cost nothing. ``admit_batch`` checks many
+    events against one clock reading and returns a mask of admitted events.
+    """
+
+    def __init__(self, rate: float, burst: float, clock: Callable[[], float] = time.monotonic):
+        if rate < 0 or burst <= 0:
+            raise ValueError("rate must be >= 0 and burst must be > 0.")
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._clock = clock
+        self._slots: Dict[str, int] = {}
+        self._tokens = array("d")
+        self._stamps = array("d")
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _slot(self, player_id: str, now: float) -> int:
+        slot = self._slots[sys.intern(player_id)] = len(self._tokens)
+        self._tokens.append(self.burst)
+        self._stamps.append(now)
+        return slot
+
+    def admit(self, player_id: str, cost: float = 1.0) -> bool:
+        """Takes ``cost`` tokens from the player's bucket; returns False if there are not enough."""
+        now = self._clock()
+        slot = self._slots.get(player_id)
+        if slot is None:
+            slot = self._slot(player_id, now)
+        stamps, tokens = self._stamps, self._tokens
+        available = tokens[slot] + (now - stamps[slot]) * self.rate
+        if available > self.burst:
+            available = self.burst
+        stamps[slot] = now
+        if available < cost:
+            tokens[slot] = available
+            return False
+        tokens[slot] = available - cost
+        return True
+
+    def admit_batch(self, player_ids: Iterable[str], cost: float = 1.0) -> List[bool]:
+        """Checks a batch of events in order and returns a mask of the admitted ones.
+
+        Events for the same player draw from its bucket one after another, so a batch
+        cannot exceed the burst.
+        """
+        now = self._clock()
+        slots, tokens, stamps = self._slots, self._tokens, self._stamps
+        rate, burst = self.rate, self.burst
+        mask: List[bool] = []
+        append = mask.append
+        for player_id in player_ids:
+            slot = slots.get(player_id)
+            if slot is None:
+                slot = self._slot(player_id, now)
+            available = tokens[slot] + (now - stamps[slot]) * rate
+            if available > burst:
+                available = burst
+            stamps[slot] = now
+            if available < cost:
+                tokens[slot] = available
+                append(False)
+            else:
+                tokens[slot] = available - cost
+                append(True)
+        return mask
+
+    def partition(self, updates: Iterable[T], cost: float = 1.0) -> Tuple[List[T], List[T]]:
+        """Splits ``(player_id, ...)`` updates into admitted and rejected lists, keeping their order."""
+        updates = list(updates)
+        admitted: List[T] = []
+        rejected: List[T] = []
+        for update, ok in zip(updates, self.admit_batch([update[0] for update in updates], cost)):
+            (admitted if ok else rejected).append(update)
+        return admitted, rejected
+
+    def retry_after(self, player_id: str, cost: float = 1.0) -> float:
+        """Seconds until the player's bucket holds ``cost`` tokens."""
+        slot = self._slots.get(player_id)
+        if slot is None:
+            return 0.0
+        available = min(self.burst, self._tokens[slot] + (self._clock() - self._stamps[slot]) * self.rate)
+        if available >= cost:
+            return 0.0
+        return float("inf") if self.rate == 0 else (cost - available) / self.rate
+
+    def check(self, player_id: str, cost: float = 1.0) -> None:
+        """Like ``admit``, but raises RateLimitExceeded when the event is rejected."""
+        if not self.admit(player_id, cost):
+            raise RateLimitExceeded(player_id, self.retry_after(player_id, cost))
+
+    def compact(self, now: Optional[float] = None) -> int:
+        """Forgets players whose buckets have refilled completely and returns how many were dropped.
+
+        A full bucket behaves exactly like a new one, so this only reclaims memory.
+        """
+        if now is None:
+            now = self._clock()
+        rate, burst = self.rate, self.burst
+        tokens, stamps = self._tokens, self._stamps
+        slots: Dict[str, int] = {}
+        kept_tokens, kept_stamps = array("d"), array("d")
+        for player_id, slot in self._slots.items():
+            if tokens[slot] + (now - stamps[slot]) * rate < burst:
+                slots[player_id] = len(kept_tokens)
+                kept_tokens.append(tokens[slot])
+                kept_stamps.append(stamps[slot])
+        dropped = len(self._slots) - len(slots)
+        self._slots, self._tokens, self._stamps = slots, kept_tokens, kept_stamps
+        return dropped
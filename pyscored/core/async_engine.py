@@ -0,0 +1,149 @@
+# pyscored/core/async_engine.py
+
+import asyncio
+from collections import deque
+from typing import Any, Callable, Deque, Hashable, Iterable, List, Optional, Tuple
+
+from pyscored.core.scoring_engine import ScoringEngine
+from pyscored.core.snapshot import ScoreSnapshot
+
+# (method, args, kwargs, future)
+_Request = Tuple[Callable[..., Any], tuple, dict, "asyncio.Future[Any]"]
+
+
+class AsyncScoringEngine:
+    """Event-loop front end that owns a ScoringEngine through a single writer task.
+
+    Mutations are queued and applied by one actor coroutine, so engine state is only
+    ever touched from that task and needs no locks. The actor drains up to
+    ``max_batch`` queued requests per loop iteration and then resolves the callers'
+    futures, so a caller that awaited a write reads it back. Reads (``get_score``,
+    ``snapshot``) are plain methods that never wait for the queue; since they run on
+    the same loop they only ever see the engine between batches. ``snapshot`` is taken
+    on the first call after a batch changed the engine and reused until the next one,
+    so writers only pay for copy-on-write when somebody actually reads a snapshot.
+
+    Use it as ``async with AsyncScoringEngine(engine) as scores:`` or call ``start``
+    and ``close`` from a running loop. Do not call the wrapped engine's mutating
+    methods directly while the actor is running.
+    """
+
+    def __init__(self, engine: Optional[ScoringEngine] = None, max_batch: int = 1024):
+        self.engine = engine if engine is not None else ScoringEngine()
+        self.max_batch = max_batch
+        self._queue: Deque[_Request] = deque()
+        self._wakeup: Optional["asyncio.Future[None]"] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._snapshot: Optional[ScoreSnapshot] = None
+        self._closing = False
+        self.batches = 0
+
+    async def __aenter__(self) -> "AsyncScoringEngine":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        """Starts the actor task on the running event loop."""
+        if self._task is None:
+            self._closing = False
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        """Applies the requests already queued, then stops the actor."""
+        if self._task is None:
+            return
+        self._closing = True
+        self._wake()
+        await self._task
+        self._task = None
+
+    def _wake(self) -> None:
+        wakeup = self._wakeup
+        if wakeup is not None and not wakeup.done():
+            wakeup.set_result(None)
+
+    async def _run(self) -> None:
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            if not queue:
+                if self._closing:
+                    return
+                self._wakeup = loop.create_future()
+                await self._wakeup
+                continue
+            results: List[Tuple["asyncio.Future[Any]", Any, Optional[BaseException]]] = []
+            for _ in range(min(len(queue), self.max_batch)):
+                method, args, kwargs, future = queue.popleft()
+                if future.cancelled():
+                    continue
+                try:
+                    results.append((future, method(*args, **kwargs), None))
+                except Exception as e:
+                    results.append((future, None, e))
+            self._snapshot = None
+            self.batches += 1
+            for future, result, error in results:
+                if future.cancelled():
+                    continue
+                if error is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(error)
+            # Let the callers that were just resolved run and queue more work.
+            await asyncio.sleep(0)
+
+    def _submit(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> "asyncio.Future[Any]":
+        if self._task is None or self._closing:
+            raise RuntimeError("The async engine is not running.")
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((method, args, kwargs, future))
+        self._wake()
+        return future
+
+    @property
+    def pending(self) -> int:
+        """Number of queued requests."""
+        return len(self._queue)
+
+    def snapshot(self) -> ScoreSnapshot:
+        """A snapshot as of the last applied batch (raw scores in fixed-point mode)."""
+        if self._snapshot is None:
+            self._snapshot = self.engine.snapshot()
+        return self._snapshot
+
+    def get_score(self, player_id: str) -> float:
+        """A player's score as of the last applied batch."""
+        return self.engine.get_score(player_id)
+
+    async def initialize_score(self, player_id: str, initial_score: float = 0.0) -> None:
+        """Initializes or resets a player's score."""
+        await self._submit(self.engine.initialize_score, player_id, initial_score)
+
+    async def update_score(self, player_id: str, points: float, event_id: Optional[Hashable] = None) -> bool:
+        """Adds points to a player; returns False if the event id was a duplicate."""
+        return await self._submit(self.engine.update_score, player_id, points, event_id)
+
+    async def update_scores(self, updates: Iterable[Tuple[Any, ...]]) -> int:
+        """Applies a batch of updates atomically and returns how many were applied."""
+        # Materialize now; the caller may reuse or mutate the iterable while the request is queued.
+        return await self._submit(self.engine.update_scores, list(updates))
+
+    async def reset_score(self, player_id: str) -> None:
+        """Resets a player's score to zero."""
+        await self._submit(self.engine.reset_score, player_id)
+
+    async def apply_rule(self, rule_name: str, **kwargs: Any) -> Any:
+        """Applies a sandbox rule on the actor."""
+        return await self._submit(self.engine.apply_rule, rule_name, **kwargs)
+
+    async def execute_plugin(self, plugin_name: str, **kwargs: Any) -> Any:
+        """Executes a plugin on the actor."""
+        return await self._submit(self.engine.execute_plugin, plugin_name, **kwargs)
+
+    async def call(self, function: Callable[[ScoringEngine], Any]) -> Any:
+        """Runs ``function(engine)`` on the actor, e.g. to group several updates in a transaction."""
+        return await self._submit(function, self.engine)
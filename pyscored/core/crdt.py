@@ -0,0 +1,217 @@
+# pyscored/core/crdt.py
+
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+Score = Union[int, float]
+# (timestamp, node_id, base, {node_id: (increments, decrements)}); base None marks a removed player.
+PlayerState = Tuple[int, str, Optional[Score], Dict[str, Tuple[Score, Score]]]
+
+_UNSET = object()
+
+
+class CRDTScores:
+    """Mergeable per-player scores for engines that accept writes on several nodes.
+
+    Each player's score is a last-writer-wins base value plus a PN-counter: every
+    node only grows its own ``(increments, decrements)`` pair, so concurrent updates
+    from different nodes add up after merging. Assignments (initialize, reset,
+    removal) start a new epoch identified by a hybrid logical timestamp and the
+    node id; the latest epoch wins and discards counter updates made in older
+    epochs. Merging is commutative, associative and idempotent, so nodes converge
+    whatever order deltas arrive in.
+
+    ``delta(since)`` returns only the players changed after a version, so peers can
+    exchange changed entries instead of full states. With an engine attached, local
+    score changes are recorded through the listener hook and merged changes are
+    written back with ``apply_changes``. Use fixed-point scoring to make merged
+    totals exact on every node; float totals may differ in the last bits from a
+    node's own running sum until a merge touches the player.
+    """
+
+    def __init__(self, node_id: str, engine: Any = None, clock: Callable[[], int] = time.time_ns):
+        self.node_id = node_id
+        self.engine = engine
+        self._clock = clock
+        self._last_timestamp = 0
+        self._states: Dict[str, PlayerState] = {}
+        # Players in the order they last changed, with the version of that change.
+        self._versions: Dict[str, int] = {}
+        self._version = 0
+        # Scores written to the engine by merges whose listener notification has not arrived
+        # yet; inside an engine transaction it only arrives after the outermost commit.
+        self._merged: Dict[str, Optional[Score]] = {}
+        if engine is not None:
+            self._fixed_point = engine.fixed_point
+            for player_id, score in engine.snapshot().items():
+                # Seeded epochs predate every real write, so any assignment overrides them.
+                self._set(player_id, (0, node_id, score, {}))
+            engine.add_listener(self.observe)
+        else:
+            self._fixed_point = None
+
+    @property
+    def version(self) -> int:
+        """Version of the latest change; pass it to ``delta`` to get later changes only."""
+        return self._version
+
+    def __len__(self) -> int:
+        return sum(1 for state in self._states.values() if state[2] is not None)
+
+    def __contains__(self, player_id: object) -> bool:
+        state = self._states.get(player_id)  # type: ignore[call-overload]
+        return state is not None and state[2] is not None
+
+    def _tick(self) -> int:
+        timestamp = max(self._clock(), self._last_timestamp + 1)
+        self._last_timestamp = timestamp
+        return timestamp
+
+    def _set(self, player_id: str, state: PlayerState) -> None:
+        self._states[player_id] = state
+        self._version += 1
+        versions = self._versions
+        versions.pop(player_id, None)
+        versions[player_id] = self._version
+
+    @staticmethod
+    def _value(state: PlayerState) -> Optional[Score]:
+        base = state[2]
+        if base is None:
+            return None
+        counts = state[3]
+        if not counts:
+            return base
+        # Sum in node order so every node computes exactly the same float.
+        return base + sum(p - n for _, (p, n) in sorted(counts.items()))
+
+    def value(self, player_id: str) -> Optional[Score]:
+        """Returns a player's merged score (raw in fixed-point mode), or None if absent or removed."""
+        state = self._states.get(player_id)
+        return None if state is None else self._value(state)
+
+    def items(self) -> Iterator[Tuple[str, Score]]:
+        """Yields ``(player_id, score)`` for every present player."""
+        for player_id, state in self._states.items():
+            score = self._value(state)
+            if score is not None:
+                yield player_id, score
+
+    def increment(self, player_id: str, points: Score) -> None:
+        """Adds points to a player in this node's counter."""
+        state = self._states.get(player_id)
+        if state is None or state[2] is None:
+            raise ValueError(f"Player {player_id} does not exist.")
+        timestamp, node_id, base, counts = state
+        p, n = counts.get(self.node_id, (0, 0))
+        counts = dict(counts)
+        counts[self.node_id] = (p + points, n) if points >= 0 else (p, n - points)
+        self._set(player_id, (timestamp, node_id, base, counts))
+
+    def assign(self, player_id: str, score: Optional[Score]) -> None:
+        """Sets a player's score, or removes the player with None, starting a new epoch."""
+        self._set(player_id, (self._tick(), self.node_id, score, {}))
+
+    def observe(self, player_id: str, old: Optional[float], new: Optional[float], points: Optional[float]) -> None:
+        """Engine listener recording local score changes."""
+        to_fixed = self._fixed_point.to_fixed if self._fixed_point is not None else None
+        if self._merged:
+            # A tag is consumed by the player's next change, so one left behind by a
+            # rolled-back transaction cannot outlive it.
+            merged = self._merged.pop(player_id, _UNSET)
+            if merged is not _UNSET and points is None and merged == (
+                    to_fixed(new) if to_fixed and new is not None else new):
+                return
+        if points is not None and player_id in self:
+            self.increment(player_id, to_fixed(points) if to_fixed else points)
+        else:
+            self.assign(player_id, to_fixed(new) if to_fixed and new is not None else new)
+
+    def delta(self, since: int = 0) -> Tuple[Dict[str, PlayerState], int]:
+        """Returns the states of players changed after version ``since`` and the current version.
+
+        A peer merges the states and remembers the version for its next pull; ``since=0``
+        returns the full state.
+        """
+        states = self._states
+        changed: Dict[str, PlayerState] = {}
+        versions = self._versions
+        for player_id in reversed(versions):  # type: ignore[call-overload]
+            if versions[player_id] <= since:
+                break
+            changed[player_id] = states[player_id]
+        return changed, self._version
+
+    def merge(self, delta: Mapping[str, PlayerState]) -> Dict[str, Optional[Score]]:
+        """Joins states from another node and returns the players whose score changed.
+
+        The result maps player ids to their new scores, with None for removed players.
+        With an engine attached, the changes are applied to it in one transaction.
+        """
+        states = self._states
+        changed: Dict[str, Optional[Score]] = {}
+        latest = self._last_timestamp
+        for player_id, remote in delta.items():
+            local = states.get(player_id)
+            if local is None:
+                merged = remote
+            elif (remote[0], remote[1]) > (local[0], local[1]):
+                merged = remote
+            elif (remote[0], remote[1]) < (local[0], local[1]):
+                continue
+            else:
+                counts = local[3]
+                merged_counts = None
+                for node_id, (p, n) in remote[3].items():
+                    current = counts.get(node_id)
+                    if current is None or p > current[0] or n > current[1]:
+                        if merged_counts is None:
+                            merged_counts = dict(counts)
+                        merged_counts[node_id] = (p, n) if current is None else (
+                            max(p, current[0]), max(n, current[1]))
+                if merged_counts is None:
+                    continue
+                merged = (local[0], local[1], local[2], merged_counts)
+            if remote[0] > latest:
+                latest = remote[0]
+            before = None if local is None else self._value(local)
+            self._set(player_id, merged)
+            after = self._value(merged)
+            if after != before:
+                changed[player_id] = after
+        # Keep the local clock ahead of every epoch seen, so local resets win over them.
+        self._last_timestamp = latest
+        if self.engine is not None and changed:
+            self._apply(changed)
+        return changed
+
+    def _apply(self, changed: Dict[str, Optional[Score]]) -> None:
+        removed: List[str] = [player_id for player_id, score in changed.items() if score is None]
+        values = {player_id: score for player_id, score in changed.items() if score is not None}
+        engine = self.engine
+        merged = self._merged
+        merged.update(values)
+        # The engine only reports removals of players it has.
+        scores = engine._scores
+        merged.update((player_id, None) for player_id in removed if player_id in scores)
+        try:
+            engine.apply_changes(values, removed)
+        finally:
+            if engine._transaction is None:
+                # Delivered already (or never, after an error): nothing is left to recognize.
+                for player_id in changed:
+                    merged.pop(player_id, None)
+
+    def merge_from(self, other: "CRDTScores", since: int = 0) -> int:
+        """Merges another node's changes after version ``since`` and returns its current version."""
+        delta, version = other.delta(since)
+        self.merge(delta)
+        return version
+
+    def compact(self, player_ids: Iterable[str]) -> None:
+        """Forgets removed players, once every node has merged their removal."""
+        for player_id in player_ids:
+            state = self._states.get(player_id)
+            if state is not None and state[2] is None:
+                del self._states[player_id]
+                self._versions.pop(player_id, None)
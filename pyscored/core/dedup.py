@@ -0,0 +1,113 @@
+# pyscored/core/dedup.py
+
+import math
+import time
+from typing import Callable, Dict, Hashable, List, Tuple
+
+_MASK64 = (1 << 64) - 1
+# Odd 64-bit constant used to spread an event hash over the bits of a block.
+_MIX = 0x9E3779B97F4A7C15
+_BLOCK_BITS = 512
+_PROBES = 6
+_BITS = [1 << i for i in range(_BLOCK_BITS)]
+
+
+class EventDeduplicator:
+    """Memory-bounded, time-bucketed set of recently seen event ids.
+
+    Events from the last ``recent`` seconds are remembered exactly. Older events are
+    remembered for at least ``window`` seconds in rotating Bloom filters that each
+    cover ``window / generations`` seconds, so memory stays proportional to the event
+    rate rather than growing forever. Each filter is blocked: an id sets six bits inside a single 512-bit block, so a
+    check hashes the id once and stops at the first unset bit of each generation.
+
+    A Bloom filter can report an unseen id as seen with probability of about
+    ``false_positive_rate``, and the genuine event is then dropped. Size
+    ``expected_events`` for the number of events per ``window``.
+    """
+
+    def __init__(self, window: float = 3600.0, generations: int = 4, expected_events: int = 1_000_000,
+                 false_positive_rate: float = 1e-4, recent: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic):
+        if generations < 1:
+            raise ValueError("At least one generation is required.")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("The false positive rate must be between 0 and 1.")
+        self.window = window
+        self.generations = generations
+        self.recent = recent
+        self._clock = clock
+        # The filter being filled plus ``generations`` full ones are checked, and each
+        # gets an equal share of the error budget. Confining an id to one block roughly
+        # doubles a filter's false positive rate at this load, so aim at half.
+        rate = false_positive_rate / (2 * (generations + 1))
+        bits_per_event = -_PROBES / math.log(1 - rate ** (1 / _PROBES))
+        per_generation = max(1, math.ceil(expected_events / generations))
+        self._blocks = max(1, math.ceil(per_generation * bits_per_event / _BLOCK_BITS))
+        self._filters: List[List[int]] = [[0] * self._blocks]
+        self._exact: Dict[Hashable, None] = {}
+        self._previous_exact: Dict[Hashable, None] = {}
+        now = clock()
+        self._rotate_filters_at = now + window / generations
+        self._rotate_exact_at = now + recent
+
+    def __len__(self) -> int:
+        """Number of ids in the exact window."""
+        return len(self._exact) + len(self._previous_exact)
+
+    def _rotate(self, now: float) -> None:
+        while now >= self._rotate_exact_at:
+            self._previous_exact, self._exact = self._exact, {}
+            self._rotate_exact_at += self.recent
+        while now >= self._rotate_filters_at:
+            self._filters.insert(0, [0] * self._blocks)
+            del self._filters[self.generations + 1:]
+            self._rotate_filters_at += self.window / self.generations
+
+    def _find(self, event_id: Hashable) -> Tuple[bool, int, int]:
+        """Returns whether the id was seen, with its block index and probe bits."""
+        now = self._clock()
+        if now >= self._rotate_exact_at or now >= self._rotate_filters_at:
+            self._rotate(now)
+        if event_id in self._exact or event_id in self._previous_exact:
+            return True, 0, 0
+        h = hash(event_id) & _MASK64
+        x = (h * _MIX) & _MASK64
+        block = h % self._blocks
+        for blocks in self._filters:
+            w = blocks[block]
+            if (w and (w >> (x & 511)) & 1 and (w >> ((x >> 9) & 511)) & 1 and (w >> ((x >> 18) & 511)) & 1
+                    and (w >> ((x >> 27) & 511)) & 1 and (w >> ((x >> 36) & 511)) & 1
+                    and (w >> ((x >> 45) & 511)) & 1):
+                return True, block, x
+        return False, block, x
+
+    def _insert(self, event_id: Hashable, block: int, x: int) -> None:
+        self._exact[event_id] = None
+        bits = _BITS
+        self._filters[0][block] |= (bits[x & 511] | bits[(x >> 9) & 511] | bits[(x >> 18) & 511]
+                                    | bits[(x >> 27) & 511] | bits[(x >> 36) & 511] | bits[(x >> 45) & 511])
+
+    def __contains__(self, event_id: Hashable) -> bool:
+        return self._find(event_id)[0]
+
+    def add(self, event_id: Hashable) -> None:
+        """Remembers an event id."""
+        now = self._clock()
+        if now >= self._rotate_exact_at or now >= self._rotate_filters_at:
+            self._rotate(now)
+        h = hash(event_id) & _MASK64
+        self._insert(event_id, h % self._blocks, (h * _MIX) & _MASK64)
+
+    def seen(self, event_id: Hashable) -> bool:
+        """Returns True if the id was seen before; otherwise remembers it and returns False."""
+        found, block, x = self._find(event_id)
+        if not found:
+            self._insert(event_id, block, x)
+        return found
+
+    def clear(self) -> None:
+        """Forgets every event id."""
+        self._filters = [[0] * self._blocks]
+        self._exact = {}
+        self._previous_exact = {}
@@ -0,0 +1,225 @@
+# pyscored/core/feed.py
+
+import asyncio
+import heapq
+import threading
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+LeaderboardView = List[Tuple[str, float]]
+
+
+class Subscription:
+    """Async iterator over coalesced score changes for one subscriber.
+
+    Player subscriptions yield dicts of changed players to their new scores (None
+    when a player was removed); leaderboard subscriptions yield the full top-k view
+    as ``(player_id, score)`` pairs whenever it changes. If the consumer falls behind,
+    pending updates are conflated into one; with ``on_lag="drop"`` a subscriber that
+    is more than ``max_lag`` ticks behind is closed instead.
+    """
+
+    def __init__(self, feed: "ChangeFeed", key: Any, on_lag: str = "conflate", max_lag: int = 8):
+        if on_lag not in ("conflate", "drop"):
+            raise ValueError("on_lag must be 'conflate' or 'drop'.")
+        self._feed = feed
+        self.key = key
+        self.on_lag = on_lag
+        self.max_lag = max_lag
+        self.lag = 0
+        self.closed = False
+        self.dropped = False
+        self._pending: Any = None
+        self._ready = asyncio.Event()
+
+    def _deliver(self, payload: Any) -> None:
+        if self.closed:
+            return
+        if self._pending is None:
+            self._pending = payload
+        else:
+            self.lag += 1
+            if self.on_lag == "drop" and self.lag > self.max_lag:
+                self.dropped = True
+                self.close()
+                return
+            if isinstance(payload, dict):
+                # Payloads are shared between subscribers, so merge into a new dict.
+                merged = dict(self._pending)
+                merged.update(payload)
+                self._pending = merged
+            else:
+                self._pending = payload
+        self._ready.set()
+
+    def close(self) -> None:
+        """Stops the subscription; iteration ends once pending changes are consumed."""
+        if not self.closed:
+            self.closed = True
+            self._feed._unsubscribe(self)
+            self._ready.set()
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> Any:
+        while self._pending is None:
+            if self.closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        if self.dropped:
+            raise StopAsyncIteration
+        payload, self._pending = self._pending, None
+        self.lag = 0
+        return payload
+
+
+class ChangeFeed:
+    """Coalesces engine score changes per tick and fans them out to subscriptions.
+
+    Changes are collected from the engine's listener hook and processed at most once
+    per ``interval`` seconds. Subscriptions with the same player set or the same
+    leaderboard size share one computed payload per tick. Once the event loop the
+    subscriptions were made on is closed, they are closed as well and the engine's
+    writes no longer reach the feed's loop.
+    """
+
+    def __init__(self, engine: Any, interval: float = 0.05):
+        self.engine = engine
+        self.interval = interval
+        self._dirty: Dict[str, Optional[float]] = {}
+        # Guards the dirty set and the scheduled flag against writes from other threads.
+        self._lock = threading.Lock()
+        self._player_groups: Dict[Optional[FrozenSet[str]], List[Subscription]] = {}
+        self._player_index: Dict[str, Set[FrozenSet[str]]] = {}
+        self._leaderboards: Dict[int, List[Subscription]] = {}
+        self._views: Dict[int, LeaderboardView] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._scheduled = False
+        engine.add_listener(self._observe)
+
+    def __len__(self) -> int:
+        return sum(map(len, self._player_groups.values())) + sum(map(len, self._leaderboards.values()))
+
+    def subscribe(self, players: Optional[Iterable[str]] = None, top_k: Optional[int] = None,
+                  on_lag: str = "conflate", max_lag: int = 8) -> Subscription:
+        """Subscribes to a set of players (all players when None) or to a top-k leaderboard view."""
+        self._loop = asyncio.get_running_loop()
+        if top_k is not None:
+            if players is not None:
+                raise ValueError("Subscribe to either a player set or a leaderboard, not both.")
+            subscription = Subscription(self, top_k, on_lag, max_lag)
+            if top_k not in self._leaderboards:
+                self._views[top_k] = self._leaderboard(top_k)
+            self._leaderboards.setdefault(top_k, []).append(subscription)
+            # New leaderboard subscribers start from the current view.
+            subscription._deliver(self._views[top_k])
+            return subscription
+        key = frozenset(players) if players is not None else None
+        subscription = Subscription(self, key, on_lag, max_lag)
+        if key not in self._player_groups and key is not None:
+            for player_id in key:
+                self._player_index.setdefault(player_id, set()).add(key)
+        self._player_groups.setdefault(key, []).append(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        groups: Dict[Any, List[Subscription]] = (
+            self._leaderboards if isinstance(subscription.key, int) else self._player_groups)
+        members = groups.get(subscription.key)
+        if not members or subscription not in members:
+            return
+        members.remove(subscription)
+        if members:
+            return
+        del groups[subscription.key]
+        if groups is self._leaderboards:
+            del self._views[subscription.key]
+        elif subscription.key is not None:
+            for player_id in subscription.key:
+                keys = self._player_index[player_id]
+                keys.discard(subscription.key)
+                if not keys:
+                    del self._player_index[player_id]
+
+    def _observe(self, player_id: str, old: Optional[float], new: Optional[float], points: Optional[float]) -> None:
+        if not (self._player_groups or self._leaderboards):
+            return
+        with self._lock:
+            self._dirty[player_id] = new
+            loop = self._loop
+            # A tick still scheduled on a closed loop will never run.
+            if loop is None or (self._scheduled and not loop.is_closed()):
+                return
+            self._scheduled = True
+        try:
+            # Engine writes may come from other threads, so hop onto the loop first.
+            loop.call_soon_threadsafe(loop.call_later, self.interval, self.tick)
+        except RuntimeError:
+            if not loop.is_closed():
+                raise
+            self._detach(loop)
+
+    def _detach(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Closes the subscriptions of an event loop that has been closed and forgets the loop."""
+        with self._lock:
+            if self._loop is not loop:
+                return
+            self._loop = None
+            self._scheduled = False
+            self._dirty = {}
+        # Nothing can await these subscriptions any more, so they are closed without waking anyone.
+        for groups in (self._player_groups, self._leaderboards):
+            for subscriptions in groups.values():
+                for subscription in subscriptions:
+                    subscription.closed = True
+        self._player_groups.clear()
+        self._player_index.clear()
+        self._leaderboards.clear()
+        self._views.clear()
+
+    def tick(self) -> None:
+        """Publishes the changes collected since the previous tick."""
+        with self._lock:
+            self._scheduled = False
+            dirty, self._dirty = self._dirty, {}
+        if not dirty:
+            return
+        everyone = self._player_groups.get(None)
+        if everyone:
+            for subscription in list(everyone):
+                subscription._deliver(dirty)
+        payloads: Dict[FrozenSet[str], Dict[str, Optional[float]]] = {}
+        for player_id, score in dirty.items():
+            for key in self._player_index.get(player_id, ()):
+                payloads.setdefault(key, {})[player_id] = score
+        for key, payload in payloads.items():
+            for subscription in list(self._player_groups.get(key, ())):
+                subscription._deliver(payload)
+        for top_k, subscriptions in list(self._leaderboards.items()):
+            view = self._update_view(top_k, dirty)
+            if view != self._views[top_k]:
+                self._views[top_k] = view
+                for subscription in list(subscriptions):
+                    subscription._deliver(view)
+
+    def _leaderboard(self, top_k: int) -> LeaderboardView:
+        engine = self.engine
+        fixed_point = engine.fixed_point
+        items = engine.snapshot().items()
+        top = heapq.nlargest(top_k, items, key=lambda item: item[1])
+        if fixed_point is not None:
+            return [(player_id, fixed_point.to_float(score)) for player_id, score in top]
+        return list(top)
+
+    def _update_view(self, top_k: int, dirty: Dict[str, Optional[float]]) -> LeaderboardView:
+        view = self._views[top_k]
+        candidates = dict(view)
+        for player_id, score in view:
+            if player_id in dirty:
+                new = dirty[player_id]
+                if new is None or new < score:
+                    # A member fell back, so someone outside the view may overtake it.
+                    return self._leaderboard(top_k)
+        candidates.update((player_id, score) for player_id, score in dirty.items() if score is not None)
+        return heapq.nlargest(top_k, candidates.items(), key=lambda item: item[1])
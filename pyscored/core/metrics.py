@@ -0,0 +1,185 @@
+# pyscored/core/metrics.py
+
+from array import array
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from pyscored.utils.sorted_list import SortedList
+
+_MAX_ID = "\U0010ffff"
+
+
+class _Ranking:
+    __slots__ = ("name", "columns", "weights", "metrics", "index")
+
+    def __init__(self, name: str, columns: List[Tuple[array, float]], weights: bool, metrics: frozenset):
+        self.name = name
+        # (column, sign or weight) pairs; a larger key ranks higher.
+        self.columns = columns
+        self.weights = weights
+        self.metrics = metrics
+        # (key, player_id) in ascending order.
+        self.index = SortedList()
+
+    def key(self, slot: int) -> Any:
+        if self.weights:
+            return sum(column[slot] * weight for column, weight in self.columns)
+        return tuple(column[slot] * sign for column, sign in self.columns)
+
+
+class MetricTable:
+    """Per-player records of several metrics (points, kills, time survived...) stored as columns.
+
+    Every metric is one ``array('d')`` indexed by the player's slot, so a record costs
+    eight bytes per metric and a metric can be scanned without touching the others.
+    ``update`` adds to several metrics of a player in one call.
+
+    Rankings order players on a composite key, either lexicographic over several
+    metrics (``add_ranking("ladder", ["points", "-deaths"])``, where ``-`` ranks lower
+    values higher) or a weighted sum (``add_ranking("mvp", weights={"kills": 2,
+    "assists": 1})``). Each ranking keeps its players in a ``SortedList`` that is
+    updated only when a metric it uses changes, in O(log players) per ranking, so
+    ``top`` and ``rank`` never sort the table.
+
+    The table is standalone: it is not part of engine transactions, snapshots or
+    score listeners, and a rolled-back transaction does not undo metric updates.
+    """
+
+    def __init__(self, metrics: Sequence[str]):
+        if not metrics:
+            raise ValueError("At least one metric is required.")
+        if len(set(metrics)) != len(metrics):
+            raise ValueError("Metric names must be unique.")
+        self.metrics: Tuple[str, ...] = tuple(metrics)
+        self._columns: Dict[str, array] = {metric: array("d") for metric in metrics}
+        self._slots: Dict[str, int] = {}
+        self._players: List[str] = []
+        self._rankings: Dict[str, _Ranking] = {}
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self._slots
+
+    def _column(self, metric: str) -> array:
+        column = self._columns.get(metric)
+        if column is None:
+            raise KeyError(f"Unknown metric '{metric}'.")
+        return column
+
+    def column(self, metric: str) -> array:
+        """A copy of one metric's values in slot order (see ``players``)."""
+        return array("d", self._column(metric))
+
+    @property
+    def players(self) -> List[str]:
+        """Player ids in slot order."""
+        return list(self._players)
+
+    def _slot(self, player_id: str) -> int:
+        slot = self._slots.get(player_id)
+        if slot is None:
+            slot = self._slots[player_id] = len(self._players)
+            self._players.append(player_id)
+            for column in self._columns.values():
+                column.append(0.0)
+            for ranking in self._rankings.values():
+                ranking.index.add((ranking.key(slot), player_id))
+        return slot
+
+    def _write(self, player_id: str, values: Mapping[str, float], add: bool) -> None:
+        columns = [(self._column(metric), value) for metric, value in values.items()]
+        slot = self._slot(player_id)
+        touched = [ranking for ranking in self._rankings.values() if not ranking.metrics.isdisjoint(values)]
+        for ranking in touched:
+            ranking.index.remove((ranking.key(slot), player_id))
+        for column, value in columns:
+            column[slot] = column[slot] + value if add else value
+        for ranking in touched:
+            ranking.index.add((ranking.key(slot), player_id))
+
+    def update(self, player_id: str, **deltas: float) -> None:
+        """Adds to several metrics of a player at once, creating the record (all zeros) if needed."""
+        self._write(player_id, deltas, add=True)
+
+    def set(self, player_id: str, **values: float) -> None:
+        """Assigns several metrics of a player at once."""
+        self._write(player_id, values, add=False)
+
+    def update_many(self, updates: Iterable[Tuple[str, Mapping[str, float]]]) -> None:
+        """Applies ``(player_id, deltas)`` pairs, e.g. the results of one match."""
+        for player_id, deltas in updates:
+            self._write(player_id, deltas, add=True)
+
+    def get(self, player_id: str) -> Dict[str, float]:
+        """All metrics of a player (zeros for unknown players)."""
+        slot = self._slots.get(player_id)
+        if slot is None:
+            return {metric: 0.0 for metric in self.metrics}
+        return {metric: column[slot] for metric, column in self._columns.items()}
+
+    def value(self, player_id: str, metric: str) -> float:
+        """One metric of a player."""
+        column = self._column(metric)
+        slot = self._slots.get(player_id)
+        return 0.0 if slot is None else column[slot]
+
+    def remove(self, player_id: str) -> None:
+        """Deletes a player's record, moving the last record into its slot to keep the columns dense."""
+        slot = self._slots.pop(player_id)
+        for ranking in self._rankings.values():
+            ranking.index.remove((ranking.key(slot), player_id))
+        last = len(self._players) - 1
+        moved = self._players.pop()
+        for column in self._columns.values():
+            if slot != last:
+                column[slot] = column[last]
+            column.pop()
+        if slot != last:
+            self._players[slot] = moved
+            self._slots[moved] = slot
+
+    def add_ranking(self, name: str, metrics: Sequence[str] = (),
+                    weights: Optional[Mapping[str, float]] = None) -> None:
+        """Maintains a ranking on a lexicographic key over ``metrics`` or on a weighted sum.
+
+        Prefix a metric with ``-`` to rank lower values higher.
+        """
+        if name in self._rankings:
+            raise ValueError(f"Ranking '{name}' already exists.")
+        if (weights is None) == (not metrics):
+            if weights is None:
+                raise ValueError("A ranking needs metrics or weights.")
+            raise ValueError("A ranking takes either metrics or weights, not both.")
+        if weights is not None:
+            columns = [(self._column(metric), float(weight)) for metric, weight in weights.items()]
+            used = frozenset(weights)
+        else:
+            names = [metric[1:] if metric.startswith("-") else metric for metric in metrics]
+            columns = [(self._column(plain), -1.0 if metric.startswith("-") else 1.0)
+                       for metric, plain in zip(metrics, names)]
+            used = frozenset(names)
+        ranking = _Ranking(name, columns, weights is not None, used)
+        ranking.index = SortedList((ranking.key(slot), player_id) for slot, player_id in enumerate(self._players))
+        self._rankings[name] = ranking
+
+    def remove_ranking(self, name: str) -> None:
+        """Stops maintaining a ranking."""
+        del self._rankings[name]
+
+    def _ranking(self, name: str) -> _Ranking:
+        ranking = self._rankings.get(name)
+        if ranking is None:
+            raise KeyError(f"Unknown ranking '{name}'.")
+        return ranking
+
+    def top(self, ranking: str, k: int = 10) -> List[Tuple[str, Dict[str, float]]]:
+        """The ``k`` best players of a ranking with their metrics."""
+        index = self._ranking(ranking).index
+        return [(player_id, self.get(player_id)) for _, player_id in reversed(index.last(k))] if k > 0 else []
+
+    def rank(self, ranking: str, player_id: str) -> int:
+        """1-based position of a player in a ranking; players with equal keys share the better rank."""
+        entry = self._ranking(ranking)
+        key = entry.key(self._slots[player_id])
+        return len(entry.index) - entry.index.bisect_left((key, _MAX_ID)) + 1
@@ -0,0 +1,231 @@
+# pyscored/core/namespaces.py
+
+import json
+import os
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+from urllib.parse import quote, unquote
+
+from pyscored.core.sandbox import Sandbox
+from pyscored.core.scoring_engine import ScoringEngine
+from pyscored.plugins.registry import PluginRegistry, get_registry
+from pyscored.storage.array import ArrayStore
+from pyscored.storage.base import ScoreStore
+from pyscored.storage.memory import InMemoryStore
+from pyscored.utils.fixed_point import FixedPoint
+from pyscored.utils.helpers import load_toml
+
+
+class NamespaceEngine(ScoringEngine):
+    """Scoring engine for a single namespace, sharing rules and plugin definitions with its host."""
+
+    def initialize_score(self, player_id: str, initial_score: float = 0.0) -> None:
+        """Initializes a player's score, interning the id so all namespaces share one copy of it."""
+        super().initialize_score(sys.intern(player_id), initial_score)
+
+
+class Namespace:
+    """Handle to one namespace of a NamespacedEngine.
+
+    Every attribute access resolves the namespace's engine through its host, paging
+    it back in if it was paged out, so a handle kept across evictions never writes
+    to a released engine. Objects obtained from the engine, such as its trigger
+    index, belong to the engine resident at the time.
+    """
+
+    __slots__ = ("name", "_host")
+
+    def __init__(self, host: "NamespacedEngine", name: str):
+        self.name = name
+        self._host = host
+
+    @property
+    def engine(self) -> NamespaceEngine:
+        """The namespace's engine resident right now."""
+        return self._host._engine(self.name)
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._host._engine(self.name), attribute)
+
+    def __repr__(self) -> str:
+        return f"Namespace({self.name!r})"
+
+
+class NamespacedEngine:
+    """Hosts many lightweight score namespaces in one process.
+
+    Every namespace has its own scores and plugin state, while the sandbox rules,
+    declared plugin definitions and interned player ids are shared. Namespaces are
+    materialized on first touch; when ``storage_dir`` is set, the least recently used
+    ones beyond ``max_resident`` are paged out to disk and faulted back in on access.
+    Namespaces are handed out as ``Namespace`` handles, which stay valid across paging.
+    """
+
+    def __init__(self, sandbox: Optional[Sandbox] = None, registry: Optional[PluginRegistry] = None,
+                 storage_dir: Optional[Union[str, Path]] = None, max_resident: int = 1024,
+                 segments: int = 4, fixed_point: Optional[FixedPoint] = None):
+        self._sandbox = sandbox if sandbox else Sandbox()
+        self._registry = registry
+        self._plugin_specs: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self._resident: "OrderedDict[str, NamespaceEngine]" = OrderedDict()
+        self._storage_dir = Path(storage_dir) if storage_dir is not None else None
+        self.max_resident = max_resident
+        self._segments = segments
+        self._fixed_point = fixed_point
+        if self._storage_dir is not None:
+            self._storage_dir.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any], **kwargs: Any) -> "NamespacedEngine":
+        """Creates a namespaced engine whose namespaces all use the configured plugins."""
+        engine = cls(**kwargs)
+        engine.configure_plugins(config.get("plugins", {}))
+        return engine
+
+    @classmethod
+    def from_toml(cls, path: str, **kwargs: Any) -> "NamespacedEngine":
+        """Creates a namespaced engine from a TOML file with a ``[plugins.<name>]`` table per plugin."""
+        return cls.from_config(load_toml(path), **kwargs)
+
+    def configure_rule(self, rule_name: str, rule_logic: Callable[..., Any]) -> None:
+        """Configures a scoring rule shared by every namespace."""
+        self._sandbox.add_rule(rule_name, rule_logic)
+
+    def add_plugin(self, plugin_name: str, plugin_type: Optional[str] = None, **params: Any) -> None:
+        """Declares a plugin available in every namespace; each namespace constructs it on first use."""
+        plugin_type = plugin_type or plugin_name
+        if plugin_type not in (self._registry or get_registry()):
+            raise ValueError(f"Plugin type '{plugin_type}' is not available.")
+        self._plugin_specs[plugin_name] = (plugin_type, params)
+
+    def configure_plugins(self, plugins: Mapping[str, Mapping[str, Any]]) -> None:
+        """Declares several shared plugins from a mapping of names to their ``type`` and parameters."""
+        for plugin_name, spec in plugins.items():
+            params = dict(spec)
+            self.add_plugin(plugin_name, params.pop("type", None), **params)
+
+    def _path(self, name: str) -> Path:
+        assert self._storage_dir is not None
+        return self._storage_dir / f"{quote(name, safe='')}.json"
+
+    def _new_engine(self) -> NamespaceEngine:
+        if self._fixed_point is not None:
+            store: ScoreStore = ArrayStore("q", chunk_size=64, segments=self._segments)
+        else:
+            store = InMemoryStore(self._segments)
+        engine = NamespaceEngine(sandbox=self._sandbox, registry=self._registry, store=store,
+                                 fixed_point=self._fixed_point)
+        # Share the declarations themselves; plugin instances stay per namespace.
+        engine._plugin_specs = self._plugin_specs
+        return engine
+
+    def namespace(self, name: str) -> Namespace:
+        """Returns a handle to a namespace, materializing or paging it in as needed."""
+        self._engine(name)
+        return Namespace(self, name)
+
+    __getitem__ = namespace
+
+    def _engine(self, name: str) -> NamespaceEngine:
+        engine = self._resident.get(name)
+        if engine is not None:
+            self._resident.move_to_end(name)
+            return engine
+        engine = self._new_engine()
+        if self._storage_dir is not None and self._path(name).exists():
+            self._load(engine, self._path(name))
+        self._resident[name] = engine
+        self._evict()
+        return engine
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._resident or (self._storage_dir is not None and self._path(name).exists())
+
+    def resident(self) -> List[str]:
+        """Lists the namespaces currently held in memory, least recently used first."""
+        return list(self._resident)
+
+    def namespaces(self) -> List[str]:
+        """Lists every known namespace, resident or paged out."""
+        names = dict.fromkeys(self._resident)
+        if self._storage_dir is not None:
+            for path in self._storage_dir.glob("*.json"):
+                names.setdefault(unquote(path.stem))
+        return list(names)
+
+    def for_each(self, func: Callable[[str, Namespace], Any], include_cold: bool = False) -> None:
+        """Runs a maintenance callback over resident namespaces, optionally paging in cold ones."""
+        if include_cold:
+            for name in self.namespaces():
+                func(name, self.namespace(name))
+        else:
+            for name in list(self._resident):
+                func(name, Namespace(self, name))
+
+    def items(self) -> Iterator[Tuple[str, Namespace]]:
+        """Iterates over resident namespaces without touching disk."""
+        return iter([(name, Namespace(self, name)) for name in self._resident])
+
+    def drop(self, name: str) -> None:
+        """Deletes a namespace from memory and disk."""
+        self._resident.pop(name, None)
+        if self._storage_dir is not None:
+            try:
+                self._path(name).unlink()
+            except FileNotFoundError:
+                pass
+
+    def page_out(self, name: str) -> bool:
+        """Writes a resident namespace to disk and releases it from memory."""
+        engine = self._resident.get(name)
+        if engine is None or self._storage_dir is None or not self._can_page_out(engine):
+            return False
+        self._dump(engine, self._path(name))
+        del self._resident[name]
+        return True
+
+    def flush(self) -> None:
+        """Writes every resident namespace to disk while keeping it resident."""
+        if self._storage_dir is None:
+            return
+        for name, engine in self._resident.items():
+            if self._can_page_out(engine):
+                self._dump(engine, self._path(name))
+
+    def _evict(self) -> None:
+        if self._storage_dir is None:
+            return
+        for name in list(self._resident)[: max(0, len(self._resident) - self.max_resident)]:
+            self.page_out(name)
+
+    def _can_page_out(self, engine: NamespaceEngine) -> bool:
+        # Plugins registered directly on a namespace cannot be rebuilt from shared
+        # declarations, and open transactions hold uncommitted state.
+        return engine._transaction is None and all(name in self._plugin_specs for name in engine._plugins)
+
+    @staticmethod
+    def _dump(engine: NamespaceEngine, path: Path) -> None:
+        state = {
+            "scores": dict(engine.snapshot().items()),
+            "plugins": {
+                name: {attribute: dict(getattr(plugin, attribute))
+                       for attribute in getattr(type(plugin), "state_attributes", ())}
+                for name, plugin in engine._plugins.items()
+            },
+        }
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(state, separators=(",", ":")))
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _load(engine: NamespaceEngine, path: Path) -> None:
+        state = json.loads(path.read_text())
+        engine._store.update((sys.intern(player_id), score) for player_id, score in state["scores"].items())
+        for name, attributes in state.get("plugins", {}).items():
+            if name not in engine._plugin_specs:
+                continue
+            plugin = engine.get_plugin(name)
+            for attribute, values in attributes.items():
+                setattr(plugin, attribute, {sys.intern(key): value for key, value in values.items()})
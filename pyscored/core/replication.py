@@ -0,0 +1,353 @@
+# pyscored/core/replication.py
+"""
+Leader-follower replication of a ScoringEngine over TCP or Unix sockets.
+
+The leader records every score change in an ordered, bounded log of absolute
+values, each with a sequence number. Followers connect and send a hello
+(``<QQ``: the id of the leader they last synced from, or 0, and the last
+sequence they applied). The leader answers with its own id (``<Q``) and then
+streams wire-format frames:
+
+- If the follower's position is still in the leader's log, the leader sends the
+  log tail from that position. Otherwise it sends a full snapshot (SNAPSHOT
+  frames) followed by an empty DELTA frame that marks the end of the snapshot.
+- After that, new log records are coalesced into DELTA frames of at most
+  ``max_batch`` records. Frames are pipelined: the leader does not wait for
+  acknowledgements, only for the socket to drain.
+- When there is nothing to send, the leader sends an empty DELTA frame every
+  ``heartbeat_interval`` seconds.
+
+Followers acknowledge the last applied sequence (``<Q``) after each read. The
+leader uses these acknowledgements to report replication lag.
+
+Log records are absolute values, so re-applying a record is harmless. This lets
+the leader read its sequence number before taking the snapshot without
+coordinating with concurrent writers: any write that lands in between is in the
+snapshot and is replayed from the log as well.
+"""
+
+import asyncio
+import random
+import struct
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from pyscored.core.wire import SNAPSHOT, Frame, WireDecoder, WireEncoder, snapshot_diff
+
+_HELLO = struct.Struct("<QQ")
+_ID = struct.Struct("<Q")
+_ACK = struct.Struct("<Q")
+
+Streams = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class FollowerStatus(NamedTuple):
+    """Replication progress of one connected follower, as seen by the leader."""
+
+    address: str
+    acked_sequence: int
+    lag: int
+    seconds_since_ack: float
+
+
+class _Connection:
+    """Leader-side state of one connected follower."""
+
+    def __init__(self, address: str, writer: asyncio.StreamWriter):
+        self.address = address
+        self.writer = writer
+        self.sent = 0
+        self.acked = 0
+        self.acked_at = time.monotonic()
+        self.wakeup = asyncio.Event()
+
+
+class ReplicationLeader:
+    """Ships a ScoringEngine's ordered change log to follower engines.
+
+    The log keeps at least ``log_size`` records. Followers that fall further behind
+    catch up from a fresh snapshot.
+    """
+
+    def __init__(self, engine: Any, log_size: int = 100_000, max_batch: int = 10_000,
+                 heartbeat_interval: float = 1.0, frame_size: int = 65536):
+        self.engine = engine
+        self.log_size = log_size
+        self.max_batch = max_batch
+        self.heartbeat_interval = heartbeat_interval
+        self.frame_size = frame_size
+        self.leader_id = random.getrandbits(63) | 1
+        self._log: List[Tuple[str, Any]] = []
+        self._log_start = 1
+        self._sequence = 0
+        self._lock = threading.Lock()
+        self._connections: List[_Connection] = []
+        self._handlers: Set["asyncio.Task[None]"] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake_pending = False
+        self._closing = False
+        engine.add_listener(self._record)
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the latest logged change."""
+        return self._sequence
+
+    def _record(self, player_id: str, old: Any, new: Any, points: Any) -> None:
+        if new is not None and self.engine.fixed_point is not None:
+            # Listeners see floats; replicate the exact stored integer instead.
+            new = self.engine.get_raw_score(player_id)
+        with self._lock:
+            self._log.append((player_id, new))
+            self._sequence += 1
+            if len(self._log) > 2 * self.log_size:
+                drop = len(self._log) - self.log_size
+                del self._log[:drop]
+                self._log_start += drop
+        if self._connections and not self._wake_pending and self._loop is not None:
+            self._wake_pending = True
+            # Engine writes may come from other threads, so hop onto the loop first.
+            self._loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self) -> None:
+        self._wake_pending = False
+        for connection in self._connections:
+            connection.wakeup.set()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 0) -> Tuple[str, int]:
+        """Accepts followers over TCP and returns the bound ``(host, port)``."""
+        self._loop = asyncio.get_running_loop()
+        self._server = await asyncio.start_server(self._accept, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_unix(self, path: str) -> None:
+        """Accepts followers over a Unix socket at ``path``."""
+        self._loop = asyncio.get_running_loop()
+        self._server = await asyncio.start_unix_server(self._accept, path)
+
+    async def close(self) -> None:
+        """Stops accepting followers, disconnects the connected ones and detaches from the engine."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self._closing = True
+        for connection in self._connections:
+            connection.writer.close()
+            connection.wakeup.set()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        self.engine.remove_listener(self._record)
+
+    def followers(self) -> List[FollowerStatus]:
+        """Reports the acknowledged position and lag of each connected follower."""
+        now = time.monotonic()
+        return [FollowerStatus(c.address, c.acked, self._sequence - c.acked, now - c.acked_at)
+                for c in self._connections]
+
+    @property
+    def lag(self) -> int:
+        """Number of changes the slowest connected follower has not acknowledged yet."""
+        return max((self._sequence - c.acked for c in self._connections), default=0)
+
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self._handlers.add(task)
+        try:
+            await self._handle(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._handlers.discard(task)
+            writer.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        known_id, applied = _HELLO.unpack(await reader.readexactly(_HELLO.size))
+        address = str(writer.get_extra_info("peername") or "unix")
+        connection = _Connection(address, writer)
+        connection.acked = applied if known_id == self.leader_id else 0
+        self._connections.append(connection)
+        acks = asyncio.ensure_future(self._read_acks(connection, reader))
+        try:
+            writer.write(_ID.pack(self.leader_id))
+            encoder = WireEncoder()
+            if known_id == self.leader_id and self._log_start - 1 <= applied <= self._sequence:
+                connection.sent = applied
+            else:
+                await self._send_snapshot(connection, encoder)
+            await self._stream(connection, encoder, acks)
+        finally:
+            acks.cancel()
+            self._connections.remove(connection)
+
+    async def _read_acks(self, connection: _Connection, reader: asyncio.StreamReader) -> None:
+        while True:
+            data = await reader.readexactly(_ACK.size)
+            (connection.acked,) = _ACK.unpack(data)
+            connection.acked_at = time.monotonic()
+
+    async def _send_snapshot(self, connection: _Connection, encoder: WireEncoder) -> None:
+        writer = connection.writer
+        # Read the sequence first: changes racing with the snapshot are replayed from the log.
+        sequence = self._sequence
+        for frame in encoder.iter_snapshot(self.engine.snapshot(), self.frame_size, sequence):
+            writer.write(frame)
+            await writer.drain()
+        writer.write(encoder.encode_delta({}, (), sequence))
+        connection.sent = sequence
+
+    async def _stream(self, connection: _Connection, encoder: WireEncoder, acks: "asyncio.Future[None]") -> None:
+        writer = connection.writer
+        while not (acks.done() or self._closing):
+            with self._lock:
+                offset = connection.sent + 1 - self._log_start
+                records = self._log[offset:offset + self.max_batch] if offset >= 0 else None
+            if records is None:
+                await self._send_snapshot(connection, encoder)
+                continue
+            if records:
+                changed: Dict[str, Any] = {}
+                removed: Set[str] = set()
+                for player_id, value in records:
+                    if value is None:
+                        changed.pop(player_id, None)
+                        removed.add(player_id)
+                    else:
+                        changed[player_id] = value
+                        removed.discard(player_id)
+                connection.sent += len(records)
+                writer.write(encoder.encode_delta(changed, removed, connection.sent))
+                await writer.drain()
+                continue
+            connection.wakeup.clear()
+            try:
+                await asyncio.wait_for(connection.wakeup.wait(), self.heartbeat_interval)
+            except asyncio.TimeoutError:
+                writer.write(encoder.encode_delta({}, (), connection.sent))
+                await writer.drain()
+        if acks.done():
+            # The follower hung up; surface the reason from the ack reader.
+            acks.result()
+
+
+class ReplicationFollower:
+    """Keeps a read-replica ScoringEngine in sync with a ReplicationLeader.
+
+    The replica should only be written through replication. Snapshots and batches
+    are applied as engine transactions, so readers never see a partially applied
+    batch and listeners on the replica fire as they would on the leader.
+    """
+
+    def __init__(self, engine: Any, reconnect_delay: Optional[float] = 0.5):
+        self.engine = engine
+        self.reconnect_delay = reconnect_delay
+        self.leader_id = 0
+        self.applied_sequence = 0
+        self.connected = False
+        self.synced = False
+        self.last_contact: Optional[float] = None
+        self._pending_snapshot: Optional[Dict[str, Any]] = None
+        self._progress: Optional[asyncio.Event] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def staleness(self) -> Optional[float]:
+        """Seconds since the leader was last heard from, or None before the first contact.
+
+        A connected, caught-up follower hears at least one heartbeat per leader
+        ``heartbeat_interval``.
+        """
+        if self.last_contact is None:
+            return None
+        return time.monotonic() - self.last_contact
+
+    def connect(self, host: str = "127.0.0.1", port: int = 0) -> "asyncio.Task[None]":
+        """Starts replicating from a leader listening on TCP ``host:port``."""
+        return self._start(lambda: asyncio.open_connection(host, port))
+
+    def connect_unix(self, path: str) -> "asyncio.Task[None]":
+        """Starts replicating from a leader listening on the Unix socket ``path``."""
+        return self._start(lambda: asyncio.open_unix_connection(path))
+
+    def _start(self, open_streams: Callable[[], Awaitable[Streams]]) -> "asyncio.Task[None]":
+        if self._task is not None and not self._task.done():
+            raise RuntimeError("The follower is already running.")
+        self._progress = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run(open_streams))
+        return self._task
+
+    async def close(self) -> None:
+        """Stops replicating; the replica keeps the state it has applied."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def wait_for(self, sequence: int, timeout: Optional[float] = None) -> None:
+        """Waits until the replica is in sync with the leader up to its change ``sequence``."""
+        if self._progress is None:
+            raise RuntimeError("The follower is not running.")
+
+        async def caught_up() -> None:
+            assert self._progress is not None
+            while not self.synced or self.applied_sequence < sequence:
+                self._progress.clear()
+                await self._progress.wait()
+
+        await asyncio.wait_for(caught_up(), timeout)
+
+    async def _run(self, open_streams: Callable[[], Awaitable[Streams]]) -> None:
+        while True:
+            try:
+                reader, writer = await open_streams()
+                try:
+                    await self._sync(reader, writer)
+                finally:
+                    self.connected = self.synced = False
+                    writer.close()
+            except (OSError, asyncio.IncompleteReadError):
+                pass
+            if self.reconnect_delay is None:
+                return
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def _sync(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        writer.write(_HELLO.pack(self.leader_id, self.applied_sequence))
+        (leader_id,) = _ID.unpack(await reader.readexactly(_ID.size))
+        if leader_id != self.leader_id:
+            # A different leader numbers its log from scratch; it sends a full snapshot.
+            self.leader_id = leader_id
+            self.applied_sequence = 0
+        self.connected = True
+        decoder = WireDecoder()
+        while True:
+            data = await reader.read(1 << 16)
+            if not data:
+                return
+            frames = decoder.feed(data)
+            for frame in frames:
+                self._apply(frame)
+            self.last_contact = time.monotonic()
+            if frames:
+                writer.write(_ACK.pack(self.applied_sequence))
+                assert self._progress is not None
+                self._progress.set()
+
+    def _apply(self, frame: Frame) -> None:
+        if frame.kind == SNAPSHOT:
+            if frame.reset or self._pending_snapshot is None:
+                self._pending_snapshot = {}
+            self._pending_snapshot.update(zip(frame.player_ids, frame.values))
+            return
+        engine = self.engine
+        with engine.transaction():
+            if self._pending_snapshot is not None:
+                changed, removed = snapshot_diff(engine.snapshot(), self._pending_snapshot)
+                self._pending_snapshot = None
+                engine.apply_changes(changed, removed)
+            if frame.player_ids or frame.removed:
+                engine.apply_changes(dict(zip(frame.player_ids, frame.values)), frame.removed)
+        self.applied_sequence = frame.sequence
+        self.synced = True
@@ -0,0 +1,167 @@
+# pyscored/core/rule_bundle.py
+
+import asyncio
+import hashlib
+import marshal
+import os
+import sys
+import types
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pyscored.core.sandbox import Sandbox
+
+Rule = Callable[..., Any]
+# Bytecode is only valid for the interpreter that produced it.
+_CACHE_TAG = sys.implementation.cache_tag or "python"
+
+
+class RuleBundle:
+    """Scoring rules loaded from a directory of ``*.py`` rule files.
+
+    Every public function defined in a rule file becomes a rule of the same name; a
+    file can restrict that with ``__all__``. Compiled code is cached in ``cache_dir``
+    under the SHA-256 of the file's source, so later boots load bytecode instead of
+    compiling, and unchanged files are never recompiled.
+
+    ``reload`` re-reads files whose size or modification time changed and swaps the
+    changed rules into installed sandboxes in one step with ``Sandbox.replace_rules``.
+    A file that fails to compile or execute is reported and its previous rules stay
+    in place. When several files define the same rule, the file that sorts last wins,
+    and removing it falls back to the definition of the next one.
+    """
+
+    def __init__(self, directory: str, cache_dir: Optional[str] = None):
+        self.directory = directory
+        self.cache_dir = cache_dir if cache_dir is not None else os.path.join(directory, "__rulecache__")
+        # File name -> ((size, mtime_ns), source hash, rules defined by the file).
+        self._files: Dict[str, Tuple[Tuple[int, int], str, Dict[str, Rule]]] = {}
+        # Files that failed to load, with the (size, mtime_ns) they failed at.
+        self._failed: Dict[str, Tuple[int, int]] = {}
+        self._sandboxes: List[Sandbox] = []
+        self.compiled = 0
+        self.last_error: Optional[BaseException] = None
+
+    @property
+    def rules(self) -> Dict[str, Rule]:
+        """All rules of the bundle by name."""
+        rules: Dict[str, Rule] = {}
+        for file_name in sorted(self._files):
+            rules.update(self._files[file_name][2])
+        return rules
+
+    def _code(self, path: str, source: bytes, digest: str) -> types.CodeType:
+        cache_path = os.path.join(self.cache_dir, f"{digest}.{_CACHE_TAG}.bin")
+        try:
+            with open(cache_path, "rb") as f:
+                return marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+        code = compile(source, path, "exec", dont_inherit=True)
+        self.compiled += 1
+        # Write to a temporary name first so concurrent workers never read a partial file.
+        temporary = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temporary, "wb") as f:
+                marshal.dump(code, f)
+            os.replace(temporary, cache_path)
+        except OSError:
+            # A read-only or full cache directory only costs recompiling on the next boot.
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+        return code
+
+    def _load_file(self, file_name: str, source: bytes, digest: str) -> Dict[str, Rule]:
+        path = os.path.join(self.directory, file_name)
+        module_name = f"pyscored_rules.{file_name[:-3]}"
+        namespace: Dict[str, Any] = {"__name__": module_name, "__file__": path, "__builtins__": __builtins__}
+        exec(self._code(path, source, digest), namespace)
+        names = namespace.get("__all__")
+        if names is None:
+            names = [name for name, value in namespace.items()
+                     if not name.startswith("_") and isinstance(value, types.FunctionType)
+                     and value.__module__ == module_name]
+        return {name: namespace[name] for name in names}
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        stats: Dict[str, Tuple[int, int]] = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".py") and not entry.name.startswith((".", "_")) and entry.is_file():
+                    stat = entry.stat()
+                    stats[entry.name] = (stat.st_size, stat.st_mtime_ns)
+        return stats
+
+    def reload(self) -> Tuple[Dict[str, Rule], List[str]]:
+        """Loads new and changed rule files and applies them to installed sandboxes.
+
+        Returns the added or replaced rules and the names of removed rules. Raises the
+        first load error after applying every file that did load; a failed file keeps
+        its previous rules and is retried once it changes.
+        """
+        error: Optional[BaseException] = None
+        before = self.rules
+        modified = False
+        stats = self._scan()
+        for file_name in list(self._files):
+            if file_name not in stats:
+                del self._files[file_name]
+                modified = True
+        for file_name in list(self._failed):
+            if file_name not in stats:
+                del self._failed[file_name]
+        for file_name, stat in sorted(stats.items()):
+            known = self._files.get(file_name)
+            if (known is not None and known[0] == stat) or self._failed.get(file_name) == stat:
+                continue
+            try:
+                with open(os.path.join(self.directory, file_name), "rb") as f:
+                    source = f.read()
+                digest = hashlib.sha256(source).hexdigest()
+                if known is not None and known[1] == digest:
+                    self._files[file_name] = (stat, digest, known[2])
+                    continue
+                rules = self._load_file(file_name, source, digest)
+            except Exception as e:
+                self._failed[file_name] = stat
+                if error is None:
+                    error = e
+                continue
+            self._failed.pop(file_name, None)
+            self._files[file_name] = (stat, digest, rules)
+            modified = True
+        changed: Dict[str, Rule] = {}
+        removed: List[str] = []
+        if modified:
+            # Diff the resolved rules, so a rule still defined by another file is kept.
+            after = self.rules
+            changed = {name: rule for name, rule in after.items() if before.get(name) is not rule}
+            removed = [name for name in before if name not in after]
+        if changed or removed:
+            for sandbox in self._sandboxes:
+                sandbox.replace_rules(changed, removed)
+        self.last_error = error
+        if error is not None:
+            raise error
+        return changed, removed
+
+    def install(self, sandbox: Sandbox) -> None:
+        """Loads the bundle if needed and keeps ``sandbox`` in sync with it on every reload."""
+        if not self._files:
+            self.reload()
+        sandbox.replace_rules(self.rules)
+        self._sandboxes.append(sandbox)
+
+    async def watch(self, interval: float = 1.0) -> None:
+        """Polls the directory every ``interval`` seconds and hot-swaps changed rules until cancelled.
+
+        Load errors do not stop the watcher; the latest one is kept in ``last_error``.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.reload()
+            except Exception:
+                pass
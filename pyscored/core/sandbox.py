@@ -1,6 +1,6 @@
 # pyscored/core/sandbox.py
 
-from typing import Callable, Dict, Any
+from typing import Any, Callable, Dict, Iterable, Mapping
 
 
 class Sandbox:
@@ -15,11 +15,23 @@ class Sandbox:
             raise ValueError(f"Rule '{rule_name}' already exists.")
         self._rules[rule_name] = rule_logic
 
+    def replace_rules(self, rules: Mapping[str, Callable[..., Any]], removed: Iterable[str] = ()) -> None:
+        """Atomically adds or replaces rules and removes others.
+
+        The rule table is copied, changed and swapped in with one assignment, so rules
+        being evaluated concurrently see either the old set or the new one, never a mix.
+        """
+        updated = dict(self._rules)
+        for rule_name in removed:
+            updated.pop(rule_name, None)
+        updated.update(rules)
+        self._rules = updated
+
     def execute_rule(self, rule_name: str, **kwargs) -> Any:
         """Executes a registered scoring rule safely."""
-        if rule_name not in self._rules:
+        rule_logic = self._rules.get(rule_name)
+        if rule_logic is None:
             raise ValueError(f"Rule '{rule_name}' is not defined.")
-        rule_logic = self._rules[rule_name]
         try:
             return rule_logic(**kwargs)
         except Exception as e:
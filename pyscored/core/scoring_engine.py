@@ -1,52 +1,623 @@
 # pyscored/core/scoring_engine.py
 
-from typing import Dict, Any, Callable, Optional
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Callable, Hashable, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Tuple, Union
+from pyscored.analytics.groups import GroupAggregates
+from pyscored.analytics.heavy_hitters import HeavyHitters
+from pyscored.analytics.quantiles import QuantileSketch
+from pyscored.analytics.query import ScoreQuery
+from pyscored.analytics.triggers import TriggerIndex
+from pyscored.analytics.windows import WindowedScores
+from pyscored.core.crdt import CRDTScores
+from pyscored.core.dedup import EventDeduplicator
+from pyscored.core.feed import ChangeFeed, Subscription
+from pyscored.core.metrics import MetricTable
+from pyscored.core.rule_bundle import RuleBundle
 from pyscored.core.sandbox import Sandbox
+from pyscored.core.snapshot import ScoreSnapshot
+from pyscored.core.timers import Timer, TimerWheel
+from pyscored.core.transaction import Transaction
 from pyscored.plugins.base_plugin import BasePlugin
+from pyscored.plugins.registry import PluginRegistry, get_registry
+from pyscored.storage.array import ArrayStore
+from pyscored.storage.base import ScoreStore
+from pyscored.storage.memory import InMemoryStore
+from pyscored.utils.fixed_point import FixedPoint
+from pyscored.utils.helpers import load_toml
+
+ScoreListener = Callable[[str, Optional[float], Optional[float], Optional[float]], None]
+BatchListener = Callable[[List[Tuple[str, Optional[float], Optional[float], Optional[float]]]], None]
+
 
 class ScoringEngine:
     """Core scoring engine that manages scoring logic within a sandboxed environment."""
 
-    def __init__(self, sandbox: Optional[Sandbox] = None):
-        self._scores: Dict[str, float] = {}
+    def __init__(self, sandbox: Optional[Sandbox] = None, registry: Optional[PluginRegistry] = None,
+                 store: Optional[ScoreStore] = None, fixed_point: Optional[FixedPoint] = None):
+        if store is None:
+            store = ArrayStore("q") if fixed_point is not None else InMemoryStore()
+        self._store = store
+        store.attach(self)
+        self._scores: MutableMapping[str, float] = self._store
+        # Stores shared with other processes apply increments atomically themselves.
+        self._increment = store.increment if store.atomic_increment else None
+        self._fixed_point = fixed_point
+        self._zero = 0 if fixed_point is not None else 0.0
         self._sandbox = sandbox if sandbox else Sandbox()
         self._plugins: Dict[str, BasePlugin] = {}
+        self._plugin_specs: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self._registry = registry
+        self._transaction: Optional[Transaction] = None
+        self._listeners: List[ScoreListener] = []
+        self._batch_listeners: List[BatchListener] = []
+        # Whether any listener of either kind is subscribed, checked on every write.
+        self._observed = False
+        self._quantiles: Optional[QuantileSketch] = None
+        self._heavy_hitters: Optional[HeavyHitters] = None
+        self._groups: Optional[GroupAggregates] = None
+        self._triggers: Optional[TriggerIndex] = None
+        self._windows: Dict[str, WindowedScores] = {}
+        self._feed: Optional[ChangeFeed] = None
+        self._crdt: Optional[CRDTScores] = None
+        self._dedup: Optional[EventDeduplicator] = None
+        self._timers: Optional[TimerWheel] = None
+        self._metrics: Optional[MetricTable] = None
+        # Active multipliers per player (None for all players) and their combined factors.
+        self._multipliers: Dict[Optional[str], Dict[Timer, float]] = {}
+        self._factors: Dict[Optional[str], float] = {}
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any], **kwargs: Any) -> "ScoringEngine":
+        """Creates an engine from a declarative configuration such as ``{"plugins": {"combo": {"type": "combo_bonus", ...}}}``.
+
+        An optional ``fixed_point`` table (``{"scale": 1000}``) selects fixed-point scoring.
+        """
+        if "fixed_point" in config and "fixed_point" not in kwargs:
+            kwargs["fixed_point"] = FixedPoint(**config["fixed_point"])
+        engine = cls(**kwargs)
+        engine.configure_plugins(config.get("plugins", {}))
+        return engine
+
+    @classmethod
+    def from_toml(cls, path: str, **kwargs: Any) -> "ScoringEngine":
+        """Creates an engine from a TOML file with a ``[plugins.<name>]`` table per plugin."""
+        return cls.from_config(load_toml(path), **kwargs)
+
+    @property
+    def fixed_point(self) -> Optional[FixedPoint]:
+        """The fixed-point codec when scores are stored as scaled int64 values, otherwise None."""
+        return self._fixed_point
+
+    def quantize(self, points: float) -> float:
+        """Rounds points the way the engine will store them; rules can use it to round their results."""
+        if self._fixed_point is None:
+            return points
+        return self._fixed_point.quantize(points)
 
     def initialize_score(self, player_id: str, initial_score: float = 0.0) -> None:
         """Initializes the score for a new player or resets an existing player's score."""
-        self._scores[player_id] = initial_score
+        if self._fixed_point is not None:
+            initial_score = self._fixed_point.to_fixed(initial_score)
+        if self._observed:
+            old = self._scores.get(player_id)
+            self._scores[player_id] = initial_score
+            self._notify(player_id, old, initial_score, None)
+        else:
+            self._scores[player_id] = initial_score
+
+    def update_score(self, player_id: str, points: float, event_id: Optional[Hashable] = None) -> bool:
+        """Updates the score of a player by a given number of points.
 
-    def update_score(self, player_id: str, points: float) -> None:
-        """Updates the score of a player by a given number of points."""
-        if player_id not in self._scores:
+        In fixed-point mode the points are rounded to the engine's scale before they
+        are added, so totals are exact sums of the rounded increments. Active
+        multipliers (``add_multiplier``) scale the points first. With an
+        ``event_id``, an event that was already applied is dropped and False is
+        returned, so retried deliveries are counted once. The event is only recorded
+        once its points are written, so a failed write can be retried.
+        """
+        scores = self._scores
+        old = scores.get(player_id)
+        if old is None:
             raise ValueError(f"Player ID '{player_id}' has not been initialized.")
-        self._scores[player_id] += points
+        if event_id is not None and self._has_event(event_id):
+            return False
+        if self._factors:
+            factors = self._factors
+            points = points * factors.get(player_id, 1) * factors.get(None, 1)
+        if self._fixed_point is not None:
+            points = self._fixed_point.to_fixed(points)
+        if self._increment is None:
+            new = scores[player_id] = old + points
+        elif self._transaction is None:
+            old, new = self._increment(player_id, points)
+        else:
+            # The transaction commits the points with the store's increment, not the final value.
+            old, new = scores.increment(player_id, points)
+        if event_id is not None:
+            self._record_event(event_id)
+        if self._observed:
+            self._notify(player_id, old, new, points)
+        return True
+
+    def update_scores(self, updates: Iterable[Union[Tuple[str, float], Tuple[str, float, Hashable]]]) -> int:
+        """Applies many ``(player_id, points)`` updates atomically and returns how many were applied.
+
+        Updates may carry an event id as a third element; duplicates are skipped and not counted.
+        """
+        applied = 0
+        with self.transaction():
+            for update in updates:
+                applied += self.update_score(*update)
+        return applied
 
     def get_score(self, player_id: str) -> float:
         """Retrieves the current score of a player."""
+        if self._fixed_point is not None:
+            return self._fixed_point.to_float(self._scores.get(player_id, 0))
         return self._scores.get(player_id, 0.0)
 
+    def get_raw_score(self, player_id: str) -> float:
+        """Retrieves the stored score of a player: the scaled integer in fixed-point mode."""
+        return self._scores.get(player_id, self._zero)
+
     def reset_score(self, player_id: str) -> None:
         """Resets the score of a specified player."""
-        if player_id in self._scores:
-            self._scores[player_id] = 0.0
+        old = self._scores.get(player_id)
+        if old is not None:
+            self._scores[player_id] = self._zero
+            if self._observed:
+                self._notify(player_id, old, self._zero, None)
+
+    def apply_changes(self, changed: Mapping[str, float], removed: Iterable[str] = ()) -> None:
+        """Atomically assigns stored (raw, in fixed-point mode) scores and removes players.
+
+        Used to mirror state produced elsewhere, such as by a replication leader.
+        """
+        with self.transaction():
+            scores = self._scores
+            notify = self._observed
+            for player_id, score in changed.items():
+                old = scores.get(player_id) if notify else None
+                scores[player_id] = score
+                if notify:
+                    self._notify(player_id, old, score, None)
+            for player_id in removed:
+                old = scores.get(player_id)
+                if old is not None:
+                    del scores[player_id]
+                    if notify:
+                        self._notify(player_id, old, None, None)
+
+    def add_listener(self, listener: ScoreListener) -> None:
+        """Subscribes a callback to score changes.
+
+        Listeners are called as ``listener(player_id, old, new, points)`` after each
+        change. ``old`` is None for new players, and ``points`` is the increment for
+        ``update_score`` or None when a score is assigned. Inside a transaction, changes
+        are delivered in order once the outermost transaction commits.
+        """
+        self._listeners.append(listener)
+        self._observed = True
+
+    def remove_listener(self, listener: ScoreListener) -> None:
+        """Unsubscribes a score change callback."""
+        self._listeners.remove(listener)
+        self._observed = bool(self._listeners or self._batch_listeners)
+
+    def add_batch_listener(self, listener: BatchListener) -> None:
+        """Subscribes a callback to committed batches of score changes.
+
+        Batch listeners are called as ``listener(changes)`` with a list of
+        ``(player_id, old, new, points)`` tuples: one change for a write outside a
+        transaction, or every change of the outermost transaction once it commits.
+        """
+        self._batch_listeners.append(listener)
+        self._observed = True
+
+    def remove_batch_listener(self, listener: BatchListener) -> None:
+        """Unsubscribes a batch callback."""
+        self._batch_listeners.remove(listener)
+        self._observed = bool(self._listeners or self._batch_listeners)
+
+    def _notify(self, player_id: str, old: Any, new: Any, points: Any) -> None:
+        fixed_point = self._fixed_point
+        if fixed_point is not None:
+            old = None if old is None else fixed_point.to_float(old)
+            new = None if new is None else fixed_point.to_float(new)
+            points = None if points is None else fixed_point.to_float(points)
+        if self._transaction is not None:
+            self._transaction.changes.append((player_id, old, new, points))
+        else:
+            for listener in self._listeners:
+                listener(player_id, old, new, points)
+            if self._batch_listeners:
+                changes = [(player_id, old, new, points)]
+                for batch_listener in self._batch_listeners:
+                    batch_listener(changes)
+
+    def _publish(self, changes: List[Tuple[str, Any, Any, Any]]) -> None:
+        for listener in self._listeners:
+            for change in changes:
+                listener(*change)
+        for batch_listener in self._batch_listeners:
+            batch_listener(changes)
+
+    @property
+    def quantiles(self) -> QuantileSketch:
+        """Quantile sketch over all scores, created and seeded on first access."""
+        if self._quantiles is None:
+            self.enable_quantiles()
+        assert self._quantiles is not None
+        return self._quantiles
+
+    def enable_quantiles(self, relative_accuracy: float = 0.01, min_value: float = 1e-9,
+                         max_value: float = 1e15) -> QuantileSketch:
+        """Starts maintaining a quantile sketch that is updated incrementally on every score change."""
+        if self._quantiles is not None:
+            self.remove_listener(self._quantiles.observe)
+        sketch = QuantileSketch(relative_accuracy, min_value, max_value)
+        to_float = self._fixed_point.to_float if self._fixed_point is not None else float
+        for score in self._store.snapshot().values():
+            sketch.add(to_float(score))
+        self._quantiles = sketch
+        self.add_listener(sketch.observe)
+        return sketch
+
+    def percentile_of(self, score: float) -> float:
+        """Approximate fraction of players scoring at or below ``score``."""
+        return self.quantiles.percentile_of(score)
+
+    def quantile(self, q: float) -> float:
+        """Approximate score at quantile ``q`` (0 to 1)."""
+        return self.quantiles.quantile(q)
+
+    def histogram(self, bins: Union[int, Sequence[float]] = 10) -> List[Tuple[float, float, int]]:
+        """Approximate score histogram as ``(low, high, count)`` tuples."""
+        return self.quantiles.histogram(bins)
+
+    def snapshot(self) -> ScoreSnapshot:
+        """Returns a cheap, immutable point-in-time view of all committed scores.
+
+        Snapshots share storage with the engine until the engine writes to it, so
+        long-running reads and exports neither block nor observe concurrent updates.
+        In fixed-point mode the snapshot holds the raw scaled integers.
+        """
+        return self._store.snapshot()
+
+    def query(self) -> ScoreQuery:
+        """Exact aggregations (``sum``, ``mean``, ``count_where``, ``histogram``, ``filter``, ``select``) over a fresh snapshot.
+
+        The query keeps answering from that snapshot while the engine goes on
+        writing; call ``query`` again for current data.
+        """
+        return ScoreQuery(self._store.snapshot(), self._fixed_point)
+
+    def flush(self) -> None:
+        """Persists buffered writes in the score store."""
+        self._store.flush()
+
+    def close(self) -> None:
+        """Flushes and closes the score store."""
+        self._store.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator["ScoringEngine"]:
+        """Groups score and plugin updates so they are committed together or not at all.
+
+        Writes are buffered in a delta overlay that reads see immediately, then applied
+        in bulk when the block exits normally. Any exception discards them. Transactions
+        may be nested; an inner commit folds into the enclosing transaction.
+        """
+        transaction = Transaction(self, parent=self._transaction)
+        self._transaction = transaction
+        try:
+            yield self
+        except BaseException:
+            transaction.rollback()
+            raise
+        else:
+            transaction.commit()
+        finally:
+            self._transaction = transaction.parent
+        if transaction.parent is None and transaction.changes:
+            self._publish(transaction.changes)
+
+    @property
+    def heavy_hitters(self) -> HeavyHitters:
+        """Heavy-hitter summary of score events, counting from its first access."""
+        if self._heavy_hitters is None:
+            self.enable_heavy_hitters()
+        assert self._heavy_hitters is not None
+        return self._heavy_hitters
+
+    def enable_heavy_hitters(self, capacity: int = 1024, window: Optional[float] = None) -> HeavyHitters:
+        """Starts counting score events per player in a fixed-size Space-Saving summary."""
+        if self._heavy_hitters is not None:
+            self.remove_listener(self._heavy_hitters.observe)
+        self._heavy_hitters = HeavyHitters(capacity, window)
+        self.add_listener(self._heavy_hitters.observe)
+        return self._heavy_hitters
+
+    def top_active(self, k: int = 10) -> List[Tuple[str, int, int]]:
+        """Players with the most score events as ``(player_id, estimated_count, max_overestimate)``."""
+        return self.heavy_hitters.top_active(k)
+
+    @property
+    def groups(self) -> GroupAggregates:
+        """Team and guild aggregates, created on first access."""
+        if self._groups is None:
+            self.enable_groups()
+        assert self._groups is not None
+        return self._groups
+
+    def enable_groups(self, top_n: int = 10) -> GroupAggregates:
+        """Starts maintaining per-group sums, means and top-N sums of member scores."""
+        if self._groups is not None:
+            self.remove_listener(self._groups.observe)
+        self._groups = GroupAggregates(self, top_n)
+        return self._groups
+
+    @property
+    def windows(self) -> Dict[str, WindowedScores]:
+        """Sliding-window counters enabled with ``enable_window``, by name."""
+        return dict(self._windows)
+
+    def enable_window(self, name: str, window: float, buckets: int = 60,
+                      clock: Callable[[], float] = time.monotonic) -> WindowedScores:
+        """Starts counting the points each player earns over the last ``window`` seconds.
+
+        ``buckets`` sets both the time resolution and the memory per player; see
+        ``WindowedScores``. Enabling a name again replaces its counters.
+        """
+        previous = self._windows.get(name)
+        if previous is not None:
+            self.remove_listener(previous.observe)
+        self._windows[name] = WindowedScores(window, buckets, self, clock)
+        return self._windows[name]
+
+    def window_score(self, name: str, player_id: str) -> float:
+        """Points a player earned within the named window."""
+        return self._windows[name].score(player_id)
+
+    def window_top(self, name: str, k: int = 10) -> List[Tuple[str, float]]:
+        """The ``k`` players who earned the most points within the named window."""
+        return self._windows[name].top(k)
+
+    @property
+    def triggers(self) -> TriggerIndex:
+        """Threshold and achievement triggers, created on first access."""
+        if self._triggers is None:
+            self.enable_triggers()
+        assert self._triggers is not None
+        return self._triggers
+
+    def enable_triggers(self, state: Optional[Mapping[str, Any]] = None) -> TriggerIndex:
+        """Starts checking score changes against a sorted index of thresholds.
+
+        ``state`` is a ``TriggerIndex.to_dict`` payload to restore, including which
+        players once-only triggers already fired for. ``snapshot`` holds scores only;
+        to checkpoint an engine, save ``triggers.to_dict()`` next to it. Both reflect
+        committed changes only, so they match even inside a transaction. To restore,
+        pass the payload here and load the scores with ``apply_changes``: players new
+        to the engine do not fire triggers.
+        """
+        if self._triggers is not None:
+            self.remove_batch_listener(self._triggers.observe_batch)
+        self._triggers = TriggerIndex(self)
+        if state is not None:
+            self._triggers.load(state)
+        return self._triggers
+
+    @property
+    def change_feed(self) -> ChangeFeed:
+        """Feed that coalesces score changes per tick for async subscribers, created on first use."""
+        if self._feed is None:
+            self._feed = ChangeFeed(self)
+        return self._feed
+
+    def subscribe(self, players: Optional[Iterable[str]] = None, top_k: Optional[int] = None,
+                  on_lag: str = "conflate", max_lag: int = 8) -> Subscription:
+        """Subscribes to coalesced score changes for a set of players or to a top-k leaderboard.
+
+        Must be called from a running event loop. Iterate the result with ``async for``.
+        """
+        return self.change_feed.subscribe(players, top_k, on_lag, max_lag)
+
+    @property
+    def crdt(self) -> Optional[CRDTScores]:
+        """Mergeable score state for multi-node writes, or None until ``enable_crdt`` is called."""
+        return self._crdt
+
+    def enable_crdt(self, node_id: str) -> CRDTScores:
+        """Starts tracking scores as per-node PN-counters so they can be merged with other nodes.
+
+        ``node_id`` must be unique among the nodes that exchange deltas.
+        """
+        if self._crdt is not None:
+            self.remove_listener(self._crdt.observe)
+        self._crdt = CRDTScores(node_id, self)
+        return self._crdt
+
+    @property
+    def deduplicator(self) -> EventDeduplicator:
+        """Recently applied event ids, created with default sizing on first use."""
+        if self._dedup is None:
+            self.enable_dedup()
+        assert self._dedup is not None
+        return self._dedup
+
+    def enable_dedup(self, window: float = 3600.0, expected_events: int = 1_000_000,
+                     false_positive_rate: float = 1e-4, **options: Any) -> EventDeduplicator:
+        """Starts remembering event ids for ``window`` seconds so duplicate events are dropped.
+
+        ``expected_events`` is the number of events expected per window; see
+        ``EventDeduplicator`` for the remaining options.
+        """
+        self._dedup = EventDeduplicator(window, expected_events=expected_events,
+                                        false_positive_rate=false_positive_rate, **options)
+        return self._dedup
+
+    def _has_event(self, event_id: Hashable) -> bool:
+        """Returns True for an event that was already applied, here or in an open transaction."""
+        transaction = self._transaction
+        if transaction is not None and transaction.has_event(event_id):
+            return True
+        return event_id in self.deduplicator
+
+    def _record_event(self, event_id: Hashable) -> None:
+        """Records an applied event; inside a transaction only if the transaction commits."""
+        transaction = self._transaction
+        if transaction is None:
+            self.deduplicator.add(event_id)
+        else:
+            transaction.event_ids.add(event_id)
+
+    @property
+    def metrics(self) -> Optional[MetricTable]:
+        """Per-player multi-metric records, or None until ``enable_metrics`` is called."""
+        return self._metrics
+
+    def enable_metrics(self, metrics: Sequence[str]) -> MetricTable:
+        """Starts keeping several metrics per player (kills, time survived...) next to the score."""
+        self._metrics = MetricTable(metrics)
+        return self._metrics
+
+    def update_metrics(self, player_id: str, **deltas: float) -> None:
+        """Adds to several metrics of a player in one call; see ``MetricTable.update``.
+
+        Metric updates apply immediately, also inside a transaction that later rolls back.
+        """
+        if self._metrics is None:
+            raise ValueError("Metrics are not enabled; call enable_metrics first.")
+        self._metrics.update(player_id, **deltas)
+
+    @property
+    def timers(self) -> TimerWheel:
+        """Timer wheel for deferred updates and expiring multipliers, created with one-second ticks on first use."""
+        if self._timers is None:
+            self.enable_timers()
+        assert self._timers is not None
+        return self._timers
+
+    def enable_timers(self, tick: float = 1.0, slots: int = 64, levels: int = 4,
+                      clock: Callable[[], float] = time.monotonic) -> TimerWheel:
+        """Creates the engine's timer wheel.
+
+        Advance it from a game loop with ``engine.timers.tick()``, from a clock with
+        ``engine.timers.advance()``, or run ``engine.timers.run()`` as an asyncio task.
+        Timer callbacks run on the thread or task that advances the wheel.
+        """
+        if self._timers is not None and len(self._timers):
+            raise RuntimeError("Cannot replace a timer wheel with pending timers.")
+        self._timers = TimerWheel(tick, slots, levels, clock)
+        return self._timers
+
+    def schedule(self, delay: float, callback: Callable[..., Any], *args: Any, **kwargs: Any) -> Timer:
+        """Calls ``callback(*args, **kwargs)`` after ``delay`` seconds of timer-wheel time."""
+        return self.timers.schedule(delay, callback, *args, **kwargs)
+
+    def defer_update(self, delay: float, player_id: str, points: float,
+                     event_id: Optional[Hashable] = None) -> Timer:
+        """Adds points to a player after ``delay`` seconds, e.g. a bonus paid some time after a combo."""
+        return self.timers.schedule(delay, self.update_score, player_id, points, event_id)
+
+    def add_multiplier(self, factor: float, duration: float, player_id: Optional[str] = None) -> Timer:
+        """Multiplies the points of ``update_score`` by ``factor`` for ``duration`` seconds.
+
+        Applies to one player, or to every player when ``player_id`` is None.
+        Overlapping multipliers compound. Returns the expiry timer, which can be passed
+        to ``remove_multiplier`` to end the multiplier early.
+        """
+        timer = self.timers.schedule(duration, self._expire_multiplier, player_id)
+        # The expiry callback needs its own handle to know which multiplier ended.
+        timer.args = (player_id, timer)
+        self._multipliers.setdefault(player_id, {})[timer] = factor
+        self._factors[player_id] = self._factors.get(player_id, 1) * factor
+        return timer
+
+    def remove_multiplier(self, timer: Timer) -> None:
+        """Ends a multiplier returned by ``add_multiplier`` before it expires."""
+        if timer.cancel():
+            self._expire_multiplier(*timer.args)
+
+    def _expire_multiplier(self, player_id: Optional[str], timer: Timer) -> None:
+        multipliers = self._multipliers[player_id]
+        del multipliers[timer]
+        if multipliers:
+            factor = 1
+            for value in multipliers.values():
+                factor *= value
+            self._factors[player_id] = factor
+        else:
+            del self._multipliers[player_id]
+            del self._factors[player_id]
+
+    def multiplier(self, player_id: str) -> float:
+        """The factor currently applied to a player's points, including multipliers for all players."""
+        return self._factors.get(player_id, 1) * self._factors.get(None, 1)
 
     def configure_rule(self, rule_name: str, rule_logic: Callable[..., Any]) -> None:
         """Dynamically configures scoring rules within the sandbox."""
         self._sandbox.add_rule(rule_name, rule_logic)
 
+    def load_rules(self, directory: str, cache_dir: Optional[str] = None) -> RuleBundle:
+        """Loads a directory of rule files into the sandbox; call ``reload`` on the result to pick up changes."""
+        bundle = RuleBundle(directory, cache_dir)
+        bundle.install(self._sandbox)
+        return bundle
+
     def apply_rule(self, rule_name: str, **kwargs) -> Any:
         """Applies a configured scoring rule within the sandbox."""
         return self._sandbox.execute_rule(rule_name, **kwargs)
 
     def register_plugin(self, plugin: BasePlugin) -> None:
         """Registers a plugin to extend scoring functionalities."""
+        previous = self._plugins.get(plugin.name)
         self._plugins[plugin.name] = plugin
         plugin.initialize(self)
+        if self._transaction is not None:
+            self._transaction.track_plugin(plugin, previous)
+
+    def add_plugin(self, plugin_name: str, plugin_type: Optional[str] = None, **params: Any) -> None:
+        """Declares a plugin by type name; it is only loaded and constructed when first executed."""
+        plugin_type = plugin_type or plugin_name
+        if plugin_type not in (self._registry or get_registry()):
+            raise ValueError(f"Plugin type '{plugin_type}' is not available.")
+        self._plugin_specs[plugin_name] = (plugin_type, params)
+
+    def configure_plugins(self, plugins: Mapping[str, Mapping[str, Any]]) -> None:
+        """Declares several plugins from a mapping of plugin names to their ``type`` and parameters."""
+        for plugin_name, spec in plugins.items():
+            params = dict(spec)
+            self.add_plugin(plugin_name, params.pop("type", None), **params)
+
+    def get_plugin(self, plugin_name: str) -> BasePlugin:
+        """Returns a registered plugin, constructing it from its declaration on first use."""
+        plugin = self._plugins.get(plugin_name)
+        if plugin is None:
+            if plugin_name not in self._plugin_specs:
+                raise ValueError(f"Plugin '{plugin_name}' is not registered.")
+            plugin_type, params = self._plugin_specs[plugin_name]
+            plugin = (self._registry or get_registry()).create(plugin_type, name=plugin_name, **params)
+            self.register_plugin(plugin)
+        return plugin
+
+    def execute_plugin(self, plugin_name: str, event_id: Optional[Hashable] = None, **kwargs) -> Any:
+        """Executes a plugin by its name.
 
-    def execute_plugin(self, plugin_name: str, **kwargs) -> Any:
-        """Executes a plugin by its name."""
-        if plugin_name not in self._plugins:
-            raise ValueError(f"Plugin '{plugin_name}' is not registered.")
-        return self._plugins[plugin_name].execute(**kwargs)
+        With an ``event_id``, an event the plugin already processed is dropped and None
+        is returned, so retries do not advance streaks or combos twice. The event is
+        only recorded once the plugin succeeds.
+        """
+        plugin = self.get_plugin(plugin_name)
+        if event_id is None:
+            return plugin.execute(**kwargs)
+        event_key = (plugin_name, event_id)
+        with self.transaction():
+            if self._has_event(event_key):
+                return None
+            result = plugin.execute(**kwargs)
+            self._record_event(event_key)
+            return result
 
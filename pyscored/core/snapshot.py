@@ -0,0 +1,39 @@
+# pyscored/core/snapshot.py
+
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, Mapping, Tuple
+
+
+class ScoreSnapshot(Mapping):
+    """Immutable point-in-time view of player scores."""
+
+    def __init__(self, segments: Tuple[Dict[str, float], ...], version: int = 0):
+        self._segments = segments
+        self._mask = len(segments) - 1
+        self.version = version
+
+    @classmethod
+    def from_mapping(cls, scores: Mapping[str, float], version: int = 0) -> "ScoreSnapshot":
+        """Builds a snapshot by copying an arbitrary mapping."""
+        return cls((dict(scores.items()),), version)
+
+    def __getitem__(self, player_id: str) -> float:
+        return self._segments[hash(player_id) & self._mask][player_id]
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self._segments[hash(player_id) & self._mask]
+
+    def __iter__(self) -> Iterator[str]:
+        return chain.from_iterable(self._segments)
+
+    def __len__(self) -> int:
+        return sum(map(len, self._segments))
+
+    def get(self, player_id: str, default: Any = None) -> Any:
+        return self._segments[hash(player_id) & self._mask].get(player_id, default)
+
+    def items(self) -> Iterable[Tuple[str, float]]:  # type: ignore[override]
+        return chain.from_iterable(segment.items() for segment in self._segments)
+
+    def values(self) -> Iterable[float]:  # type: ignore[override]
+        return chain.from_iterable(segment.values() for segment in self._segments)
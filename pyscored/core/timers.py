@@ -0,0 +1,183 @@
+# pyscored/core/timers.py
+
+import asyncio
+import logging
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Timer:
+    """Handle of a callback scheduled on a TimerWheel."""
+
+    __slots__ = ("expires", "callback", "args", "kwargs", "_wheel", "_bucket")
+
+    def __init__(self, wheel: "TimerWheel", expires: int, callback: Callable[..., Any],
+                 args: tuple, kwargs: Dict[str, Any]):
+        self.expires = expires
+        self.callback = callback
+        self.args = args
+        self.kwargs = kwargs
+        self._wheel = wheel
+        self._bucket: Optional[Dict["Timer", None]] = None
+
+    @property
+    def active(self) -> bool:
+        """Whether the timer is still waiting to fire."""
+        return self._bucket is not None
+
+    def cancel(self) -> bool:
+        """Cancels the timer in O(1); returns False if it already fired or was cancelled."""
+        bucket = self._bucket
+        if bucket is None:
+            return False
+        del bucket[self]
+        self._bucket = None
+        self._wheel._count -= 1
+        return True
+
+
+class TimerWheel:
+    """Hierarchical timer wheel for deferred callbacks, with O(1) scheduling and cancellation.
+
+    Time advances in ticks of ``tick`` seconds. Level 0 has one bucket per tick for
+    the next ``slots`` ticks, and each further level covers ``slots`` times the span
+    of the one below; when a lower level wraps around, the matching bucket of the
+    next level is redistributed downwards. Delays beyond the span of all levels are
+    parked in the top level and re-placed until they are due.
+
+    Drive the wheel either from a game loop with ``tick()`` or from a clock with
+    ``advance()`` (or the ``run`` coroutine). Timers due in one call are collected
+    first and then fired together in deadline order. Once the wheel has been
+    advanced from its clock, ``schedule`` catches up with the clock first, so
+    delays count from the current time rather than from the last advanced tick.
+    """
+
+    def __init__(self, tick: float = 1.0, slots: int = 64, levels: int = 4,
+                 clock: Callable[[], float] = time.monotonic):
+        if tick <= 0:
+            raise ValueError("tick must be positive.")
+        if slots < 2 or slots & (slots - 1):
+            raise ValueError("slots must be a power of two.")
+        if levels < 1:
+            raise ValueError("levels must be at least 1.")
+        self.tick_seconds = tick
+        self.slots = slots
+        self.levels = levels
+        self._bits = slots.bit_length() - 1
+        self._mask = slots - 1
+        self._span = slots ** levels
+        self._wheels: List[List[Dict[Timer, None]]] = [[{} for _ in range(slots)] for _ in range(levels)]
+        self._clock = clock
+        self._origin = clock()
+        self._current = 0
+        self._count = 0
+        self._clock_driven = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def now(self) -> int:
+        """The current tick."""
+        return self._current
+
+    def _place(self, timer: Timer) -> None:
+        current = self._current
+        # Deadlines beyond the wheel's span are parked at its far end and re-placed on cascade.
+        expires = min(timer.expires, current + self._span - 1)
+        delta = expires - current
+        level = 0
+        limit = self.slots
+        while delta >= limit:
+            level += 1
+            limit <<= self._bits
+        bucket = self._wheels[level][(expires >> (self._bits * level)) & self._mask]
+        bucket[timer] = None
+        timer._bucket = bucket
+
+    def schedule(self, delay: float, callback: Callable[..., Any], *args: Any, **kwargs: Any) -> Timer:
+        """Calls ``callback(*args, **kwargs)`` once ``delay`` seconds (rounded up to whole ticks) have passed."""
+        if self._clock_driven:
+            try:
+                self.advance()
+            except Exception:
+                # Errors belong to other timers' callbacks and must not prevent this one.
+                logger.exception("Timer callback failed while catching up with the clock")
+        ticks = max(1, math.ceil(delay / self.tick_seconds))
+        timer = Timer(self, self._current + ticks, callback, args, kwargs)
+        self._place(timer)
+        self._count += 1
+        return timer
+
+    def _step(self, due: List[Timer]) -> None:
+        current = self._current = self._current + 1
+        bits = self._bits
+        mask = self._mask
+        level = 0
+        # Cascade upper levels whose lower level just wrapped around.
+        while level + 1 < self.levels and (current >> (bits * level)) & mask == 0:
+            level += 1
+            wheel = self._wheels[level]
+            index = (current >> (bits * level)) & mask
+            bucket = wheel[index]
+            if bucket:
+                wheel[index] = {}
+                for timer in bucket:
+                    self._place(timer)
+        bucket = self._wheels[0][current & mask]
+        if bucket:
+            self._wheels[0][current & mask] = {}
+            for timer in bucket:
+                timer._bucket = None
+            self._count -= len(bucket)
+            due.extend(bucket)
+
+    def tick(self, ticks: int = 1) -> int:
+        """Advances the wheel by ``ticks`` ticks, fires the timers that came due and returns how many fired."""
+        return self._advance_to(self._current + ticks)
+
+    def advance(self, now: Optional[float] = None) -> int:
+        """Advances the wheel to the clock's time (or ``now``) and fires the timers that came due."""
+        self._clock_driven = True
+        if now is None:
+            now = self._clock()
+        return self._advance_to(int((now - self._origin) / self.tick_seconds))
+
+    def _advance_to(self, target: int) -> int:
+        due: List[Timer] = []
+        while self._current < target:
+            if not self._count:
+                # Nothing to cascade or fire: jump straight to the target tick.
+                self._current = target
+                break
+            self._step(due)
+        return self._fire(due)
+
+    def _fire(self, due: List[Timer]) -> int:
+        """Runs due callbacks; the first error is raised after the others have run."""
+        error: Optional[BaseException] = None
+        for timer in due:
+            try:
+                timer.callback(*timer.args, **timer.kwargs)
+            except Exception as e:
+                if error is None:
+                    error = e
+        if error is not None:
+            raise error
+        return len(due)
+
+    async def run(self) -> None:
+        """Advances the wheel from its clock once per tick until cancelled.
+
+        Callback errors are logged and do not stop the loop.
+        """
+        self._clock_driven = True
+        while True:
+            await asyncio.sleep(self.tick_seconds)
+            try:
+                self.advance()
+            except Exception:
+                logger.exception("Timer callback failed")
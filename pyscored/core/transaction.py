@@ -0,0 +1,173 @@
+# pyscored/core/transaction.py
+
+from typing import Any, Dict, Hashable, Iterator, List, MutableMapping, Optional, Set, Tuple
+
+from pyscored.plugins.base_plugin import BasePlugin
+
+_MISSING = object()
+
+
+class DeltaOverlay(MutableMapping):
+    """Mapping that buffers writes and deletions on top of a base mapping without copying it.
+
+    Over a base with ``atomic_increment`` (a store shared with other writers, or an
+    overlay of one), ``increment`` also records the points added per key, and commit
+    applies them with the base's ``increment`` instead of writing the final values, so
+    increments made by other writers in the meantime are kept.
+    """
+
+    def __init__(self, base: MutableMapping):
+        self.base = base
+        self._writes: Dict[Any, Any] = {}
+        self._deleted: Set[Any] = set()
+        self._increments: Optional[Dict[Any, Any]] = {} if getattr(base, "atomic_increment", False) else None
+
+    @property
+    def atomic_increment(self) -> bool:
+        """Whether committed increments are applied with the base's ``increment``."""
+        return self._increments is not None
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self._writes.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if key in self._deleted:
+            raise KeyError(key)
+        return self.base[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._writes[key] = value
+        self._deleted.discard(key)
+        if self._increments:
+            self._increments.pop(key, None)
+
+    def __delitem__(self, key: Any) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._writes.pop(key, None)
+        self._deleted.add(key)
+        if self._increments:
+            self._increments.pop(key, None)
+
+    def increment(self, key: Any, points: Any) -> Tuple[Any, Any]:
+        """Adds points to a buffered value and returns ``(old, new)``."""
+        old = self[key]
+        increments = self._increments
+        # A key assigned in this overlay keeps its final value; otherwise the points are committed.
+        if increments is not None and (key in increments or key not in self._writes):
+            increments[key] = increments.get(key, 0) + points
+        new = self._writes[key] = old + points
+        return old, new
+
+    def __contains__(self, key: Any) -> bool:
+        if key in self._writes:
+            return True
+        return key not in self._deleted and key in self.base
+
+    def __iter__(self) -> Iterator[Any]:
+        for key in self.base:
+            if key not in self._deleted and key not in self._writes:
+                yield key
+        yield from self._writes
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = self._writes.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if key in self._deleted:
+            return default
+        return self.base.get(key, default)
+
+    def commit(self) -> None:
+        """Applies the buffered deletions and writes to the base mapping in bulk."""
+        base = self.base
+        for key in self._deleted:
+            base.pop(key, None)
+        increments = self._increments
+        if increments:
+            base.update((key, value) for key, value in self._writes.items() if key not in increments)
+            for key, points in increments.items():
+                base.increment(key, points)
+            self._increments = {}
+        else:
+            base.update(self._writes)
+        self._writes = {}
+        self._deleted = set()
+
+
+class Transaction:
+    """Redirects an engine's score and plugin-state writes into delta overlays until commit or rollback."""
+
+    def __init__(self, engine: Any, parent: Optional["Transaction"] = None):
+        self.engine = engine
+        self.parent = parent
+        self._scores = DeltaOverlay(engine._scores)
+        self._plugin_state: List[Tuple[BasePlugin, str, DeltaOverlay]] = []
+        # Plugins registered in the transaction with the plugin of the same name they replaced.
+        self._new_plugins: List[Tuple[BasePlugin, Optional[BasePlugin]]] = []
+        # Score changes to hand to engine listeners once the outermost transaction commits.
+        self.changes: List[Tuple[str, Any, Any, Any]] = []
+        # Event ids applied in the transaction, remembered by the engine only if it commits.
+        self.event_ids: Set[Hashable] = set()
+        engine._scores = self._scores
+        for plugin in engine._plugins.values():
+            self._wrap_plugin_state(plugin)
+
+    def _wrap_plugin_state(self, plugin: BasePlugin) -> None:
+        for attribute in getattr(type(plugin), "state_attributes", ()):
+            overlay = DeltaOverlay(getattr(plugin, attribute))
+            setattr(plugin, attribute, overlay)
+            self._plugin_state.append((plugin, attribute, overlay))
+
+    def track_plugin(self, plugin: BasePlugin, previous: Optional[BasePlugin] = None) -> None:
+        """Tracks a plugin registered while the transaction is open and the plugin it replaced, if any."""
+        self._new_plugins.append((plugin, previous))
+        self._wrap_plugin_state(plugin)
+
+    def has_event(self, event_id: Hashable) -> bool:
+        """Returns True if this or an enclosing transaction applied the event id."""
+        transaction: Optional[Transaction] = self
+        while transaction is not None:
+            if event_id in transaction.event_ids:
+                return True
+            transaction = transaction.parent
+        return False
+
+    def _unwrap(self) -> None:
+        self.engine._scores = self._scores.base
+        for plugin, attribute, overlay in self._plugin_state:
+            setattr(plugin, attribute, overlay.base)
+
+    def commit(self) -> None:
+        """Applies all buffered writes to the enclosing state in one pass."""
+        self._scores.commit()
+        for _, _, overlay in self._plugin_state:
+            overlay.commit()
+        self._unwrap()
+        if self.parent is not None:
+            for plugin, previous in self._new_plugins:
+                self.parent.track_plugin(plugin, previous)
+            self.parent.changes.extend(self.changes)
+            self.parent.event_ids.update(self.event_ids)
+        elif self.event_ids:
+            add = self.engine.deduplicator.add
+            for event_id in self.event_ids:
+                add(event_id)
+
+    def rollback(self) -> None:
+        """Discards all buffered writes and plugins registered during the transaction.
+
+        Plugins that replaced a plugin of the same name are swapped back for it.
+        """
+        self._unwrap()
+        plugins = self.engine._plugins
+        # Newest first, so a name replaced several times ends up with its original plugin.
+        for plugin, previous in reversed(self._new_plugins):
+            if plugins.get(plugin.name) is plugin:
+                if previous is None:
+                    del plugins[plugin.name]
+                else:
+                    plugins[plugin.name] = previous
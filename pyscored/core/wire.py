@@ -0,0 +1,450 @@
+# pyscored/core/wire.py
+"""
+Compact binary wire format for score events and snapshots.
+
+A stream is a sequence of self-delimiting frames. Every frame starts with a
+9-byte little-endian header::
+
+    magic   2s   b"PW"
+    version u8   WIRE_VERSION
+    kind    u8   EVENTS, SNAPSHOT or DELTA
+    flags   u8   value encoding (bits 0-1), SORTED (bit 2), RESET (bit 3)
+    length  u32  byte length of the body
+
+followed by the body::
+
+    varint  sequence        caller-defined, e.g. a replication sequence number
+    varint  name_count      player ids appended to the session string table
+    column  name lengths    byte length of each new player id (unsigned)
+    bytes   names           the new player ids, UTF-8, concatenated
+    varint  record_count
+    varint* refs            table index per record (EVENTS and DELTA frames only)
+    values                  one value per record
+    varint  removed_count   (DELTA frames only)
+    varint* removed refs    (DELTA frames only)
+
+Player ids are sent once per session and referenced afterwards by their
+varint-encoded position in a string table that the encoder and decoder build
+in step. SNAPSHOT frames carry their records in table order, so they need no
+refs at all; the first frame of a snapshot has the RESET flag and starts a new
+table. A column is a width byte (1, 2, 4 or 8) followed by the packed
+little-endian unsigned integers, using the narrowest width that fits.
+
+Values are int64 (fixed-point scores), floats that are all whole numbers
+(carried as integers and decoded as floats) or float64. Float64 values are a
+column of width 8. Integer values are delta-encoded as an int64 base (the
+smallest value) and a column of offsets from it. Encoders may sort records by
+value and set the SORTED flag, in which case each offset is relative to the
+previous value instead; neighbouring scores are close, so the offsets usually
+fit in a single byte.
+"""
+
+import struct
+import sys
+from array import array
+from itertools import accumulate, islice, repeat
+from operator import add, itemgetter, sub
+from typing import Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+from pyscored.core.snapshot import ScoreSnapshot
+
+Score = Union[int, float]
+
+MAGIC = b"PW"
+WIRE_VERSION = 1
+
+EVENTS = 1
+SNAPSHOT = 2
+DELTA = 3
+
+VALUES_INT = 0
+VALUES_WHOLE_FLOAT = 1
+VALUES_FLOAT64 = 2
+SORTED = 0x04
+RESET = 0x08
+
+_HEADER = struct.Struct("<2sBBBI")
+_BASE = struct.Struct("<q")
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+_UNSIGNED = {1: "B", 2: "H", 4: "I", 8: "Q"}
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class WireError(ValueError):
+    """Raised when a buffer does not hold a valid frame."""
+
+
+class Frame(NamedTuple):
+    """A decoded frame: parallel player id and value lists and, for DELTA frames, removed player ids."""
+
+    kind: int
+    sequence: int
+    player_ids: List[str]
+    values: List[Score]
+    removed: List[str]
+    reset: bool = False
+
+    @property
+    def entries(self) -> List[Tuple[str, Score]]:
+        """The records as ``(player_id, value)`` pairs."""
+        return list(zip(self.player_ids, self.values))
+
+
+def _put_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _get_varint(view: memoryview, offset: int) -> Tuple[int, int]:
+    try:
+        byte = view[offset]
+        result = byte & 0x7F
+        shift = 7
+        offset += 1
+        while byte & 0x80:
+            byte = view[offset]
+            result |= (byte & 0x7F) << shift
+            shift += 7
+            offset += 1
+    except IndexError:
+        raise WireError("Truncated varint.") from None
+    return result, offset
+
+
+def _put_column(out: bytearray, values: Sequence[int]) -> None:
+    high = max(values) if values else 0
+    width = next((width for width in (1, 2, 4, 8) if high < 1 << (8 * width)), None)
+    if width is None:
+        raise WireError("Value does not fit in 64 bits.")
+    packed = array(_UNSIGNED[width], values)
+    if not _LITTLE_ENDIAN:
+        packed.byteswap()
+    out.append(width)
+    out += packed
+
+
+def _get_column(view: memoryview, offset: int, count: int, typecodes: Dict[int, str]) -> Tuple[Sequence, int]:
+    if offset >= len(view):
+        raise WireError("Truncated column.")
+    width = view[offset]
+    typecode = typecodes.get(width)
+    if typecode is None:
+        raise WireError(f"Invalid column width {width}.")
+    start = offset + 1
+    end = start + count * width
+    if end > len(view):
+        raise WireError("Truncated column.")
+    if _LITTLE_ENDIAN:
+        # Reinterpret the frame's bytes in place instead of copying them into an array.
+        return view[start:end].cast(typecode), end
+    column = array(typecode, view[start:end])
+    column.byteswap()
+    return column, end
+
+
+def _integers(values: Sequence[Score]) -> Optional[Sequence[int]]:
+    """Returns the values as int64 integers, or None when they are not all whole numbers in range."""
+    if set(map(type, values)) <= {int}:
+        integers = values
+    else:
+        try:
+            integers = list(map(int, values))
+        except (OverflowError, ValueError):
+            return None
+        if list(map(float, integers)) != list(values):
+            return None
+    if integers and (min(integers) < _INT64_MIN or max(integers) > _INT64_MAX):
+        if integers is values:
+            raise WireError("Integer scores must fit in 64 bits.")
+        return None
+    return integers
+
+
+class WireEncoder:
+    """Encodes score events and snapshots into frames, remembering which player ids were already sent.
+
+    One encoder serves one stream; its frames must be decoded in order by a single
+    WireDecoder.
+    """
+
+    def __init__(self):
+        self._refs: Dict[str, int] = {}
+        # Player ids sent by snapshot frames, indexed only once an event or delta frame needs them.
+        self._unindexed: List[str] = []
+
+    def _frame(self, kind: int, flags: int, sequence: int, names: Sequence[str], body: bytearray) -> bytes:
+        head = bytearray()
+        _put_varint(head, sequence)
+        _put_varint(head, len(names))
+        if names:
+            text = "".join(names)
+            blob = text.encode("utf-8")
+            if len(blob) == len(text):
+                lengths = list(map(len, names))
+            else:
+                encoded = [name.encode("utf-8") for name in names]
+                lengths = list(map(len, encoded))
+                blob = b"".join(encoded)
+            _put_column(head, lengths)
+            head += blob
+        size = len(head) + len(body)
+        return _HEADER.pack(MAGIC, WIRE_VERSION, kind, flags, size) + head + body
+
+    def _intern(self, player_ids: Iterable[str], out: bytearray, new: List[str]) -> None:
+        refs = self._refs
+        if self._unindexed:
+            refs.update(zip(self._unindexed, range(len(refs), len(refs) + len(self._unindexed))))
+            self._unindexed = []
+        for player_id in player_ids:
+            ref = refs.get(player_id)
+            if ref is None:
+                ref = refs[player_id] = len(refs)
+                new.append(player_id)
+            _put_varint(out, ref)
+
+    @staticmethod
+    def _put_values(out: bytearray, values: Sequence[Score], is_sorted: bool = False) -> int:
+        integers = _integers(values)
+        if integers is None:
+            packed = array("d", values)
+            if not _LITTLE_ENDIAN:
+                packed.byteswap()
+            out.append(8)
+            out += packed
+            return VALUES_FLOAT64
+        encoding = VALUES_INT if integers is values else VALUES_WHOLE_FLOAT
+        if not integers:
+            out += _BASE.pack(0)
+            _put_column(out, integers)
+            return encoding
+        if is_sorted:
+            base = integers[0]
+            out += _BASE.pack(base)
+            _put_column(out, [0, *map(sub, islice(integers, 1, None), integers)])
+            return encoding | SORTED
+        base = min(integers)
+        out += _BASE.pack(base)
+        _put_column(out, list(map(sub, integers, repeat(base))))
+        return encoding
+
+    def encode_events(self, events: Iterable[Tuple[str, Score]], sequence: int = 0) -> bytes:
+        """Encodes ``(player_id, points)`` update events as one EVENTS frame."""
+        events = list(events)
+        body = bytearray()
+        new: List[str] = []
+        _put_varint(body, len(events))
+        self._intern((player_id for player_id, _ in events), body, new)
+        flags = self._put_values(body, [points for _, points in events])
+        return self._frame(EVENTS, flags, sequence, new, body)
+
+    def encode_delta(self, changed: Union[Mapping[str, Score], Iterable[Tuple[str, Score]]],
+                     removed: Iterable[str] = (), sequence: int = 0) -> bytes:
+        """Encodes new scores for changed players and a list of removed players as one DELTA frame."""
+        items = list(changed.items() if isinstance(changed, Mapping) else changed)
+        body = bytearray()
+        new: List[str] = []
+        _put_varint(body, len(items))
+        self._intern((player_id for player_id, _ in items), body, new)
+        flags = self._put_values(body, [score for _, score in items])
+        removed = list(removed)
+        _put_varint(body, len(removed))
+        self._intern(removed, body, new)
+        return self._frame(DELTA, flags, sequence, new, body)
+
+    def iter_snapshot(self, scores: Mapping[str, Score], frame_size: int = 65536, sequence: int = 0,
+                      sort: bool = False) -> Iterator[bytes]:
+        """Encodes a full snapshot as SNAPSHOT frames of at most ``frame_size`` records.
+
+        The first frame resets the string table on both ends, so a snapshot is also a
+        valid starting point for a decoder joining an existing stream. With ``sort``,
+        records are ordered by value, which makes integer scores smaller on the wire
+        at the cost of sorting them first.
+        """
+        if sort:
+            items = sorted(scores.items(), key=itemgetter(1))
+            player_ids = [player_id for player_id, _ in items]
+            values = [value for _, value in items]
+        else:
+            player_ids = list(scores)
+            values = list(scores.values())
+        self._refs = {}
+        self._unindexed = []
+        flags = RESET
+        for start in range(0, max(len(player_ids), 1), frame_size):
+            names = player_ids[start:start + frame_size]
+            self._unindexed.extend(names)
+            body = bytearray()
+            _put_varint(body, len(names))
+            flags |= self._put_values(body, values[start:start + frame_size], sort)
+            yield self._frame(SNAPSHOT, flags, sequence, names, body)
+            flags = 0
+
+    def encode_snapshot(self, scores: Mapping[str, Score], frame_size: int = 65536, sequence: int = 0,
+                        sort: bool = False) -> bytes:
+        """Encodes a full snapshot into one buffer; see ``iter_snapshot``."""
+        return b"".join(self.iter_snapshot(scores, frame_size, sequence, sort))
+
+
+class WireDecoder:
+    """Decodes frames produced by a WireEncoder, either from complete buffers or from a byte stream."""
+
+    def __init__(self):
+        self._names: List[str] = []
+        self._buffer = bytearray()
+
+    def decode(self, data: Union[bytes, bytearray, memoryview]) -> Iterator[Frame]:
+        """Decodes every frame in a buffer holding only complete frames."""
+        view = memoryview(data)
+        offset = 0
+        while offset < len(view):
+            frame, offset = self._decode_frame(view, offset)
+            if frame is None:
+                raise WireError("Truncated frame.")
+            yield frame
+
+    def feed(self, data: Union[bytes, bytearray, memoryview]) -> List[Frame]:
+        """Adds bytes received from a stream and returns the frames completed by them."""
+        buffer = self._buffer
+        buffer += data
+        frames = []
+        offset = 0
+        with memoryview(buffer) as view:
+            while True:
+                frame, end = self._decode_frame(view, offset)
+                if frame is None:
+                    break
+                frames.append(frame)
+                offset = end
+        del buffer[:offset]
+        return frames
+
+    def _decode_frame(self, view: memoryview, offset: int) -> Tuple[Optional[Frame], int]:
+        if len(view) - offset < _HEADER.size:
+            return None, offset
+        magic, version, kind, flags, size = _HEADER.unpack_from(view, offset)
+        if magic != MAGIC:
+            raise WireError("Not a pyscored wire frame.")
+        if version != WIRE_VERSION:
+            raise WireError(f"Unsupported wire format version {version}.")
+        start = offset + _HEADER.size
+        end = start + size
+        if end > len(view):
+            return None, offset
+        body = view[start:end]
+        try:
+            frame = self._decode_body(kind, flags, body)
+        finally:
+            body.release()
+        return frame, end
+
+    def _decode_body(self, kind: int, flags: int, body: memoryview) -> Frame:
+        if flags & RESET:
+            self._names = []
+        names = self._names
+        sequence, offset = _get_varint(body, 0)
+        name_count, offset = _get_varint(body, offset)
+        if name_count:
+            lengths, offset = _get_column(body, offset, name_count, _UNSIGNED)
+            bounds = list(accumulate(lengths, initial=0))
+            end = offset + bounds[-1]
+            if end > len(body):
+                raise WireError("Truncated player ids.")
+            blob = body[offset:end]
+            parts = map(slice, bounds, islice(bounds, 1, None))
+            text = str(blob, "utf-8")
+            if len(text) == len(blob):
+                # ASCII ids: decode the block once and slice the string.
+                names.extend(map(text.__getitem__, parts))
+            else:
+                names.extend(str(blob[part], "utf-8") for part in parts)
+            offset = end
+        count, offset = _get_varint(body, offset)
+        if kind == SNAPSHOT:
+            player_ids = names[len(names) - count:] if name_count == count else None
+            if player_ids is None:
+                raise WireError("Snapshot frames must name every record.")
+        elif kind in (EVENTS, DELTA):
+            refs = []
+            for _ in range(count):
+                ref, offset = _get_varint(body, offset)
+                refs.append(ref)
+            player_ids = self._lookup(refs)
+        else:
+            raise WireError(f"Unknown frame kind {kind}.")
+        values, offset = self._get_values(body, offset, count, flags)
+        removed: List[str] = []
+        if kind == DELTA:
+            removed_count, offset = _get_varint(body, offset)
+            refs = []
+            for _ in range(removed_count):
+                ref, offset = _get_varint(body, offset)
+                refs.append(ref)
+            removed = self._lookup(refs)
+        if offset != len(body):
+            raise WireError("Frame length does not match its contents.")
+        return Frame(kind, sequence, player_ids, values, removed, bool(flags & RESET))
+
+    def _lookup(self, refs: List[int]) -> List[str]:
+        names = self._names
+        try:
+            return [names[ref] for ref in refs]
+        except IndexError:
+            raise WireError("Reference to a player id that was never sent.") from None
+
+    @staticmethod
+    def _get_values(body: memoryview, offset: int, count: int, flags: int) -> Tuple[List[Score], int]:
+        encoding = flags & 0x03
+        if encoding == VALUES_FLOAT64:
+            column, offset = _get_column(body, offset, count, {8: "d"})
+            return column.tolist() if isinstance(column, memoryview) else list(column), offset
+        if encoding not in (VALUES_INT, VALUES_WHOLE_FLOAT):
+            raise WireError(f"Unknown value encoding {encoding}.")
+        if offset + _BASE.size > len(body):
+            raise WireError("Truncated column.")
+        (base,) = _BASE.unpack_from(body, offset)
+        column, offset = _get_column(body, offset + _BASE.size, count, _UNSIGNED)
+        if flags & SORTED:
+            values = list(islice(accumulate(column, initial=base), 1, None))
+        else:
+            values = list(map(add, column, repeat(base)))
+        if encoding == VALUES_WHOLE_FLOAT:
+            values = list(map(float, values))
+        return values, offset
+
+
+def snapshot_diff(old: Mapping[str, Score], new: Mapping[str, Score]) -> Tuple[Dict[str, Score], List[str]]:
+    """Returns ``(changed, removed)`` turning ``old`` into ``new``, ready for ``encode_delta``.
+
+    Plain score snapshots taken from the same store share every segment that was not
+    written in between, so only the segments that differ are compared.
+    """
+    if type(old) is ScoreSnapshot and type(new) is ScoreSnapshot and len(old._segments) == len(new._segments):
+        pairs: Iterable[Tuple[Mapping[str, Score], Mapping[str, Score]]] = [
+            (a, b) for a, b in zip(old._segments, new._segments) if a is not b]
+    else:
+        pairs = [(old, new)]
+    changed: Dict[str, Score] = {}
+    removed: List[str] = []
+    for before, after in pairs:
+        changed.update((player_id, score) for player_id, score in after.items()
+                       if before.get(player_id) != score)
+        removed.extend(player_id for player_id in before if player_id not in after)
+    return changed, removed
+
+
+def dumps_snapshot(scores: Mapping[str, Score], frame_size: int = 65536, sort: bool = False) -> bytes:
+    """Encodes a standalone snapshot."""
+    return WireEncoder().encode_snapshot(scores, frame_size, sort=sort)
+
+
+def loads_snapshot(data: Union[bytes, bytearray, memoryview]) -> Dict[str, Score]:
+    """Decodes a standalone snapshot written by ``dumps_snapshot``."""
+    scores: Dict[str, Score] = {}
+    for frame in WireDecoder().decode(data):
+        if frame.kind != SNAPSHOT:
+            raise WireError("Expected only snapshot frames.")
+        scores.update(zip(frame.player_ids, frame.values))
+    return scores
@@ -5,5 +5,6 @@ This package provides extensibility through plugins that modify scoring behavior
 """
 
 from pyscored.plugins.base_plugin import BasePlugin
+from pyscored.plugins.registry import PluginRegistry, get_registry
 
-__all__ = ["BasePlugin"]
\ No newline at end of file
+__all__ = ["BasePlugin", "PluginRegistry", "get_registry"]
\ No newline at end of file
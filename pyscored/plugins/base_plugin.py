@@ -1,11 +1,15 @@
 # pyscored/plugins/base_plugin.py
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 class BasePlugin(ABC):
     """Abstract base class for plugins extending the Scoring Engine functionalities."""
 
+    # Names of per-player dict attributes holding plugin state. The engine buffers
+    # writes to them inside transactions so they roll back together with scores.
+    state_attributes: Tuple[str, ...] = ()
+
     def __init__(self, name: str):
         self.name = name
         self.engine = None
@@ -0,0 +1,173 @@
+# pyscored/plugins/registry.py
+
+import hashlib
+import importlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Type, Union
+
+from pyscored.plugins.base_plugin import BasePlugin
+
+ENTRY_POINT_GROUP = "pyscored.plugins"
+MANIFEST_VERSION = 1
+
+# Plugins shipped with pyscored. They are also declared as entry points in
+# pyproject.toml, but listing them here keeps them available when running
+# from a source checkout that was never installed.
+BUILTIN_PLUGINS: Dict[str, str] = {
+    "combo_bonus": "pyscored.plugins.combo_bonus_plugin:ComboBonusPlugin",
+    "streak_reward": "pyscored.plugins.streak_reward_plugin:StreakRewardPlugin",
+    "time_decay": "pyscored.plugins.time_decay_plugin:TimeDecayPlugin",
+}
+
+
+def default_cache_dir() -> Path:
+    """Returns the directory used for pyscored's on-disk caches."""
+    if os.environ.get("PYSCORED_CACHE_DIR"):
+        return Path(os.environ["PYSCORED_CACHE_DIR"])
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "pyscored"
+
+
+def _environment_fingerprint(group: str) -> str:
+    """Fingerprints the import path cheaply, using directory mtimes instead of reading distribution metadata."""
+    digest = hashlib.sha256()
+    digest.update(f"{MANIFEST_VERSION}:{group}:{sys.version}".encode())
+    for entry in sys.path:
+        try:
+            mtime = os.stat(entry or ".").st_mtime_ns
+        except OSError:
+            mtime = -1
+        digest.update(f"\0{entry}\0{mtime}".encode())
+    return digest.hexdigest()
+
+
+def _scan_entry_points(group: str) -> Dict[str, str]:
+    """Scans installed distributions for plugin entry points without importing them."""
+    from importlib import metadata
+
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        selected = entry_points.select(group=group)
+    else:  # Python < 3.10 returns a dict keyed by group
+        selected = entry_points.get(group, [])
+    return {entry_point.name: entry_point.value for entry_point in selected}
+
+
+def _import_target(target: str) -> Any:
+    """Imports an object from a ``module:attribute`` reference."""
+    module_name, _, attribute_path = target.partition(":")
+    obj: Any = importlib.import_module(module_name)
+    for attribute in filter(None, attribute_path.split(".")):
+        obj = getattr(obj, attribute)
+    return obj
+
+
+class PluginRegistry:
+    """Discovers plugins through package entry points and loads plugin classes only when first used."""
+
+    def __init__(
+        self,
+        group: str = ENTRY_POINT_GROUP,
+        cache_dir: Optional[Union[str, Path]] = None,
+        use_cache: bool = True,
+    ):
+        self.group = group
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self._use_cache = use_cache
+        self._targets: Optional[Dict[str, str]] = None
+        self._classes: Dict[str, Type[BasePlugin]] = {}
+
+    @property
+    def manifest_path(self) -> Path:
+        """Location of the cached discovery manifest."""
+        return self._cache_dir / f"{self.group}.manifest.json"
+
+    def _discover(self) -> Dict[str, str]:
+        if self._targets is None:
+            targets = dict(BUILTIN_PLUGINS)
+            targets.update(self._load_manifest())
+            self._targets = targets
+        return self._targets
+
+    def _load_manifest(self) -> Dict[str, str]:
+        fingerprint = _environment_fingerprint(self.group)
+        if self._use_cache:
+            try:
+                manifest = json.loads(self.manifest_path.read_text())
+                if manifest.get("fingerprint") == fingerprint:
+                    return dict(manifest["plugins"])
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+        plugins = _scan_entry_points(self.group)
+        if self._use_cache:
+            self._write_manifest(fingerprint, plugins)
+        return plugins
+
+    def _write_manifest(self, fingerprint: str, plugins: Dict[str, str]) -> None:
+        payload = {"version": MANIFEST_VERSION, "fingerprint": fingerprint, "plugins": plugins}
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(payload, sort_keys=True))
+            os.replace(tmp_path, self.manifest_path)
+        except OSError:
+            # A read-only cache location only costs a re-scan on the next startup.
+            pass
+
+    def refresh(self) -> None:
+        """Forgets discovered plugins and re-scans installed distributions."""
+        self._targets = None
+        self._classes.clear()
+        try:
+            self.manifest_path.unlink()
+        except OSError:
+            pass
+
+    def register(self, plugin_type: str, target: Union[str, Type[BasePlugin]]) -> None:
+        """Registers a plugin type by ``module:Class`` reference or by class."""
+        targets = self._discover()
+        if isinstance(target, str):
+            targets[plugin_type] = target
+            self._classes.pop(plugin_type, None)
+        else:
+            targets[plugin_type] = f"{target.__module__}:{target.__qualname__}"
+            self._classes[plugin_type] = target
+
+    def names(self) -> List[str]:
+        """Lists the names of all discoverable plugin types."""
+        return sorted(self._discover())
+
+    def __contains__(self, plugin_type: str) -> bool:
+        return plugin_type in self._discover()
+
+    def load(self, plugin_type: str) -> Type[BasePlugin]:
+        """Imports and returns the plugin class registered under the given name."""
+        plugin_class = self._classes.get(plugin_type)
+        if plugin_class is not None:
+            return plugin_class
+        targets = self._discover()
+        if plugin_type not in targets:
+            raise ValueError(f"Plugin type '{plugin_type}' is not available.")
+        plugin_class = _import_target(targets[plugin_type])
+        if not (isinstance(plugin_class, type) and issubclass(plugin_class, BasePlugin)):
+            raise TypeError(f"Plugin type '{plugin_type}' does not refer to a BasePlugin subclass.")
+        self._classes[plugin_type] = plugin_class
+        return plugin_class
+
+    def create(self, plugin_type: str, name: Optional[str] = None, **params: Any) -> BasePlugin:
+        """Instantiates a plugin by type name, defaulting the instance name to the type name."""
+        return self.load(plugin_type)(name=name or plugin_type, **params)
+
+
+_default_registry: Optional[PluginRegistry] = None
+
+
+def get_registry() -> PluginRegistry:
+    """Returns the process-wide plugin registry."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = PluginRegistry()
+    return _default_registry
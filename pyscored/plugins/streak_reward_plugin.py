@@ -0,0 +1,34 @@
+# pyscored/plugins/streak_reward_plugin.py
+
+from pyscored.plugins.base_plugin import BasePlugin
+
+
+class StreakRewardPlugin(BasePlugin):
+    """Plugin that awards special rewards when a player reaches a specific streak of successful actions."""
+
+    state_attributes = ("streak_counts",)
+
+    def __init__(self, name: str, reward_streak: int, reward_points: float):
+        super().__init__(name)
+        self.reward_streak = reward_streak
+        self.reward_points = reward_points
+        self.streak_counts = {}
+
+    def execute(self, player_id: str, action_successful: bool) -> None:
+        """Awards special reward points based on achieving a successful action streak."""
+        if action_successful:
+            self.streak_counts[player_id] = self.streak_counts.get(player_id, 0) + 1
+        else:
+            self.streak_counts[player_id] = 0
+
+        if self.streak_counts[player_id] == self.reward_streak:
+            self.engine.update_score(player_id, self.reward_points)
+            self.streak_counts[player_id] = 0  # reset streak after reward
+
+    def config(self) -> dict:
+        base_config = super().config()
+        base_config.update({
+            "reward_streak": self.reward_streak,
+            "reward_points": self.reward_points
+        })
+        return base_config
@@ -0,0 +1,15 @@
+"""
+Storage backends for the pyscored library.
+
+This package defines the score store protocol the engine talks to and ships
+in-memory, compact array, SQLite, tiered hot/cold and shared-memory implementations.
+"""
+
+from pyscored.storage.array import ArrayStore
+from pyscored.storage.base import ScoreStore
+from pyscored.storage.memory import InMemoryStore
+from pyscored.storage.shared import SharedMemoryStore
+from pyscored.storage.sqlite import SQLiteStore
+from pyscored.storage.tiered import TieredStore
+
+__all__ = ["ScoreStore", "InMemoryStore", "ArrayStore", "SQLiteStore", "TieredStore", "SharedMemoryStore"]
@@ -0,0 +1,185 @@
+# pyscored/storage/array.py
+
+import threading
+from array import array
+from collections import deque
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from pyscored.core.snapshot import ScoreSnapshot
+from pyscored.storage.base import ScoreStore
+
+
+class ArraySnapshot(ScoreSnapshot):
+    """Immutable point-in-time view over an ArrayStore's index segments and value chunks."""
+
+    def __init__(self, segments: Tuple[Dict[str, int], ...], chunks: Tuple[array, ...],
+                 chunk_bits: int, version: int = 0, slots: Optional[int] = None):
+        super().__init__(segments, version)
+        self._chunks = chunks
+        self._chunk_bits = chunk_bits
+        self._chunk_mask = (1 << chunk_bits) - 1
+        self.slots = len(chunks) << chunk_bits if slots is None else slots
+        self._slot_ids: Optional[List[Optional[str]]] = None
+
+    def __getitem__(self, player_id: str) -> Any:
+        slot = self._segments[hash(player_id) & self._mask][player_id]
+        return self._chunks[slot >> self._chunk_bits][slot & self._chunk_mask]
+
+    def get(self, player_id: str, default: Any = None) -> Any:
+        slot = self._segments[hash(player_id) & self._mask].get(player_id)
+        if slot is None:
+            return default
+        return self._chunks[slot >> self._chunk_bits][slot & self._chunk_mask]
+
+    def items(self) -> Iterable[Tuple[str, Any]]:  # type: ignore[override]
+        chunks, bits, mask = self._chunks, self._chunk_bits, self._chunk_mask
+        return ((player_id, chunks[slot >> bits][slot & mask])
+                for segment in self._segments for player_id, slot in segment.items())
+
+    def values(self) -> Iterable[Any]:  # type: ignore[override]
+        return (value for _, value in self.items())
+
+    def columns(self) -> List[array]:
+        """The value chunks cut to the allocated slots; free slots hold zero."""
+        chunks = list(self._chunks)
+        if chunks:
+            used = self.slots - ((len(chunks) - 1) << self._chunk_bits)
+            if used < len(chunks[-1]):
+                chunks[-1] = chunks[-1][:used]
+        return chunks
+
+    def slot_ids(self) -> List[Optional[str]]:
+        """Player id of every allocated slot in slot order, None for free slots; built once per snapshot."""
+        if self._slot_ids is None:
+            ids: List[Optional[str]] = [None] * self.slots
+            for segment in self._segments:
+                # Scatter ids to their slots without a Python-level loop.
+                deque(map(ids.__setitem__, segment.values(), segment.keys()), maxlen=0)
+            self._slot_ids = ids
+        return self._slot_ids
+
+
+class ArrayStore(ScoreStore):
+    """Compact score store keeping unboxed values in typed arrays, addressed through a slot index.
+
+    Values live in fixed-size ``array`` chunks (``"q"`` for int64 fixed-point scores,
+    ``"d"`` for floats) instead of one boxed Python object per player. Both the index
+    segments and the value chunks are copied on write after a snapshot, so snapshots
+    stay O(segments + chunks) to take.
+    """
+
+    def __init__(self, typecode: str = "d", chunk_size: int = 4096, segments: int = 64):
+        if typecode not in ("q", "d"):
+            raise ValueError("ArrayStore supports the 'q' (int64) and 'd' (float64) typecodes.")
+        for name, value in (("chunk_size", chunk_size), ("segments", segments)):
+            if value < 1 or value & (value - 1):
+                raise ValueError(f"The {name} must be a power of two.")
+        self.typecode = typecode
+        self._zero = 0 if typecode == "q" else 0.0
+        self._chunk_size = chunk_size
+        self._chunk_bits = chunk_size.bit_length() - 1
+        self._chunk_mask = chunk_size - 1
+        self._segments: List[Dict[str, int]] = [{} for _ in range(segments)]
+        self._segments_shared = [False] * segments
+        self._mask = segments - 1
+        self._chunks: List[array] = []
+        self._chunks_shared: List[bool] = []
+        self._next_slot = 0
+        self._free: List[int] = []
+        self._lock = threading.Lock()
+        self._version = 0
+        self._last_snapshot: Optional[ArraySnapshot] = None
+
+    def _writable_segment(self, index: int) -> Dict[str, int]:
+        # Callers hold self._lock.
+        if self._segments_shared[index]:
+            self._segments[index] = dict(self._segments[index])
+            self._segments_shared[index] = False
+        return self._segments[index]
+
+    def _writable_chunk(self, index: int) -> array:
+        # Callers hold self._lock.
+        if self._chunks_shared[index]:
+            self._chunks[index] = array(self.typecode, self._chunks[index])
+            self._chunks_shared[index] = False
+        return self._chunks[index]
+
+    def _allocate(self) -> int:
+        if self._free:
+            return self._free.pop()
+        slot = self._next_slot
+        if slot >> self._chunk_bits == len(self._chunks):
+            self._chunks.append(array(self.typecode, [self._zero]) * self._chunk_size)
+            self._chunks_shared.append(False)
+        self._next_slot += 1
+        return slot
+
+    def _set(self, player_id: str, score: Any) -> None:
+        # Callers hold self._lock.
+        segment_index = hash(player_id) & self._mask
+        slot = self._segments[segment_index].get(player_id)
+        if slot is None:
+            slot = self._allocate()
+            self._writable_segment(segment_index)[player_id] = slot
+        self._writable_chunk(slot >> self._chunk_bits)[slot & self._chunk_mask] = score
+
+    def __getitem__(self, player_id: str) -> Any:
+        slot = self._segments[hash(player_id) & self._mask][player_id]
+        return self._chunks[slot >> self._chunk_bits][slot & self._chunk_mask]
+
+    def get(self, player_id: str, default: Any = None) -> Any:
+        slot = self._segments[hash(player_id) & self._mask].get(player_id)
+        if slot is None:
+            return default
+        return self._chunks[slot >> self._chunk_bits][slot & self._chunk_mask]
+
+    def __setitem__(self, player_id: str, score: Any) -> None:
+        with self._lock:
+            self._set(player_id, score)
+            self._version += 1
+
+    def __delitem__(self, player_id: str) -> None:
+        segment_index = hash(player_id) & self._mask
+        with self._lock:
+            slot = self._writable_segment(segment_index).pop(player_id)
+            self._writable_chunk(slot >> self._chunk_bits)[slot & self._chunk_mask] = self._zero
+            self._free.append(slot)
+            self._version += 1
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self._segments[hash(player_id) & self._mask]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.snapshot())
+
+    def __len__(self) -> int:
+        return sum(map(len, self._segments))
+
+    def update(self, other: Any = (), **kwargs: Any) -> None:
+        """Applies many writes under a single lock acquisition."""
+        items = other.items() if isinstance(other, Mapping) else other
+        with self._lock:
+            for player_id, score in chain(items, kwargs.items()):
+                self._set(player_id, score)
+            self._version += 1
+
+    def total(self) -> Any:
+        """Sums every stored score with C-level array arithmetic; exact for the int64 typecode."""
+        # Free and unallocated slots hold zero, so whole chunks can be summed.
+        return sum(map(sum, self._chunks), self._zero)
+
+    @property
+    def version(self) -> int:
+        """Counter that increases with every committed write."""
+        return self._version
+
+    def snapshot(self) -> ArraySnapshot:
+        """Returns an immutable view of the current scores without copying them."""
+        with self._lock:
+            if self._last_snapshot is None or self._last_snapshot.version != self._version:
+                self._last_snapshot = ArraySnapshot(tuple(self._segments), tuple(self._chunks),
+                                                    self._chunk_bits, self._version, self._next_slot)
+                self._segments_shared = [True] * len(self._segments)
+                self._chunks_shared = [True] * len(self._chunks)
+            return self._last_snapshot
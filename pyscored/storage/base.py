@@ -0,0 +1,64 @@
+# pyscored/storage/base.py
+
+from abc import abstractmethod
+from typing import Any, Iterator, MutableMapping, Tuple
+
+from pyscored.core.snapshot import ScoreSnapshot
+
+
+class ScoreStore(MutableMapping):
+    """Storage backend protocol the ScoringEngine keeps player scores in.
+
+    Backends are mutable mappings of player ids to scores. Persistent backends may
+    buffer writes; ``flush`` makes them durable and ``close`` releases resources.
+    """
+
+    # Whether ``increment`` is atomic with respect to other writers of the same store;
+    # the engine then routes ``update_score`` through it outside transactions.
+    atomic_increment = False
+
+    @abstractmethod
+    def __getitem__(self, player_id: str) -> float:
+        ...
+
+    @abstractmethod
+    def __setitem__(self, player_id: str, score: float) -> None:
+        ...
+
+    @abstractmethod
+    def __delitem__(self, player_id: str) -> None:
+        ...
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[str]:
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    def increment(self, player_id: str, points: Any) -> Tuple[Any, Any]:
+        """Adds points to a stored score and returns ``(old, new)``."""
+        old = self[player_id]
+        new = self[player_id] = old + points
+        return old, new
+
+    def snapshot(self) -> ScoreSnapshot:
+        """Returns an immutable point-in-time view of the stored scores."""
+        return ScoreSnapshot.from_mapping(self)
+
+    def attach(self, engine: Any) -> None:
+        """Called with the engine that uses the store; backends may keep it to reach plugin state."""
+
+    def flush(self) -> None:
+        """Persists any buffered writes."""
+
+    def close(self) -> None:
+        """Flushes buffered writes and releases backend resources."""
+        self.flush()
+
+    def __enter__(self) -> "ScoreStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
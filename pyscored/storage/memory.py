@@ -0,0 +1,117 @@
+# pyscored/storage/memory.py
+
+import threading
+from itertools import chain
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+from pyscored.core.snapshot import ScoreSnapshot
+from pyscored.storage.base import ScoreStore
+
+
+class InMemoryStore(ScoreStore):
+    """In-memory score store split into hash segments that are copied on write once a snapshot shares them.
+
+    Taking a snapshot costs O(segments): it hands out references to the current
+    segment dicts and marks them shared. The first write to a shared segment copies
+    only that segment, so writers never copy the whole map and readers of a snapshot
+    never observe later writes.
+
+    The number of segments doubles whenever a segment grows past ``segment_size``
+    players, so the copy a write pays after a snapshot stays bounded by the segment
+    size instead of growing with the store (about 1000 segments at a million players).
+    """
+
+    def __init__(self, segments: int = 64, segment_size: int = 1024):
+        if segments < 1 or segments & (segments - 1):
+            raise ValueError("The number of segments must be a power of two.")
+        if segment_size < 1:
+            raise ValueError("segment_size must be at least 1.")
+        self._segments: List[Dict[str, float]] = [{} for _ in range(segments)]
+        self._shared = [False] * segments
+        self._mask = segments - 1
+        # Segments are split once one holds twice the target size; hashing keeps them even.
+        self._split_at = 2 * segment_size
+        self._lock = threading.Lock()
+        self._version = 0
+        self._last_snapshot: Optional[ScoreSnapshot] = None
+
+    def _writable(self, index: int) -> Dict[str, float]:
+        # Callers hold self._lock.
+        if self._shared[index]:
+            self._segments[index] = dict(self._segments[index])
+            self._shared[index] = False
+        return self._segments[index]
+
+    def _grow(self) -> None:
+        # Callers hold self._lock. Builds new segment dicts, so snapshots keep the old ones.
+        count = len(self._segments) * 2
+        mask = count - 1
+        segments: List[Dict[str, float]] = [{} for _ in range(count)]
+        for segment in self._segments:
+            for player_id, score in segment.items():
+                segments[hash(player_id) & mask][player_id] = score
+        self._shared = [False] * count
+        self._mask = mask
+        # Lock-free readers derive the mask from the list they read, so this swap is atomic for them.
+        self._segments = segments
+
+    def __getitem__(self, player_id: str) -> float:
+        segments = self._segments
+        return segments[hash(player_id) & (len(segments) - 1)][player_id]
+
+    def __setitem__(self, player_id: str, score: float) -> None:
+        with self._lock:
+            segment = self._writable(hash(player_id) & self._mask)
+            segment[player_id] = score
+            self._version += 1
+            if len(segment) > self._split_at:
+                self._grow()
+
+    def __delitem__(self, player_id: str) -> None:
+        with self._lock:
+            del self._writable(hash(player_id) & self._mask)[player_id]
+            self._version += 1
+
+    def __contains__(self, player_id: object) -> bool:
+        segments = self._segments
+        return player_id in segments[hash(player_id) & (len(segments) - 1)]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.snapshot())
+
+    def __len__(self) -> int:
+        return sum(map(len, self._segments))
+
+    @property
+    def segments(self) -> int:
+        """Current number of hash segments."""
+        return len(self._segments)
+
+    def get(self, player_id: str, default: Any = None) -> Any:
+        segments = self._segments
+        return segments[hash(player_id) & (len(segments) - 1)].get(player_id, default)
+
+    def update(self, other: Any = (), **kwargs: float) -> None:
+        """Applies many writes under a single lock acquisition."""
+        items = other.items() if isinstance(other, Mapping) else other
+        split_at = self._split_at
+        with self._lock:
+            for player_id, score in chain(items, kwargs.items()):
+                segment = self._writable(hash(player_id) & self._mask)
+                segment[player_id] = score
+                if len(segment) > split_at:
+                    self._grow()
+            self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Counter that increases with every committed write."""
+        return self._version
+
+    def snapshot(self) -> ScoreSnapshot:
+        """Returns an immutable view of the current scores without copying them."""
+        with self._lock:
+            if self._last_snapshot is None or self._last_snapshot.version != self._version:
+                self._last_snapshot = ScoreSnapshot(tuple(self._segments), self._version)
+                self._shared = [True] * len(self._segments)
+            return self._last_snapshot
@@ -0,0 +1,400 @@
+# pyscored/storage/shared.py
+
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Iterator, List, Optional, Tuple
+
+from pyscored.core.snapshot import ScoreSnapshot
+from pyscored.storage.base import ScoreStore
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+_MAGIC = 0x5053434F52454432  # "PSCORED2"
+# magic, capacity, key_size, table_size, next_slot, free_head, count, typecode, stripes, index_seq
+_HEADER = struct.Struct("<10q")
+_NEXT_SLOT, _FREE_HEAD, _COUNT, _INDEX_SEQ = 32, 40, 48, 72
+_INT = struct.Struct("<q")
+# Index entries: 0 is empty, otherwise hash bits above _SLOT_BITS and slot + 1 below.
+_SLOT_BITS = 40
+_SLOT_MASK = (1 << _SLOT_BITS) - 1
+_TAG_MASK = 0x7FFFFF
+# Lock-free readers spin this many times before sleeping, and give up after _STALL_TIMEOUT
+# seconds: a slot or the index that stays mid-write that long belongs to a writer that died.
+_SPINS = 64
+_MAX_SLEEP = 0.001
+_STALL_TIMEOUT = 1.0
+
+
+def _pause(attempt: int, started: float, what: str) -> float:
+    """Backs off a reader waiting for a writer and returns when it started waiting."""
+    if attempt <= _SPINS:
+        return started
+    now = time.monotonic()
+    if not started:
+        started = now
+    elif now - started > _STALL_TIMEOUT:
+        raise TimeoutError(f"{what} has been mid-write for over {_STALL_TIMEOUT}s; a writer probably died.")
+    time.sleep(min(_MAX_SLEEP, 1e-6 * (1 << min(attempt - _SPINS, 10))))
+    return started
+
+
+def _open_segment(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        # Before Python 3.13 opening a segment registers the segment to be unlinked when this process exits.
+        segment = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(segment._name, "shared_memory")  # type: ignore[attr-defined]
+        return segment
+
+
+class _RangeLock:
+    """Exclusive lock on one byte of a lock file: between processes through ``fcntl`` and
+    between the threads of a process through a thread lock.
+
+    The file is found by name, so unrelated processes can share it, and the operating
+    system releases the locks of a process that dies.
+    """
+
+    __slots__ = ("_fd", "_offset", "_thread_lock")
+
+    def __init__(self, fd: int, offset: int):
+        self._fd = fd
+        self._offset = offset
+        self._thread_lock = threading.Lock()
+
+    def __enter__(self) -> None:
+        self._thread_lock.acquire()
+        try:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, self._offset)
+        except BaseException:
+            self._thread_lock.release()
+            raise
+
+    def __exit__(self, *exc_info: Any) -> None:
+        fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, self._offset)
+        self._thread_lock.release()
+
+
+class SharedMemoryStore(ScoreStore):
+    """Score store in a ``multiprocessing.shared_memory`` segment shared by web server workers.
+
+    The segment holds a fixed-capacity table of slots (sequence counter, score, UTF-8
+    player id of at most ``key_size`` bytes) and an open-addressing index from player
+    id hashes to slots. Workers forked after the store is created (e.g. gunicorn
+    ``--preload``) use it directly; workers started on their own (uvicorn
+    ``--workers``, gunicorn without ``--preload``) open it with ``from_name(name)``.
+
+    Reads take no lock: each slot is a seqlock whose counter is odd while a write is in
+    progress, and a reader retries until it sees the same even counter before and
+    after copying the slot, spinning briefly and then backing off. Writers serialize
+    per slot on one of ``stripes`` locks, and adding or removing players additionally
+    takes one index lock. The locks are byte-range locks on a lock file named after the
+    segment in ``lock_dir``, so every process can reach them by name and the operating
+    system releases them if a worker dies. Removing a player deletes its index entry
+    by shifting the rest of its probe run back, so the index never accumulates
+    tombstones. ``increment`` is atomic across workers, and the engine uses it for
+    ``update_score``; a transaction records the points it adds and commits them with
+    ``increment`` too, so concurrent increments from other workers are never
+    overwritten. Scores assigned in a transaction are written as final values.
+
+    The segment and lock file are removed when the creating process closes the store.
+    Locking needs ``fcntl``, so the store is POSIX-only.
+    """
+
+    atomic_increment = True
+
+    def __init__(self, capacity: int = 1_000_000, key_size: int = 56, typecode: str = "d",
+                 stripes: int = 64, name: Optional[str] = None, lock_dir: Optional[str] = None):
+        if fcntl is None:
+            raise RuntimeError("SharedMemoryStore requires fcntl file locks (POSIX).")
+        if typecode not in ("q", "d"):
+            raise ValueError("SharedMemoryStore supports the 'q' (int64) and 'd' (float64) typecodes.")
+        if capacity < 1 or capacity > _SLOT_MASK:
+            raise ValueError(f"capacity must be between 1 and {_SLOT_MASK}.")
+        if stripes < 1 or stripes & (stripes - 1):
+            raise ValueError("The stripes must be a power of two.")
+        key_size = -(-key_size // 8) * 8
+        table_size = 1 << (2 * capacity - 1).bit_length()
+        size = _HEADER.size + capacity * (struct.calcsize(f"<q{typecode}q") + key_size) + 8 * table_size
+        segment = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _HEADER.pack_into(segment.buf, 0, _MAGIC, capacity, key_size, table_size, 0, -1, 0, ord(typecode),
+                          stripes, 0)
+        try:
+            self._setup(segment, lock_dir, create=True)
+        except BaseException:
+            segment.close()
+            segment.unlink()
+            raise
+
+    @classmethod
+    def from_name(cls, name: str, lock_dir: Optional[str] = None) -> "SharedMemoryStore":
+        """Opens a store that another process created under ``name``."""
+        if fcntl is None:
+            raise RuntimeError("SharedMemoryStore requires fcntl file locks (POSIX).")
+        segment = _open_segment(name)
+        store = cls.__new__(cls)
+        try:
+            if _INT.unpack_from(segment.buf, 0)[0] != _MAGIC:
+                raise ValueError(f"Shared memory segment '{name}' is not a SharedMemoryStore.")
+            store._setup(segment, lock_dir, create=False)
+        except BaseException:
+            segment.close()
+            raise
+        return store
+
+    def _setup(self, segment: shared_memory.SharedMemory, lock_dir: Optional[str], create: bool) -> None:
+        _, capacity, key_size, table_size, _, _, _, typecode, stripes, _ = _HEADER.unpack_from(segment.buf, 0)
+        self.typecode = typecode = chr(typecode)
+        self.capacity = capacity
+        self.key_size = key_size
+        self._zero = 0 if typecode == "q" else 0.0
+        # seq, score, key length, then the key bytes.
+        self._record = struct.Struct(f"<q{typecode}q")
+        self._record_size = self._record.size + key_size
+        self._records = _HEADER.size
+        self._index = self._records + capacity * self._record_size
+        self._table_mask = table_size - 1
+        # Below 2**23 entries the hash bits kept in an index entry include its home position.
+        self._tag_has_home = self._table_mask <= _TAG_MASK
+        self._shm = segment
+        self._buf = segment.buf
+        self._owner = os.getpid() if create else None
+        self._lock_path = os.path.join(lock_dir if lock_dir is not None else tempfile.gettempdir(),
+                                       f"pyscored-{segment.name.lstrip('/')}.lock")
+        self._lock_fd = os.open(self._lock_path, (os.O_RDWR | os.O_CREAT) if create else os.O_RDWR, 0o600)
+        # Byte i locks stripe i; byte ``stripes`` is the index lock.
+        self._locks = [_RangeLock(self._lock_fd, stripe) for stripe in range(stripes)]
+        self._index_lock = _RangeLock(self._lock_fd, stripes)
+        self._stripe_mask = stripes - 1
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory segment, for ``from_name``."""
+        return self._shm.name
+
+    def _encode(self, player_id: str) -> bytes:
+        key = player_id.encode("utf-8")
+        if len(key) > self.key_size:
+            raise ValueError(f"Player ID '{player_id}' is longer than {self.key_size} bytes.")
+        return key
+
+    def _read(self, slot: int) -> Tuple[bytes, Any]:
+        """Copies a slot's key and score consistently, retrying while a writer is inside it."""
+        buf = self._buf
+        offset = self._records + slot * self._record_size
+        unpack = self._record.unpack_from
+        start = offset + self._record.size
+        attempt = 0
+        started = 0.0
+        while True:
+            seq, score, length = unpack(buf, offset)
+            if not seq & 1:
+                key = bytes(buf[start:start + length])
+                if _INT.unpack_from(buf, offset)[0] == seq:
+                    return key, score
+            attempt += 1
+            started = _pause(attempt, started, f"Slot {slot}")
+
+    def _write(self, slot: int, key: Optional[bytes], score: Any) -> None:
+        """Writes a slot under the seqlock; callers hold the slot's stripe lock."""
+        buf = self._buf
+        offset = self._records + slot * self._record_size
+        seq = _INT.unpack_from(buf, offset)[0]
+        _INT.pack_into(buf, offset, seq + 1)
+        if key is None:
+            struct.pack_into(f"<{self.typecode}", buf, offset + 8, score)
+        else:
+            self._record.pack_into(buf, offset, seq + 1, score, len(key))
+            start = offset + self._record.size
+            buf[start:start + len(key)] = key
+        _INT.pack_into(buf, offset, seq + 2)
+
+    def _probe(self, key: bytes) -> Tuple[int, Any, int, int]:
+        """Returns ``(slot, score, position, free_position)``; slot is -1 when the key is absent.
+
+        ``free_position`` is the empty index entry that ended the probe, where the key
+        would be inserted. A miss is only trusted if no removal shifted index entries
+        while probing, which the index sequence counter in the header tells.
+        """
+        buf = self._buf
+        index = self._index
+        mask = self._table_mask
+        h = zlib.crc32(key)
+        tag = (h & _TAG_MASK) << _SLOT_BITS
+        attempt = 0
+        started = 0.0
+        while True:
+            index_seq = _INT.unpack_from(buf, _INDEX_SEQ)[0]
+            position = h & mask
+            for _ in range(mask + 1):
+                entry = _INT.unpack_from(buf, index + 8 * position)[0]
+                if entry == 0:
+                    break
+                if entry & ~_SLOT_MASK == tag:
+                    slot = (entry & _SLOT_MASK) - 1
+                    stored, score = self._read(slot)
+                    if stored == key:
+                        return slot, score, position, -1
+                position = (position + 1) & mask
+            else:
+                position = -1
+            if not index_seq & 1 and _INT.unpack_from(buf, _INDEX_SEQ)[0] == index_seq:
+                return -1, None, -1, position
+            attempt += 1
+            started = _pause(attempt, started, "The index")
+
+    def _home(self, entry: int) -> int:
+        if self._tag_has_home:
+            return (entry >> _SLOT_BITS) & self._table_mask
+        return zlib.crc32(self._read((entry & _SLOT_MASK) - 1)[0]) & self._table_mask
+
+    def _remove_entry(self, position: int) -> None:
+        """Deletes an index entry by shifting later entries of its probe run back; callers hold the index lock."""
+        buf = self._buf
+        index = self._index
+        mask = self._table_mask
+        index_seq = _INT.unpack_from(buf, _INDEX_SEQ)[0]
+        _INT.pack_into(buf, _INDEX_SEQ, index_seq + 1)
+        hole = position
+        while True:
+            position = (position + 1) & mask
+            entry = _INT.unpack_from(buf, index + 8 * position)[0]
+            if entry == 0:
+                break
+            home = self._home(entry)
+            # The entry may move into the hole unless its home lies cyclically in (hole, position].
+            if (hole < position and hole < home <= position) or (hole > position and (home > hole or home <= position)):
+                continue
+            _INT.pack_into(buf, index + 8 * hole, entry)
+            hole = position
+        _INT.pack_into(buf, index + 8 * hole, 0)
+        _INT.pack_into(buf, _INDEX_SEQ, index_seq + 2)
+
+    def _lookup(self, player_id: Any) -> Tuple[int, Any]:
+        if not isinstance(player_id, str):
+            return -1, None
+        slot, score, _, _ = self._probe(player_id.encode("utf-8"))
+        return slot, score
+
+    def __getitem__(self, player_id: str) -> Any:
+        slot, score = self._lookup(player_id)
+        if slot < 0:
+            raise KeyError(player_id)
+        return score
+
+    def get(self, player_id: str, default: Any = None) -> Any:
+        slot, score = self._lookup(player_id)
+        return default if slot < 0 else score
+
+    def __contains__(self, player_id: object) -> bool:
+        return self._lookup(player_id)[0] >= 0
+
+    def _allocate(self) -> int:
+        # Callers hold the index lock. Free slots are chained through their score field.
+        buf = self._buf
+        free_head = _INT.unpack_from(buf, _FREE_HEAD)[0]
+        if free_head >= 0:
+            offset = self._records + free_head * self._record_size
+            _INT.pack_into(buf, _FREE_HEAD, _INT.unpack_from(buf, offset + 8)[0])
+            return free_head
+        slot = _INT.unpack_from(buf, _NEXT_SLOT)[0]
+        if slot >= self.capacity:
+            raise ValueError(f"SharedMemoryStore is full ({self.capacity} players).")
+        _INT.pack_into(buf, _NEXT_SLOT, slot + 1)
+        return slot
+
+    def __setitem__(self, player_id: str, score: Any) -> None:
+        key = self._encode(player_id)
+        slot = self._probe(key)[0]
+        if slot >= 0:
+            with self._locks[slot & self._stripe_mask]:
+                # The player may have been removed and the slot reused since the probe.
+                if self._read(slot)[0] == key:
+                    self._write(slot, None, score)
+                    return
+        with self._index_lock:
+            slot, _, _, free = self._probe(key)
+            if slot >= 0:
+                with self._locks[slot & self._stripe_mask]:
+                    self._write(slot, None, score)
+                return
+            if free < 0:
+                raise ValueError("SharedMemoryStore index is full.")
+            slot = self._allocate()
+            with self._locks[slot & self._stripe_mask]:
+                self._write(slot, key, score)
+            tag = (zlib.crc32(key) & _TAG_MASK) << _SLOT_BITS
+            # Publishing the index entry last makes the complete slot visible at once.
+            _INT.pack_into(self._buf, self._index + 8 * free, tag | (slot + 1))
+            _INT.pack_into(self._buf, _COUNT, _INT.unpack_from(self._buf, _COUNT)[0] + 1)
+
+    def increment(self, player_id: str, points: Any) -> Tuple[Any, Any]:
+        """Atomically adds points to a stored score and returns ``(old, new)``."""
+        key = self._encode(player_id)
+        while True:
+            slot = self._probe(key)[0]
+            if slot < 0:
+                raise KeyError(player_id)
+            with self._locks[slot & self._stripe_mask]:
+                stored, old = self._read(slot)
+                if stored == key:
+                    new = old + points
+                    self._write(slot, None, new)
+                    return old, new
+
+    def __delitem__(self, player_id: str) -> None:
+        key = self._encode(player_id)
+        with self._index_lock:
+            slot, _, position, _ = self._probe(key)
+            if slot < 0:
+                raise KeyError(player_id)
+            self._remove_entry(position)
+            buf = self._buf
+            with self._locks[slot & self._stripe_mask]:
+                self._write(slot, b"", self._zero)
+            offset = self._records + slot * self._record_size
+            _INT.pack_into(buf, offset + 8, _INT.unpack_from(buf, _FREE_HEAD)[0])
+            _INT.pack_into(buf, _FREE_HEAD, slot)
+            _INT.pack_into(buf, _COUNT, _INT.unpack_from(buf, _COUNT)[0] - 1)
+
+    def items(self) -> List[Tuple[str, Any]]:  # type: ignore[override]
+        """Every ``(player_id, score)`` pair, each read consistently."""
+        items = []
+        for slot in range(_INT.unpack_from(self._buf, _NEXT_SLOT)[0]):
+            key, score = self._read(slot)
+            if key:
+                items.append((key.decode("utf-8"), score))
+        return items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([player_id for player_id, _ in self.items()])
+
+    def __len__(self) -> int:
+        return _INT.unpack_from(self._buf, _COUNT)[0]
+
+    def snapshot(self) -> ScoreSnapshot:
+        """Copies the current scores; each score is consistent, the copy as a whole is not atomic."""
+        return ScoreSnapshot((dict(self.items()),))
+
+    def close(self) -> None:
+        """Detaches this process from the segment; the creating process also removes it and the lock file."""
+        if self._buf is None:
+            return
+        self._buf = None
+        self._shm.close()
+        os.close(self._lock_fd)
+        if os.getpid() == self._owner:
+            self._shm.unlink()
+            try:
+                os.remove(self._lock_path)
+            except OSError:
+                pass
@@ -0,0 +1,151 @@
+# pyscored/storage/sqlite.py
+
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+from pyscored.core.snapshot import ScoreSnapshot
+from pyscored.storage.base import ScoreStore
+
+_DELETED = None
+
+if sqlite3.sqlite_version_info >= (3, 24, 0):
+    _UPSERT = ("INSERT INTO {table} (player_id, score) VALUES (?, ?) "
+               "ON CONFLICT(player_id) DO UPDATE SET score = excluded.score")
+else:  # pragma: no cover - SQLite predating UPSERT support
+    _UPSERT = "INSERT OR REPLACE INTO {table} (player_id, score) VALUES (?, ?)"
+
+
+class SQLiteStore(ScoreStore):
+    """Score store persisted in an SQLite database, with a read cache and a write-behind buffer.
+
+    The database runs in WAL mode. Writes update the in-memory cache immediately and
+    are buffered until ``batch_size`` of them are pending or ``flush_interval`` seconds
+    have passed, then written with one ``executemany`` upsert inside a single
+    transaction. SQLite caches the prepared statements because the SQL text is fixed.
+    """
+
+    def __init__(self, path: str, table: str = "scores", batch_size: int = 5000,
+                 flush_interval: Optional[float] = 1.0, synchronous: str = "NORMAL"):
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name '{table}'.")
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        self._conn.execute(
+            # No declared type: integer fixed-point scores round-trip exactly instead of as REAL.
+            f"CREATE TABLE IF NOT EXISTS {table} (player_id TEXT PRIMARY KEY, score NOT NULL) WITHOUT ROWID"
+        )
+        self._select_one = f"SELECT score FROM {table} WHERE player_id = ?"
+        self._select_all = f"SELECT player_id, score FROM {table}"
+        self._select_ids = f"SELECT player_id FROM {table}"
+        self._count = f"SELECT COUNT(*) FROM {table}"
+        self._upsert = _UPSERT.format(table=table)
+        self._delete = f"DELETE FROM {table} WHERE player_id = ?"
+        self._cache: Dict[str, float] = {}
+        self._dirty: Dict[str, Optional[float]] = {}
+        self._lock = threading.RLock()
+        self._last_flush = time.monotonic()
+
+    def _lookup(self, player_id: str) -> Optional[float]:
+        score = self._cache.get(player_id)
+        if score is not None:
+            return score
+        if player_id in self._dirty:
+            return None  # deleted and not yet flushed
+        row = self._conn.execute(self._select_one, (player_id,)).fetchone()
+        if row is None:
+            return None
+        self._cache[player_id] = row[0]
+        return row[0]
+
+    def __getitem__(self, player_id: str) -> float:
+        score = self._lookup(player_id)
+        if score is None:
+            raise KeyError(player_id)
+        return score
+
+    def __contains__(self, player_id: object) -> bool:
+        return isinstance(player_id, str) and self._lookup(player_id) is not None
+
+    def get(self, player_id: str, default: Any = None) -> Any:
+        score = self._lookup(player_id)
+        return default if score is None else score
+
+    def __setitem__(self, player_id: str, score: float) -> None:
+        with self._lock:
+            self._cache[player_id] = score
+            self._dirty[player_id] = score
+            self._maybe_flush()
+
+    def __delitem__(self, player_id: str) -> None:
+        with self._lock:
+            if self._lookup(player_id) is None:
+                raise KeyError(player_id)
+            self._cache.pop(player_id, None)
+            self._dirty[player_id] = _DELETED
+            self._maybe_flush()
+
+    def update(self, other: Any = (), **kwargs: float) -> None:
+        """Buffers many writes under a single lock acquisition."""
+        items = other.items() if isinstance(other, Mapping) else other
+        with self._lock:
+            for player_id, score in items:
+                self._cache[player_id] = score
+                self._dirty[player_id] = score
+            for player_id, score in kwargs.items():
+                self._cache[player_id] = score
+                self._dirty[player_id] = score
+            self._maybe_flush()
+
+    def __iter__(self) -> Iterator[str]:
+        self.flush()
+        return (row[0] for row in self._conn.execute(self._select_ids).fetchall())
+
+    def __len__(self) -> int:
+        self.flush()
+        return self._conn.execute(self._count).fetchone()[0]
+
+    def _maybe_flush(self) -> None:
+        if len(self._dirty) >= self.batch_size or (
+            self.flush_interval is not None and time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes all buffered upserts and deletes in one transaction."""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._dirty:
+                return
+            dirty, self._dirty = self._dirty, {}
+            upserts = [(player_id, score) for player_id, score in dirty.items() if score is not _DELETED]
+            deletes = [(player_id,) for player_id, score in dirty.items() if score is _DELETED]
+            self._conn.execute("BEGIN")
+            try:
+                if upserts:
+                    self._conn.executemany(self._upsert, upserts)
+                if deletes:
+                    self._conn.executemany(self._delete, deletes)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                dirty.update(self._dirty)
+                self._dirty = dirty
+                raise
+            self._conn.execute("COMMIT")
+
+    def snapshot(self) -> ScoreSnapshot:
+        """Returns a point-in-time copy of all stored scores."""
+        with self._lock:
+            self.flush()
+            return ScoreSnapshot((dict(self._conn.execute(self._select_all).fetchall()),))
+
+    def close(self) -> None:
+        """Flushes buffered writes and closes the database connection."""
+        with self._lock:
+            self.flush()
+            self._conn.close()
@@ -0,0 +1,267 @@
+# pyscored/storage/tiered.py
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+from pyscored.core.snapshot import ScoreSnapshot
+from pyscored.core.transaction import DeltaOverlay
+from pyscored.storage.base import ScoreStore
+from pyscored.storage.memory import InMemoryStore
+
+
+class TierMetrics(NamedTuple):
+    """Point-in-time counters of a TieredStore."""
+
+    hot_players: int
+    cold_players: int
+    evictions: int
+    evictions_per_second: float
+    faults: int
+    fault_latency_avg: float
+    fault_latency_max: float
+
+
+class TieredStore(ScoreStore):
+    """Score store that keeps recently active players in memory and pages idle ones out to SQLite.
+
+    Every read or write of a hot player records its access time. Players not touched
+    for ``idle_after`` seconds are evicted in batches of ``batch_size`` to a cold
+    table on disk, together with their plugin state when the store is used by an
+    engine. The next read of a cold player faults it back into the hot tier
+    transparently; its cold row stays on disk until the player is evicted again and
+    overwrites it, so a crash loses at most the changes made since the last eviction,
+    never the player. Eviction runs on writes at most every ``evict_interval`` seconds
+    (never inside a transaction) or on demand with ``evict``; ``close`` spills every
+    hot player to disk, so the database holds the full state between runs.
+
+    ``snapshot`` and iteration include cold players and therefore read the cold table.
+    """
+
+    def __init__(self, path: str, idle_after: float = 86400.0, hot: Optional[ScoreStore] = None,
+                 batch_size: int = 1000, evict_interval: float = 60.0, table: str = "cold_scores",
+                 clock: Callable[[], float] = time.monotonic):
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name '{table}'.")
+        self.path = path
+        self.idle_after = idle_after
+        self.batch_size = batch_size
+        self.evict_interval = evict_interval
+        self._hot = hot if hot is not None else InMemoryStore()
+        self._clock = clock
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # No declared type on score: SQLite keeps integers (fixed-point scores) and floats as given.
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} (player_id TEXT PRIMARY KEY, score NOT NULL, state TEXT) "
+            "WITHOUT ROWID"
+        )
+        self._select_one = f"SELECT score, state FROM {table} WHERE player_id = ?"
+        self._select_all = f"SELECT player_id, score FROM {table}"
+        self._insert = f"INSERT OR REPLACE INTO {table} (player_id, score, state) VALUES (?, ?, ?)"
+        self._delete = f"DELETE FROM {table} WHERE player_id = ?"
+        self._lock = threading.RLock()
+        self._engine: Any = None
+        # Hot players in least recently used order, with their last access time.
+        self._access: Dict[str, float] = {}
+        self._cold_players = self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        self._started = clock()
+        self._next_evict = self._started + evict_interval
+        self._evictions = 0
+        self._faults = 0
+        self._fault_time = 0.0
+        self._fault_max = 0.0
+
+    def attach(self, engine: Any) -> None:
+        """Lets the store page plugin state of evicted players in and out with their scores."""
+        self._engine = engine
+
+    def _touch(self, player_id: str, now: float) -> None:
+        access = self._access
+        access.pop(player_id, None)
+        access[player_id] = now
+
+    def _fault(self, player_id: str) -> Optional[Any]:
+        """Loads a cold player into the hot tier and returns its score, or None if unknown."""
+        start = time.perf_counter()
+        with self._lock:
+            row = self._conn.execute(self._select_one, (player_id,)).fetchone()
+            if row is None:
+                return None
+            score, state = row
+            # The row is kept as the durable copy; the next eviction replaces it.
+            self._cold_players -= 1
+            self._hot[player_id] = score
+            self._touch(player_id, self._clock())
+            if state is not None:
+                self._restore_state(player_id, json.loads(state))
+        elapsed = time.perf_counter() - start
+        self._faults += 1
+        self._fault_time += elapsed
+        if elapsed > self._fault_max:
+            self._fault_max = elapsed
+        return score
+
+    def _plugin_state(self) -> List[Tuple[str, str, Any]]:
+        """Returns ``(plugin_name, attribute, mapping)`` for the attached engine's plugin state."""
+        if self._engine is None:
+            return []
+        state = []
+        for name, plugin in self._engine._plugins.items():
+            for attribute in getattr(type(plugin), "state_attributes", ()):
+                mapping = getattr(plugin, attribute)
+                # Restore beneath any open transaction so a rollback cannot lose paged-in state.
+                while isinstance(mapping, DeltaOverlay):
+                    mapping = mapping.base
+                state.append((name, attribute, mapping))
+        return state
+
+    def _restore_state(self, player_id: str, state: Dict[str, Any]) -> None:
+        for name, attribute, mapping in self._plugin_state():
+            value = state.get(f"{name}.{attribute}")
+            if value is not None:
+                mapping[player_id] = value
+
+    def _lookup(self, player_id: str) -> Optional[Any]:
+        score = self._hot.get(player_id)
+        if score is not None:
+            self._touch(player_id, self._clock())
+            return score
+        if not isinstance(player_id, str):
+            return None
+        return self._fault(player_id)
+
+    def __getitem__(self, player_id: str) -> Any:
+        score = self._lookup(player_id)
+        if score is None:
+            raise KeyError(player_id)
+        return score
+
+    def get(self, player_id: str, default: Any = None) -> Any:
+        score = self._lookup(player_id)
+        return default if score is None else score
+
+    def __contains__(self, player_id: object) -> bool:
+        return self._lookup(player_id) is not None  # type: ignore[arg-type]
+
+    def __setitem__(self, player_id: str, score: Any) -> None:
+        if player_id not in self._access:
+            # Fault in first so the player's cold row and plugin state are not left behind.
+            self._lookup(player_id)
+        self._hot[player_id] = score
+        now = self._clock()
+        self._touch(player_id, now)
+        self._maybe_evict(now)
+
+    def update(self, other: Any = (), **kwargs: Any) -> None:
+        items = list(other.items() if isinstance(other, Mapping) else other) + list(kwargs.items())
+        for player_id, _ in items:
+            if player_id not in self._access:
+                self._lookup(player_id)
+        self._hot.update(items)
+        now = self._clock()
+        for player_id, _ in items:
+            self._touch(player_id, now)
+        self._maybe_evict(now)
+
+    def __delitem__(self, player_id: str) -> None:
+        with self._lock:
+            if player_id in self._access:
+                del self._hot[player_id]
+                del self._access[player_id]
+                # Players faulted in earlier still have a row on disk.
+                self._conn.execute(self._delete, (player_id,))
+                return
+            if self._conn.execute(self._delete, (player_id,)).rowcount == 0:
+                raise KeyError(player_id)
+            self._cold_players -= 1
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.snapshot())
+
+    def __len__(self) -> int:
+        return len(self._access) + self._cold_players
+
+    def _maybe_evict(self, now: float) -> None:
+        if now >= self._next_evict and (self._engine is None or self._engine._transaction is None):
+            self.evict()
+
+    def evict(self, idle_after: Optional[float] = None) -> int:
+        """Pages out every player idle for ``idle_after`` seconds (default: the store's) and returns how many."""
+        now = self._clock()
+        self._next_evict = now + self.evict_interval
+        cutoff = now - (self.idle_after if idle_after is None else idle_after)
+        evicted = 0
+        with self._lock:
+            while True:
+                batch = []
+                for player_id, accessed in self._access.items():
+                    if accessed > cutoff or len(batch) >= self.batch_size:
+                        break
+                    batch.append(player_id)
+                if not batch:
+                    return evicted
+                self._evict_batch(batch)
+                evicted += len(batch)
+
+    def _evict_batch(self, player_ids: List[str]) -> None:
+        plugin_state = self._plugin_state()
+        rows = []
+        for player_id in player_ids:
+            state = {}
+            for name, attribute, mapping in plugin_state:
+                value = mapping.pop(player_id, None)
+                if value is not None:
+                    state[f"{name}.{attribute}"] = value
+            rows.append((player_id, self._hot[player_id], json.dumps(state) if state else None))
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(self._insert, rows)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            self._restore_rows(rows)
+            raise
+        self._conn.execute("COMMIT")
+        for player_id in player_ids:
+            del self._hot[player_id]
+            del self._access[player_id]
+        self._cold_players += len(rows)
+        self._evictions += len(rows)
+
+    def _restore_rows(self, rows: List[Tuple[str, Any, Optional[str]]]) -> None:
+        for player_id, _, state in rows:
+            if state is not None:
+                self._restore_state(player_id, json.loads(state))
+
+    def metrics(self) -> TierMetrics:
+        """Returns tier sizes, the eviction count and rate since creation, and fault latencies in seconds."""
+        elapsed = self._clock() - self._started
+        return TierMetrics(
+            hot_players=len(self._access),
+            cold_players=self._cold_players,
+            evictions=self._evictions,
+            evictions_per_second=self._evictions / elapsed if elapsed > 0 else 0.0,
+            faults=self._faults,
+            fault_latency_avg=self._fault_time / self._faults if self._faults else 0.0,
+            fault_latency_max=self._fault_max,
+        )
+
+    def snapshot(self) -> ScoreSnapshot:
+        """Returns a point-in-time copy of the scores of both tiers."""
+        with self._lock:
+            scores = dict(self._conn.execute(self._select_all).fetchall())
+            scores.update(self._hot.snapshot().items())
+        return ScoreSnapshot((scores,))
+
+    def flush(self) -> None:
+        """Persists buffered writes of the hot tier's backend."""
+        self._hot.flush()
+
+    def close(self) -> None:
+        """Spills every hot player to the cold tier and closes the database."""
+        with self._lock:
+            self.evict(idle_after=float("-inf"))
+            self._hot.close()
+            self._conn.close()
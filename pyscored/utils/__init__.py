@@ -5,5 +5,7 @@ This package provides helper functions and utilities for use throughout the libr
 """
 
 from pyscored.utils.helpers import safe_cast
+from pyscored.utils.fixed_point import FixedPoint
+from pyscored.utils.sorted_list import SortedList
 
-__all__ = ["safe_cast"]
\ No newline at end of file
+__all__ = ["safe_cast", "FixedPoint", "SortedList"]
\ No newline at end of file
@@ -0,0 +1,54 @@
+# pyscored/utils/fixed_point.py
+
+import math
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import Union
+
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+
+class FixedPoint:
+    """Converts scores to and from int64 fixed-point values with a fixed scale and rounding mode.
+
+    A score ``x`` is stored as the integer ``x * scale``. Floats are interpreted by
+    their shortest decimal representation (``0.285`` means exactly 0.285) and rounded
+    with the configured ``decimal`` rounding mode, half-to-even by default, so every
+    process and shard produces the same integers for the same inputs.
+    """
+
+    def __init__(self, scale: int = 1000, rounding: str = ROUND_HALF_EVEN):
+        if not isinstance(scale, int) or scale < 1:
+            raise ValueError("The fixed-point scale must be a positive integer.")
+        self.scale = scale
+        self.rounding = rounding
+        self._decimal_scale = Decimal(scale)
+
+    def to_fixed(self, value: Union[int, float]) -> int:
+        """Converts a score to its fixed-point integer, rounding in the configured mode."""
+        if isinstance(value, int):
+            raw = value * self.scale
+        else:
+            if not math.isfinite(value):
+                raise ValueError(f"Cannot represent {value!r} as a fixed-point score.")
+            scaled = value * self.scale
+            raw = round(scaled) if self.rounding == ROUND_HALF_EVEN else None
+            # The binary product can land on the wrong side of a tie (0.285 * 1000 is
+            # 284.99999999999997), so values near a tie and other rounding modes take
+            # the exact decimal path.
+            if raw is None or abs(abs(scaled - math.floor(scaled)) - 0.5) < 1e-6:
+                raw = int((Decimal(repr(value)) * self._decimal_scale).to_integral_value(self.rounding))
+        if not INT64_MIN <= raw <= INT64_MAX:
+            raise OverflowError(f"Score {value!r} does not fit in an int64 at scale {self.scale}.")
+        return raw
+
+    def to_float(self, raw: int) -> float:
+        """Converts a fixed-point integer back to a float score."""
+        return raw / self.scale
+
+    def quantize(self, value: Union[int, float]) -> float:
+        """Rounds a score to the nearest representable fixed-point value."""
+        return self.to_float(self.to_fixed(value))
+
+    def config(self) -> dict:
+        return {"scale": self.scale, "rounding": self.rounding}
@@ -1,5 +1,6 @@
 # pyscored/utils/helpers.py
 
+from decimal import Decimal
 from typing import Any, Dict, Type, Optional
 
 def validate_score(score: float) -> bool:
@@ -12,12 +13,27 @@ def merge_config(default_config: Dict[str, Any], custom_config: Dict[str, Any])
     merged_config.update(custom_config)
     return merged_config
 
-def clamp_score(score: float, min_score: float = 0.0, max_score: float = float('inf')) -> float:
-    """Clamps the score within specified minimum and maximum bounds."""
+def clamp_score(score: float, min_score: float = 0.0, max_score: float = float('inf'),
+                scale: Optional[int] = None) -> float:
+    """Clamps the score within specified minimum and maximum bounds.
+
+    With a fixed-point ``scale``, ``score`` is a raw fixed-point integer while the
+    bounds stay in points; the result is a raw integer as well.
+    """
+    if scale is not None:
+        min_score = round(Decimal(repr(min_score)) * scale)
+        if max_score != float('inf'):
+            max_score = round(Decimal(repr(max_score)) * scale)
     return max(min(score, max_score), min_score)
 
-def format_score(score: float, decimals: int = 2) -> str:
-    """Formats the score to a fixed number of decimal places."""
+def format_score(score: float, decimals: int = 2, scale: Optional[int] = None) -> str:
+    """Formats the score to a fixed number of decimal places.
+
+    With a fixed-point ``scale``, ``score`` is a raw fixed-point integer and is
+    formatted exactly, rounding half to even, without passing through a float.
+    """
+    if scale is not None:
+        return f"{Decimal(score) / Decimal(scale):.{decimals}f}"
     return f"{score:.{decimals}f}"
 
 def safe_cast(value: Any, to_type: Type, default: Optional[Any] = None) -> Any:
@@ -25,4 +41,17 @@ def safe_cast(value: Any, to_type: Type, default: Optional[Any] = None) -> Any:
     try:
         return to_type(value)
     except (ValueError, TypeError):
-        return default
\ No newline at end of file
+        return default
+
+
+def load_toml(path: str) -> Dict[str, Any]:
+    """Loads a TOML document, using tomllib on Python 3.11+ and the optional tomli package otherwise."""
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        try:
+            import tomli as tomllib
+        except ImportError as e:
+            raise ImportError("Reading TOML on Python < 3.11 requires the 'tomli' package.") from e
+    with open(path, "rb") as f:
+        return tomllib.load(f)
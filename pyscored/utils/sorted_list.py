@@ -0,0 +1,186 @@
+# pyscored/utils/sorted_list.py
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain
+from typing import Any, Iterable, Iterator, List
+
+
+class SortedList:
+    """Sorted sequence with logarithmic insertion, removal and rank lookups.
+
+    Values live in a list of sorted sublists of at most ``2 * load`` items. An insert
+    or removal bisects the sublist maxima and only shifts items inside one short
+    sublist, so its cost no longer grows with the number of values the way
+    ``insort`` into one flat list does. A Fenwick tree over the sublist lengths
+    turns a position within a sublist into a rank in O(log n).
+    """
+
+    def __init__(self, values: Iterable[Any] = (), load: int = 256):
+        if load < 2:
+            raise ValueError("load must be at least 2.")
+        self._load = load
+        self._lists: List[List[Any]] = []
+        self._maxes: List[Any] = []
+        self._tree: List[int] = [0]
+        self._len = 0
+        self._reset(sorted(values))
+
+    def _reset(self, values: List[Any]) -> None:
+        load = self._load
+        self._lists = [values[i:i + load] for i in range(0, len(values), load)]
+        self._maxes = [sublist[-1] for sublist in self._lists]
+        self._len = len(values)
+        self._build()
+
+    def _build(self) -> None:
+        tree = [0]
+        tree.extend(map(len, self._lists))
+        size = len(tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _grow(self, index: int, delta: int) -> None:
+        tree = self._tree
+        size = len(tree)
+        i = index + 1
+        while i < size:
+            tree[i] += delta
+            i += i & -i
+
+    def _before(self, index: int) -> int:
+        """Number of values in the sublists before ``index``."""
+        tree = self._tree
+        total = 0
+        while index:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Any]:
+        return chain.from_iterable(self._lists)
+
+    def __contains__(self, value: Any) -> bool:
+        i = bisect_left(self._maxes, value)
+        if i == len(self._maxes):
+            return False
+        sublist = self._lists[i]
+        return sublist[bisect_left(sublist, value)] == value
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedList index out of range")
+        tree = self._tree
+        position = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            child = position + step
+            if child < len(tree) and tree[child] <= index:
+                position = child
+                index -= tree[child]
+            step >>= 1
+        return self._lists[position][index]
+
+    def add(self, value: Any) -> None:
+        """Inserts a value."""
+        lists, maxes = self._lists, self._maxes
+        self._len += 1
+        if not maxes:
+            lists.append([value])
+            maxes.append(value)
+            self._build()
+            return
+        i = bisect_right(maxes, value)
+        if i == len(maxes):
+            i -= 1
+            lists[i].append(value)
+            maxes[i] = value
+        else:
+            insort(lists[i], value)
+        if len(lists[i]) > 2 * self._load:
+            self._split(i)
+            self._build()
+        else:
+            self._grow(i, 1)
+
+    def _split(self, i: int) -> None:
+        sublist = self._lists[i]
+        half = sublist[self._load:]
+        del sublist[self._load:]
+        self._lists.insert(i + 1, half)
+        self._maxes[i] = sublist[-1]
+        self._maxes.insert(i + 1, half[-1])
+
+    def remove(self, value: Any) -> None:
+        """Removes one occurrence of a value; raises ValueError if there is none."""
+        lists, maxes = self._lists, self._maxes
+        i = bisect_left(maxes, value)
+        if i < len(maxes):
+            sublist = lists[i]
+            j = bisect_left(sublist, value)
+            if sublist[j] == value:
+                del sublist[j]
+                self._len -= 1
+                if len(sublist) >= self._load // 2 or len(lists) == 1:
+                    if sublist:
+                        maxes[i] = sublist[-1]
+                        self._grow(i, -1)
+                    else:
+                        del lists[i], maxes[i]
+                        self._build()
+                    return
+                # Merge a short sublist into a neighbour so their number stays proportional to the size.
+                if i == len(lists) - 1:
+                    i -= 1
+                lists[i].extend(lists.pop(i + 1))
+                del maxes[i + 1]
+                maxes[i] = lists[i][-1]
+                if len(lists[i]) > 2 * self._load:
+                    self._split(i)
+                self._build()
+                return
+        raise ValueError(f"{value!r} is not in the SortedList.")
+
+    def update(self, values: Iterable[Any]) -> None:
+        """Inserts many values with one sort."""
+        values = list(values)
+        if len(values) > self._len // 8:
+            merged = list(self)
+            merged.extend(values)
+            # Two ascending runs when ``values`` is sorted: Timsort merges them in linear time.
+            merged.sort()
+            self._reset(merged)
+        else:
+            for value in values:
+                self.add(value)
+
+    def bisect_left(self, value: Any) -> int:
+        """Number of values smaller than ``value``."""
+        i = bisect_left(self._maxes, value)
+        if i == len(self._maxes):
+            return self._len
+        return self._before(i) + bisect_left(self._lists[i], value)
+
+    def bisect_right(self, value: Any) -> int:
+        """Number of values smaller than or equal to ``value``."""
+        i = bisect_right(self._maxes, value)
+        if i == len(self._maxes):
+            return self._len
+        return self._before(i) + bisect_right(self._lists[i], value)
+
+    def last(self, k: int) -> List[Any]:
+        """The ``k`` largest values in ascending order."""
+        parts = []
+        for sublist in reversed(self._lists):
+            if k <= 0:
+                break
+            parts.append(sublist[-k:] if k < len(sublist) else sublist)
+            k -= len(sublist)
+        return list(chain.from_iterable(reversed(parts)))
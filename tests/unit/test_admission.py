@@ -0,0 +1,50 @@
+# tests/unit/test_admission.py
+
+import asyncio
+
+import pytest
+from pyscored.adapters.web_frameworks import WebFrameworkAdapter
+from pyscored.core.admission import AdmissionControl, RateLimitExceeded
+from pyscored.core.scoring_engine import ScoringEngine
+
+
+def test_buckets_refill_lazily(fake_clock):
+    admission = AdmissionControl(rate=2.0, burst=3, clock=fake_clock)
+    assert [admission.admit("alice") for _ in range(4)] == [True, True, True, False]
+    assert admission.retry_after("alice") == pytest.approx(0.5)
+    fake_clock.now = 0.5
+    assert admission.admit("alice") and not admission.admit("alice")
+    fake_clock.now = 100.0
+    # Refill is capped at the burst.
+    assert admission.admit_batch(["alice"] * 4) == [True, True, True, False]
+
+
+def test_batch_mask_is_per_player(fake_clock):
+    admission = AdmissionControl(rate=0.0, burst=2, clock=fake_clock)
+    mask = admission.admit_batch(["alice", "bob", "alice", "alice", "bob"])
+    assert mask == [True, True, True, False, True]
+    admitted, rejected = admission.partition([("bob", 1.0), ("carol", 2.0)])
+    assert admitted == [("carol", 2.0)] and rejected == [("bob", 1.0)]
+
+
+def test_compact_drops_full_buckets(fake_clock):
+    admission = AdmissionControl(rate=1.0, burst=2, clock=fake_clock)
+    admission.admit_batch(["alice", "bob", "bob"])
+    fake_clock.now = 1.5
+    assert admission.compact() == 1 and len(admission) == 1
+    assert admission.admit_batch(["bob", "bob"]) == [True, False]
+
+
+def test_adapter_masks_rejected_events(fake_clock):
+    engine = ScoringEngine()
+    adapter = WebFrameworkAdapter(engine, AdmissionControl(rate=0.0, burst=2, clock=fake_clock))
+    engine.initialize_score("alice")
+    engine.initialize_score("bob")
+
+    async def run():
+        assert await adapter.update_user_scores([("alice", 1), ("alice", 1), ("alice", 1), ("bob", 5)]) == 3
+        with pytest.raises(RateLimitExceeded):
+            await adapter.update_user_score("alice", 1)
+
+    asyncio.run(run())
+    assert engine.get_score("alice") == 2.0 and engine.get_score("bob") == 5.0
@@ -0,0 +1,102 @@
+# tests/unit/test_asgi.py
+
+import asyncio
+import json
+
+import pytest
+from pyscored.adapters.asgi import create_asgi_app
+from pyscored.adapters.web_frameworks import WebFrameworkAdapter
+from pyscored.core.admission import AdmissionControl
+from pyscored.core.scoring_engine import ScoringEngine
+
+
+@pytest.fixture
+def engine():
+    engine = ScoringEngine()
+    for i in range(5):
+        engine.initialize_score(f"player{i}", float(i))
+    return engine
+
+
+@pytest.fixture
+def app(engine):
+    return create_asgi_app(WebFrameworkAdapter(engine), export_chunk_size=2)
+
+
+def request(app, method, path, body=None, query=b""):
+    messages = []
+    payload = json.dumps(body).encode() if body is not None else b""
+
+    async def receive():
+        return {"type": "http.request", "body": payload, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": method, "path": path, "query_string": query}
+    asyncio.run(app(scope, receive, send))
+    return messages
+
+
+def response(messages):
+    start, *bodies = messages
+    return start["status"], dict(start["headers"]), b"".join(m["body"] for m in bodies)
+
+
+def test_single_update(app):
+    status, headers, body = response(request(app, "POST", "/scores/player1", {"points": 5}))
+    assert status == 200
+    assert headers[b"content-length"] == str(len(body)).encode()
+    assert json.loads(body) == {"player_id": "player1", "score": 6.0}
+
+
+def test_update_unknown_player(app):
+    status, _, body = response(request(app, "POST", "/scores/nobody", {"points": 5}))
+    assert status == 404 and "error" in json.loads(body)
+
+
+def test_bulk_update_is_atomic(app, engine):
+    status, _, body = response(request(app, "POST", "/scores", {"updates": [["player1", 1], ["player2", 2]]}))
+    assert status == 200 and json.loads(body) == {"updated": 2}
+    status, _, _ = response(request(app, "POST", "/scores", {"updates": [["player1", 1], ["nobody", 2]]}))
+    assert status == 404
+    assert engine.get_score("player1") == 2.0
+
+
+def test_leaderboard_pages(app):
+    status, _, body = response(request(app, "GET", "/scores", query=b"offset=1&limit=2"))
+    page = json.loads(body)
+    assert status == 200 and page["total"] == 5
+    assert [entry["player_id"] for entry in page["entries"]] == ["player3", "player2"]
+    assert page["entries"][0]["rank"] == 2
+
+
+def test_export_is_streamed_in_chunks(app):
+    messages = request(app, "GET", "/export/scores")
+    assert b"content-length" not in dict(messages[0]["headers"])
+    assert [m["more_body"] for m in messages[1:]] == [True, True, False]
+    rows = [json.loads(line) for line in b"".join(m["body"] for m in messages[1:]).splitlines()]
+    assert len(rows) == 5
+
+
+def test_invalid_requests(app):
+    assert response(request(app, "POST", "/scores/player1", {"points": "x"}))[0] == 400
+    assert response(request(app, "DELETE", "/scores"))[0] == 405
+    assert response(request(app, "GET", "/nowhere"))[0] == 404
+
+
+def test_duplicate_events_are_reported(app, engine):
+    request(app, "POST", "/scores/player1", {"points": 5, "event_id": "evt-1"})
+    status, _, body = response(request(app, "POST", "/scores/player1", {"points": 5, "event_id": "evt-1"}))
+    assert status == 200 and json.loads(body) == {"player_id": "player1", "score": 6.0, "duplicate": True}
+    status, _, body = response(request(app, "POST", "/scores", {"updates": [["player2", 1, "evt-1"],
+                                                                            ["player2", 1, "evt-2"]]}))
+    assert json.loads(body) == {"updated": 1}
+
+
+def test_rate_limited_events_get_429(engine):
+    app = create_asgi_app(WebFrameworkAdapter(engine, AdmissionControl(rate=0.5, burst=1)))
+    assert response(request(app, "POST", "/scores/player1", {"points": 5}))[0] == 200
+    status, headers, body = response(request(app, "POST", "/scores/player1", {"points": 5}))
+    assert status == 429 and headers[b"retry-after"] == b"2"
+    assert engine.get_score("player1") == 6.0
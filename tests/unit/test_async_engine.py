@@ -0,0 +1,68 @@
+# tests/unit/test_async_engine.py
+
+import asyncio
+
+import pytest
+from pyscored.adapters.web_frameworks import WebFrameworkAdapter
+from pyscored.core.async_engine import AsyncScoringEngine
+from pyscored.core.scoring_engine import ScoringEngine
+
+
+def test_concurrent_updates_are_batched():
+    async def run():
+        async with AsyncScoringEngine(max_batch=64) as scores:
+            await scores.initialize_score("alice")
+
+            async def client():
+                for _ in range(10):
+                    await scores.update_score("alice", 1)
+
+            await asyncio.gather(*(client() for _ in range(100)))
+            assert scores.get_score("alice") == 1000.0
+            return scores.batches
+
+    # 1001 writes applied in far fewer actor iterations.
+    assert asyncio.run(run()) < 200
+
+
+def test_snapshot_is_taken_lazily_after_writes():
+    async def run():
+        async with AsyncScoringEngine() as scores:
+            await scores.initialize_score("alice", 1)
+            first = scores.snapshot()
+            assert scores.snapshot() is first
+            await scores.update_score("alice", 1)
+            assert scores._snapshot is None
+            second = scores.snapshot()
+            assert second is not first and first["alice"] == 1.0 and second["alice"] == 2.0
+
+    asyncio.run(run())
+
+
+def test_errors_are_returned_to_the_caller():
+    async def run():
+        async with AsyncScoringEngine() as scores:
+            await scores.initialize_score("alice", 5)
+            results = await asyncio.gather(scores.update_score("nobody", 1), scores.update_score("alice", 1),
+                                           return_exceptions=True)
+            assert isinstance(results[0], ValueError) and results[1] is True
+            assert scores.get_score("alice") == 6.0
+            assert await scores.update_scores([("alice", 1), ("alice", 2)]) == 2
+            assert await scores.call(lambda engine: engine.get_score("alice")) == 9.0
+        with pytest.raises(RuntimeError):
+            await scores.update_score("alice", 1)
+
+    asyncio.run(run())
+
+
+def test_adapter_routes_writes_through_the_actor():
+    async def run():
+        engine = ScoringEngine()
+        async with AsyncScoringEngine(engine) as scores:
+            adapter = WebFrameworkAdapter(scores)
+            await adapter.setup_user("alice")
+            await adapter.update_user_score("alice", 7)
+            assert await adapter.get_user_score("alice") == 7.0
+        assert adapter.engine is engine and engine.get_score("alice") == 7.0
+
+    asyncio.run(run())
@@ -0,0 +1,121 @@
+# tests/unit/test_crdt.py
+
+import itertools
+
+import pytest
+from pyscored.core.crdt import CRDTScores
+from pyscored.core.scoring_engine import ScoringEngine
+from pyscored.utils.fixed_point import FixedPoint
+
+
+def make_nodes(count=2):
+    clock = itertools.count(1)
+    nodes = [ScoringEngine(fixed_point=FixedPoint(scale=1000)) for _ in range(count)]
+    for i, engine in enumerate(nodes):
+        # A shared logical clock keeps "latest" deterministic across nodes.
+        engine.enable_crdt(f"node{i}")._clock = lambda: next(clock)
+    return nodes
+
+
+def sync(a, b):
+    b.crdt.merge(a.crdt.delta()[0])
+    a.crdt.merge(b.crdt.delta()[0])
+
+
+def test_concurrent_increments_add_up():
+    a, b = make_nodes()
+    a.initialize_score("alice", 10)
+    sync(a, b)
+    a.update_score("alice", 5)
+    b.update_score("alice", -2.5)
+    b.update_score("alice", 1)
+    sync(a, b)
+    assert a.get_score("alice") == b.get_score("alice") == 13.5
+
+
+def test_latest_reset_wins_over_older_increments():
+    a, b = make_nodes()
+    a.initialize_score("alice", 10)
+    sync(a, b)
+    a.update_score("alice", 5)
+    b.reset_score("alice")
+    sync(a, b)
+    assert a.get_score("alice") == b.get_score("alice") == 0.0
+    a.update_score("alice", 1)
+    sync(a, b)
+    assert b.get_score("alice") == 1.0
+
+
+def test_merge_is_idempotent_and_order_independent():
+    a, b, c = make_nodes(3)
+    a.initialize_score("alice", 1)
+    for engine in (b, c):
+        engine.crdt.merge(a.crdt.delta()[0])
+    b.update_score("alice", 2)
+    c.update_score("alice", 3)
+    c.initialize_score("bob", 4)
+    deltas = [engine.crdt.delta()[0] for engine in (a, b, c)]
+    for delta in deltas + deltas[::-1]:
+        a.crdt.merge(delta)
+    for delta in deltas[::-1]:
+        b.crdt.merge(delta)
+    assert dict(a.crdt.items()) == dict(b.crdt.items()) == {"alice": 6000, "bob": 4000}
+    assert dict(a.snapshot().items()) == dict(b.snapshot().items())
+
+
+def test_delta_contains_only_changes_since_version():
+    a, b = make_nodes()
+    for i in range(100):
+        a.initialize_score(f"player{i}")
+    seen = b.crdt.merge_from(a.crdt)
+    a.update_score("player7", 1)
+    a.apply_changes({}, ["player8"])
+    delta, version = a.crdt.delta(seen)
+    assert set(delta) == {"player7", "player8"}
+    changed = b.crdt.merge(delta)
+    assert changed == {"player7": 1000, "player8": None}
+    assert "player8" not in b.snapshot()
+    assert a.crdt.delta(version)[0] == {}
+
+
+def test_merged_changes_are_not_recorded_as_local_writes():
+    a, b = make_nodes()
+    a.initialize_score("alice", 1)
+    b.crdt.merge_from(a.crdt)
+    assert b.get_score("alice") == 1.0
+    assert b.crdt.delta()[0]["alice"][1] == "node0"
+
+
+def test_merge_inside_a_transaction_is_not_recorded_as_local_writes():
+    a, b = make_nodes()
+    a.initialize_score("alice", 1)
+    a.initialize_score("bob", 2)
+    sync(a, b)
+    a.update_score("alice", 2)
+    a.apply_changes({}, ["bob"])
+    with b.transaction():
+        b.crdt.merge_from(a.crdt)
+        b.initialize_score("carol", 5)
+    assert b.get_score("alice") == 3.0 and "bob" not in b.snapshot()
+    states = b.crdt.delta()[0]
+    assert states["alice"][1] == "node0" and states["bob"][1] == "node0"
+    assert states["carol"][1] == "node1" and not b.crdt._merged
+    # Concurrent increments still add up, as the merge did not start a local epoch.
+    a.update_score("alice", 1)
+    b.update_score("alice", 1)
+    sync(a, b)
+    assert a.get_score("alice") == b.get_score("alice") == 5.0
+
+
+def test_standalone_counter():
+    crdt = CRDTScores("solo")
+    crdt.assign("alice", 0)
+    crdt.increment("alice", 3)
+    crdt.increment("alice", -1)
+    assert crdt.value("alice") == 2 and len(crdt) == 1
+    with pytest.raises(ValueError):
+        crdt.increment("bob", 1)
+    crdt.assign("alice", None)
+    assert "alice" not in crdt
+    crdt.compact(["alice"])
+    assert crdt.delta()[0] == {}
@@ -0,0 +1,94 @@
+# tests/unit/test_dedup.py
+
+import pytest
+from pyscored.core.dedup import EventDeduplicator
+from pyscored.core.scoring_engine import ScoringEngine
+from pyscored.plugins.streak_reward_plugin import StreakRewardPlugin
+from pyscored.storage.memory import InMemoryStore
+from pyscored.utils.fixed_point import FixedPoint
+
+
+def test_seen_remembers_ids():
+    dedup = EventDeduplicator(expected_events=1000)
+    assert not dedup.seen("evt-1")
+    assert dedup.seen("evt-1")
+    assert "evt-1" in dedup and "evt-2" not in dedup
+
+
+def test_ids_expire_after_window(fake_clock):
+    dedup = EventDeduplicator(window=100.0, generations=4, expected_events=1000, recent=10.0, clock=fake_clock)
+    dedup.add("evt-1")
+    fake_clock.now = 50.0
+    # Out of the exact window but still in a Bloom filter generation.
+    assert "evt-1" in dedup and len(dedup) == 0
+    fake_clock.now = 150.0
+    assert "evt-1" not in dedup
+
+
+def test_false_positive_rate_is_bounded(fake_clock):
+    dedup = EventDeduplicator(window=100.0, expected_events=20_000, false_positive_rate=1e-3, recent=1.0,
+                              clock=fake_clock)
+    for i in range(20_000):
+        fake_clock.now = i * 100.0 / 20_000
+        dedup.add(f"evt-{i}")
+    false_positives = sum(f"other-{i}" in dedup for i in range(20_000))
+    assert false_positives / 20_000 < 3e-3
+
+
+def test_duplicate_updates_are_dropped():
+    engine = ScoringEngine()
+    engine.initialize_score("alice")
+    assert engine.update_score("alice", 10, event_id="evt-1")
+    assert not engine.update_score("alice", 10, event_id="evt-1")
+    assert engine.update_scores([("alice", 5, "evt-1"), ("alice", 5, "evt-2"), ("alice", 5, "evt-2"),
+                                 ("alice", 1)]) == 2
+    assert engine.get_score("alice") == 16.0
+
+
+def test_rolled_back_events_can_be_retried():
+    engine = ScoringEngine()
+    engine.initialize_score("alice")
+    with pytest.raises(ValueError):
+        engine.update_scores([("alice", 5, "evt-1"), ("nobody", 5, "evt-2")])
+    with pytest.raises(ValueError):
+        engine.update_score("nobody", 5, event_id="evt-2")
+    assert engine.update_scores([("alice", 5, "evt-1")]) == 1
+    assert engine.get_score("alice") == 5.0
+
+
+class FlakyStore(InMemoryStore):
+    failures = 0
+
+    def __setitem__(self, player_id, score):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("disk full")
+        super().__setitem__(player_id, score)
+
+
+def test_events_whose_write_fails_can_be_retried():
+    store = FlakyStore()
+    engine = ScoringEngine(store=store)
+    engine.initialize_score("alice")
+    store.failures = 1
+    with pytest.raises(OSError):
+        engine.update_score("alice", 5, event_id="evt-1")
+    assert engine.update_score("alice", 5, event_id="evt-1")
+    fixed = ScoringEngine(fixed_point=FixedPoint(scale=1000))
+    fixed.initialize_score("alice")
+    with fixed.transaction():
+        with pytest.raises(OverflowError):
+            fixed.update_score("alice", 1e300, event_id="evt-1")
+        assert fixed.update_score("alice", 5, event_id="evt-1")
+    assert engine.get_score("alice") == fixed.get_score("alice") == 5.0
+
+
+def test_retried_plugin_events_do_not_advance_streaks():
+    engine = ScoringEngine()
+    engine.initialize_score("alice")
+    engine.register_plugin(StreakRewardPlugin("streak", reward_streak=2, reward_points=50))
+    engine.execute_plugin("streak", event_id="evt-1", player_id="alice", action_successful=True)
+    engine.execute_plugin("streak", event_id="evt-1", player_id="alice", action_successful=True)
+    assert engine.get_score("alice") == 0.0
+    engine.execute_plugin("streak", event_id="evt-2", player_id="alice", action_successful=True)
+    assert engine.get_score("alice") == 50.0
@@ -0,0 +1,93 @@
+# tests/unit/test_feed.py
+
+import asyncio
+
+import pytest
+from pyscored.adapters.web_frameworks import WebFrameworkAdapter
+from pyscored.core.scoring_engine import ScoringEngine
+
+
+@pytest.fixture
+def engine():
+    engine = ScoringEngine()
+    for i in range(5):
+        engine.initialize_score(f"player{i}", float(i))
+    engine.change_feed.interval = 0.001
+    return engine
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, timeout=5))
+
+
+def test_player_changes_are_coalesced_per_tick(engine):
+    async def scenario():
+        subscription = engine.subscribe(players=["player1", "player2"])
+        engine.update_score("player1", 1.0)
+        engine.update_score("player1", 1.0)
+        engine.update_score("player3", 1.0)
+        assert await subscription.__anext__() == {"player1": 3.0}
+        subscription.close()
+
+    run(scenario())
+
+
+def test_subscribers_share_one_payload(engine):
+    async def scenario():
+        first = engine.subscribe(players=["player1"])
+        second = engine.subscribe(players=["player1"])
+        engine.update_score("player1", 1.0)
+        assert (await first.__anext__()) is (await second.__anext__())
+
+    run(scenario())
+
+
+def test_subscriptions_of_a_closed_loop_are_dropped(engine):
+    async def scenario():
+        subscriptions = engine.subscribe(players=["player1"]), engine.subscribe(top_k=2)
+        # The loop ends before the tick this write schedules can run.
+        engine.update_score("player1", 1.0)
+        return subscriptions
+
+    subscriptions = run(scenario())
+    engine.update_score("player1", 1.0)
+    assert all(subscription.closed for subscription in subscriptions)
+    assert len(engine.change_feed) == 0 and engine.get_score("player1") == 3.0
+
+
+def test_slow_consumer_is_conflated(engine):
+    async def scenario():
+        subscription = engine.subscribe()
+        engine.update_score("player1", 1.0)
+        await asyncio.sleep(0.02)
+        engine.update_score("player2", 1.0)
+        await asyncio.sleep(0.02)
+        assert await subscription.__anext__() == {"player1": 2.0, "player2": 3.0}
+
+    run(scenario())
+
+
+def test_slow_consumer_is_dropped(engine):
+    async def scenario():
+        subscription = engine.subscribe(on_lag="drop", max_lag=1)
+        for _ in range(3):
+            engine.update_score("player1", 1.0)
+            await asyncio.sleep(0.02)
+        assert subscription.dropped
+        assert [changes async for changes in subscription] == []
+        assert len(engine.change_feed) == 0
+
+    run(scenario())
+
+
+def test_leaderboard_view_updates(engine):
+    async def scenario():
+        adapter = WebFrameworkAdapter(engine)
+        leaderboard = await adapter.subscribe_leaderboard(top_k=2)
+        assert await leaderboard.__anext__() == [("player4", 4.0), ("player3", 3.0)]
+        engine.update_score("player0", 10.0)
+        assert await leaderboard.__anext__() == [("player0", 10.0), ("player4", 4.0)]
+        engine.update_score("player0", -20.0)
+        assert await leaderboard.__anext__() == [("player4", 4.0), ("player3", 3.0)]
+
+    run(scenario())
@@ -0,0 +1,73 @@
+# tests/unit/test_fixed_point.py
+
+import pytest
+from pyscored.core.scoring_engine import ScoringEngine
+from pyscored.plugins.combo_bonus_plugin import ComboBonusPlugin
+from pyscored.storage.array import ArrayStore
+from pyscored.utils.fixed_point import FixedPoint
+from decimal import ROUND_FLOOR
+
+
+@pytest.fixture
+def engine():
+    engine = ScoringEngine(fixed_point=FixedPoint(scale=100))
+    engine.initialize_score("player1", 1.5)
+    return engine
+
+
+def test_rounds_half_to_even_by_decimal_value():
+    fixed = FixedPoint(scale=1000)
+    assert fixed.to_fixed(0.285) == 285
+    assert fixed.to_fixed(0.0005) == 0
+    assert fixed.to_fixed(0.0015) == 2
+    assert fixed.to_fixed(-0.0015) == -2
+    assert fixed.to_fixed(3) == 3000
+
+
+def test_other_rounding_modes():
+    assert FixedPoint(scale=10, rounding=ROUND_FLOOR).to_fixed(-0.11) == -2
+
+
+def test_rejects_non_finite_and_overflow():
+    with pytest.raises(ValueError):
+        FixedPoint().to_fixed(float("nan"))
+    with pytest.raises(OverflowError):
+        FixedPoint(scale=10 ** 12).to_fixed(10 ** 8)
+
+
+def test_engine_stores_exact_integers(engine):
+    for _ in range(1000):
+        engine.update_score("player1", 0.1)
+    assert engine.get_raw_score("player1") == 10150
+    assert engine.get_score("player1") == 101.5
+    assert isinstance(engine._store, ArrayStore)
+
+
+def test_plugin_bonuses_are_rounded(engine):
+    engine.register_plugin(ComboBonusPlugin("combo", bonus_threshold=1, bonus_multiplier=1.005))
+    engine.execute_plugin("combo", player_id="player1", action_successful=True, base_points=1)
+    assert engine.get_raw_score("player1") == 250
+    assert engine.quantize(1.005) == 1.0
+
+
+def test_reset_and_snapshot(engine):
+    snapshot = engine.snapshot()
+    engine.reset_score("player1")
+    assert engine.get_raw_score("player1") == 0
+    assert snapshot["player1"] == 150
+
+
+def test_array_store_total_and_delete():
+    store = ArrayStore("q", chunk_size=2)
+    for i in range(5):
+        store[f"player{i}"] = i
+    del store["player4"]
+    store["player5"] = 10
+    assert store.total() == 16
+    assert dict(store.snapshot().items()) == {"player0": 0, "player1": 1, "player2": 2, "player3": 3, "player5": 10}
+
+
+def test_engine_from_config_with_fixed_point():
+    engine = ScoringEngine.from_config({"fixed_point": {"scale": 10}})
+    engine.initialize_score("player1", 0.25)
+    assert engine.get_raw_score("player1") == 2
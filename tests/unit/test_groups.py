@@ -0,0 +1,53 @@
+# tests/unit/test_groups.py
+
+import random
+
+import pytest
+from pyscored.core.scoring_engine import ScoringEngine
+
+
+def brute_force(engine, members, top_n):
+    scores = sorted(engine.get_score(player_id) for player_id in members)
+    return sum(scores), len(scores), sum(scores[-top_n:])
+
+
+def test_aggregates_follow_score_changes():
+    rng = random.Random(7)
+    engine = ScoringEngine()
+    players = [f"player{i}" for i in range(60)]
+    for player_id in players:
+        engine.initialize_score(player_id, rng.randrange(100))
+    groups = engine.enable_groups(top_n=3)
+    groups.add_members("red", players[:30])
+    groups.add_members("blue", players[20:])
+    assert groups.top_groups(2, by="top")  # index built before the updates below
+    for _ in range(500):
+        engine.update_score(rng.choice(players), rng.randrange(-20, 50))
+    with engine.transaction():
+        engine.initialize_score(players[0], 1000)
+    for name, members in (("red", players[:30]), ("blue", players[20:])):
+        stats = groups.stats(name)
+        total, count, top = brute_force(engine, members, 3)
+        assert stats.total == pytest.approx(total) and stats.count == count and stats.top == pytest.approx(top)
+    best = max(("red", "blue"), key=lambda name: groups.stats(name).top)
+    assert groups.top_groups(1, by="top")[0][0] == best and groups.rank(best, by="top") == 1
+
+
+def test_merge_and_remove_members():
+    engine = ScoringEngine()
+    for player_id, score in (("a", 10), ("b", 20), ("c", 30), ("d", 40)):
+        engine.initialize_score(player_id, score)
+    groups = engine.groups
+    groups.add_members("wolves", ["a", "b", "c"])
+    groups.add_members("bears", ["c", "d", "e"])
+    assert groups.top_groups(by="mean") == [("bears", 35.0), ("wolves", 20.0)]
+    groups.merge_groups("wolves", "bears")
+    assert "bears" not in groups and groups.members("wolves") == {"a", "b", "c", "d", "e"}
+    assert groups.stats("wolves") == (100.0, 4, 25.0, 100.0)
+    engine.initialize_score("e", 5)
+    groups.remove_members("wolves", ["a", "d"])
+    assert groups.stats("wolves") == (55.0, 3, 55.0 / 3, 55.0)
+    assert groups.groups_of("c") == {"wolves"} and groups.groups_of("a") == set()
+    groups.rebuild()
+    assert groups.stats("wolves").total == 55.0
+    assert groups.top_groups(by="mean") == [("wolves", 55.0 / 3)]
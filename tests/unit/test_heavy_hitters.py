@@ -0,0 +1,64 @@
+# tests/unit/test_heavy_hitters.py
+
+import random
+
+from pyscored.analytics.heavy_hitters import HeavyHitters
+from pyscored.core.scoring_engine import ScoringEngine
+
+
+def test_finds_heavy_hitters_with_bounded_error():
+    rng = random.Random(3)
+    events = ["bot1"] * 2000 + ["bot2"] * 1000 + [f"player{rng.randrange(5000)}" for _ in range(7000)]
+    rng.shuffle(events)
+    hitters = HeavyHitters(capacity=50)
+    for player_id in events:
+        hitters.offer(player_id)
+    top = hitters.top_active(2)
+    assert [player_id for player_id, _, _ in top] == ["bot1", "bot2"]
+    for player_id, expected in (("bot1", 2000), ("bot2", 1000)):
+        count, error = hitters.estimate(player_id)
+        assert count - error <= expected <= count
+        assert error <= hitters.total / hitters.capacity
+
+
+def test_untracked_estimate_is_an_upper_bound():
+    hitters = HeavyHitters(capacity=2)
+    for player_id in ("a", "a", "b", "c"):
+        hitters.offer(player_id)
+    count, error = hitters.estimate("b")
+    assert count >= 0 and count == error
+
+
+def test_rates_and_windows(fake_clock):
+    hitters = HeavyHitters(capacity=10, window=10.0, clock=fake_clock)
+    for _ in range(20):
+        hitters.offer("player1")
+    fake_clock.now = 4.0
+    assert hitters.rate("player1") == (5.0, 0.0)
+    fake_clock.now = 10.0
+    hitters.offer("player2")
+    assert hitters.estimate("player1") == (0, 0)
+    assert hitters.total == 1
+
+
+def test_merge_combines_shards():
+    left, right = HeavyHitters(capacity=4), HeavyHitters(capacity=4)
+    for _ in range(5):
+        left.offer("player1")
+        right.offer("player1")
+    right.offer("player2")
+    left.merge(right)
+    assert left.top_active(1) == [("player1", 10, 0)]
+    assert left.total == 11
+
+
+def test_engine_feeds_update_stream():
+    engine = ScoringEngine()
+    engine.enable_heavy_hitters(capacity=8)
+    engine.initialize_score("player1")
+    engine.initialize_score("player2")
+    for _ in range(3):
+        engine.update_score("player1", 1.0)
+    engine.reset_score("player2")
+    engine.apply_changes({"player2": 5.0})
+    assert engine.top_active(2) == [("player1", 3, 0)]
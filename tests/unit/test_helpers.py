@@ -29,3 +29,12 @@ def test_clamp_score():
     assert clamp_score(10, 0, 5) == 5
     assert clamp_score(-1, 0, 5) == 0
     assert clamp_score(3, 0, 5) == 3
+
+def test_format_score_fixed_point():
+    assert format_score(1234567, scale=1000) == "1234.57"
+    assert format_score(1235, decimals=2, scale=1000) == "1.24"
+    assert format_score(-5, decimals=3, scale=1000) == "-0.005"
+
+def test_clamp_score_fixed_point():
+    assert clamp_score(5000, 0, 2.5, scale=1000) == 2500
+    assert clamp_score(-3, 0, scale=1000) == 0
@@ -0,0 +1,68 @@
+# tests/unit/test_metrics.py
+
+import random
+
+import pytest
+from pyscored.core.metrics import MetricTable
+from pyscored.core.scoring_engine import ScoringEngine
+
+
+def test_update_touches_several_metrics():
+    engine = ScoringEngine()
+    table = engine.enable_metrics(["points", "kills", "survived", "accuracy"])
+    engine.update_metrics("alice", points=100, kills=3, survived=42.5)
+    engine.update_metrics("alice", points=20, kills=1)
+    table.set("alice", accuracy=0.75)
+    assert table.get("alice") == {"points": 120, "kills": 4, "survived": 42.5, "accuracy": 0.75}
+    assert table.value("bob", "kills") == 0 and len(table) == 1
+    with pytest.raises(KeyError):
+        table.update("alice", headshots=1)
+    assert table.get("alice")["points"] == 120
+
+
+def test_rankings_match_sorting():
+    rng = random.Random(4)
+    table = MetricTable(["points", "kills", "deaths"])
+    table.add_ranking("ladder", ["points", "-deaths"])
+    players = [f"p{i}" for i in range(40)]
+    for _ in range(400):
+        table.update(rng.choice(players), points=rng.randrange(3), kills=rng.randrange(5), deaths=rng.randrange(2))
+    table.add_ranking("mvp", weights={"kills": 2, "points": 1})  # built from existing records
+    for _ in range(400):
+        table.update(rng.choice(players), points=rng.randrange(3), deaths=rng.randrange(2))
+    table.remove(players[0])
+    records = {player_id: table.get(player_id) for player_id in table.players}
+    ladder = sorted(records, key=lambda p: (records[p]["points"], -records[p]["deaths"], p), reverse=True)
+    mvp = sorted(records, key=lambda p: (2 * records[p]["kills"] + records[p]["points"], p), reverse=True)
+    assert [player_id for player_id, _ in table.top("ladder", 10)] == ladder[:10]
+    assert [player_id for player_id, _ in table.top("mvp", 10)] == mvp[:10]
+    best = ladder[0]
+    assert table.rank("ladder", best) == 1
+    key = lambda p: (records[p]["points"], -records[p]["deaths"])
+    worst = ladder[-1]
+    assert table.rank("ladder", worst) == 1 + sum(key(p) > key(worst) for p in records)
+
+
+def test_remove_keeps_columns_dense():
+    table = MetricTable(["points"])
+    for i, player_id in enumerate("abc"):
+        table.update(player_id, points=i)
+    table.add_ranking("points", ["points"])
+    table.remove("a")
+    assert sorted(table.players) == ["b", "c"] and len(table.column("points")) == 2
+    assert table.get("c") == {"points": 2} and table.rank("points", "b") == 2
+    with pytest.raises(ValueError):
+        table.add_ranking("both", ["points"], weights={"points": 1})
+
+
+def test_metrics_are_standalone_from_transactions():
+    engine = ScoringEngine()
+    engine.enable_metrics(["kills"])
+    engine.initialize_score("alice")
+    with pytest.raises(RuntimeError):
+        with engine.transaction():
+            engine.update_score("alice", 10)
+            engine.update_metrics("alice", kills=1)
+            raise RuntimeError("rolled back")
+    assert engine.get_score("alice") == 0.0
+    assert engine.metrics.value("alice", "kills") == 1.0
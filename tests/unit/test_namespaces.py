@@ -0,0 +1,70 @@
+# tests/unit/test_namespaces.py
+
+import pytest
+from pyscored.core.namespaces import NamespacedEngine
+
+
+@pytest.fixture
+def namespaced(tmp_path):
+    engine = NamespacedEngine(storage_dir=tmp_path, max_resident=2)
+    engine.configure_rule("double", lambda points: points * 2)
+    engine.add_plugin("combo", "combo_bonus", bonus_threshold=2, bonus_multiplier=1.0)
+    return engine
+
+
+def test_namespaces_are_isolated(namespaced):
+    namespaced["game1"].initialize_score("player1", 10.0)
+    namespaced["game2"].initialize_score("player1", 20.0)
+    assert namespaced["game1"].get_score("player1") == 10.0
+    assert namespaced["game2"].get_score("player1") == 20.0
+
+
+def test_rules_and_player_ids_are_shared(namespaced):
+    namespaced["game1"].initialize_score("".join(["play", "er1"]))
+    namespaced["game2"].initialize_score("".join(["pla", "yer1"]))
+    key1 = next(iter(namespaced["game1"].snapshot()))
+    key2 = next(iter(namespaced["game2"].snapshot()))
+    assert key1 is key2
+    assert namespaced["game2"].apply_rule("double", points=4) == 8
+
+
+def test_cold_namespaces_page_out_and_back_in(namespaced):
+    game1 = namespaced["game1"]
+    game1.initialize_score("player1", 5.0)
+    for _ in range(2):
+        game1.execute_plugin("combo", player_id="player1", action_successful=True, base_points=1)
+    namespaced["game2"]
+    namespaced["game3"]
+    assert "game1" not in namespaced.resident()
+    assert "game1" in namespaced and "game1" in namespaced.namespaces()
+    restored = namespaced["game1"]
+    assert restored.get_score("player1") == 6.0
+    restored.execute_plugin("combo", player_id="player1", action_successful=True, base_points=1)
+    assert restored.get_score("player1") == 7.0
+
+
+def test_handles_survive_page_out(tmp_path):
+    namespaced = NamespacedEngine(storage_dir=tmp_path, max_resident=1)
+    game1 = namespaced.namespace("g1")
+    game1.initialize_score("p")
+    namespaced.namespace("g2")
+    assert namespaced.resident() == ["g2"]
+    game1.update_score("p", 10)
+    assert namespaced.resident() == ["g1"]
+    namespaced.namespace("g2")
+    assert namespaced.namespace("g1").get_score("p") == 10
+
+
+def test_for_each_visits_cold_namespaces(namespaced):
+    for name in ("a", "b", "c"):
+        namespaced[name].initialize_score("player1", 1.0)
+    totals = {}
+    namespaced.for_each(lambda name, engine: totals.__setitem__(name, engine.get_score("player1")), include_cold=True)
+    assert totals == {"a": 1.0, "b": 1.0, "c": 1.0}
+
+
+def test_drop_removes_namespace(namespaced):
+    namespaced["game1"].initialize_score("player1")
+    namespaced.flush()
+    namespaced.drop("game1")
+    assert "game1" not in namespaced
@@ -0,0 +1,81 @@
+# tests/unit/test_plugin_registry.py
+
+import json
+import sys
+
+import pytest
+from pyscored.core.scoring_engine import ScoringEngine
+from pyscored.plugins.base_plugin import BasePlugin
+from pyscored.plugins.registry import PluginRegistry
+
+
+class DoublerPlugin(BasePlugin):
+    def __init__(self, name: str, factor: float = 2.0):
+        super().__init__(name)
+        self.factor = factor
+
+    def execute(self, player_id: str, points: float) -> None:
+        self.engine.update_score(player_id, points * self.factor)
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return PluginRegistry(cache_dir=tmp_path)
+
+
+def test_builtin_plugins_are_discoverable(registry):
+    assert {"combo_bonus", "streak_reward", "time_decay"} <= set(registry.names())
+
+
+def test_manifest_is_cached(registry, tmp_path):
+    registry.names()
+    manifest = json.loads(registry.manifest_path.read_text())
+    assert "fingerprint" in manifest
+    manifest["plugins"]["cached_only"] = "some.module:Plugin"
+    registry.manifest_path.write_text(json.dumps(manifest))
+    assert "cached_only" in PluginRegistry(cache_dir=tmp_path).names()
+
+
+def test_plugin_class_loaded_on_first_use(registry):
+    sys.modules.pop("pyscored.plugins.time_decay_plugin", None)
+    assert "time_decay" in registry
+    assert "pyscored.plugins.time_decay_plugin" not in sys.modules
+    registry.load("time_decay")
+    assert "pyscored.plugins.time_decay_plugin" in sys.modules
+
+
+def test_old_streak_import_path_is_lazy(registry, monkeypatch):
+    for module in ("combo_bonus_plugin", "streak_reward_plugin"):
+        monkeypatch.delitem(sys.modules, f"pyscored.plugins.{module}", raising=False)
+    registry.load("combo_bonus")
+    assert "pyscored.plugins.streak_reward_plugin" not in sys.modules
+    from pyscored.plugins.combo_bonus_plugin import StreakRewardPlugin
+    assert StreakRewardPlugin is registry.load("streak_reward")
+
+
+def test_unknown_plugin_type(registry):
+    with pytest.raises(ValueError):
+        registry.load("missing")
+
+
+def test_engine_from_config(registry):
+    registry.register("doubler", DoublerPlugin)
+    engine = ScoringEngine.from_config(
+        {"plugins": {"x3": {"type": "doubler", "factor": 3}, "combo_bonus": {"bonus_threshold": 1, "bonus_multiplier": 2}}},
+        registry=registry,
+    )
+    engine.initialize_score("player1")
+    engine.execute_plugin("x3", player_id="player1", points=5)
+    engine.execute_plugin("combo_bonus", player_id="player1", action_successful=True, base_points=10)
+    assert engine.get_score("player1") == 35
+    assert engine.get_plugin("x3").config() == {"name": "x3"}
+
+
+def test_engine_from_toml(registry, tmp_path):
+    path = tmp_path / "engine.toml"
+    path.write_text('[plugins.streaks]\ntype = "streak_reward"\nreward_streak = 2\nreward_points = 50\n')
+    engine = ScoringEngine.from_toml(str(path), registry=registry)
+    engine.initialize_score("player1")
+    for _ in range(2):
+        engine.execute_plugin("streaks", player_id="player1", action_successful=True)
+    assert engine.get_score("player1") == 50
@@ -0,0 +1,101 @@
+# tests/unit/test_quantiles.py
+
+import random
+
+import pytest
+from pyscored.analytics.quantiles import QuantileSketch
+from pyscored.core.scoring_engine import ScoringEngine
+
+
+def exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def test_quantiles_within_relative_accuracy():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(5, 2) for _ in range(5000)]
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+    for q in (0.0, 0.1, 0.5, 0.9, 0.99, 1.0):
+        expected = exact_quantile(values, q)
+        assert abs(sketch.quantile(q) - expected) <= 0.01 * expected + 1e-9
+
+
+def test_negative_and_zero_values():
+    sketch = QuantileSketch()
+    for value in (-100.0, -1.0, 0.0, 1.0, 100.0):
+        sketch.add(value)
+    assert sketch.quantile(0.0) == pytest.approx(-100.0, rel=0.01)
+    assert sketch.quantile(0.5) == 0.0
+    assert sketch.percentile_of(0.0) == 0.6
+
+
+def test_remove_and_move():
+    sketch = QuantileSketch()
+    sketch.add(10.0)
+    sketch.add(20.0)
+    sketch.move(20.0, 5.0)
+    sketch.remove(10.0)
+    assert len(sketch) == 1
+    assert sketch.quantile(1.0) == pytest.approx(5.0, rel=0.01)
+
+
+def test_histogram_counts_all_values():
+    sketch = QuantileSketch()
+    for value in range(1, 101):
+        sketch.add(float(value))
+    bins = sketch.histogram(4)
+    assert len(bins) == 4
+    assert sum(count for _, _, count in bins) == 100
+    assert sketch.histogram([0, 50, 100])[0][2] == pytest.approx(50, abs=2)
+
+
+def test_histogram_of_equal_values_and_validation():
+    sketch = QuantileSketch()
+    sketch.add(5.0)
+    sketch.add(5.0)
+    [(low, high, count)] = sketch.histogram(3)
+    assert low == high == pytest.approx(5.0, rel=0.01) and count == 2
+    with pytest.raises(ValueError):
+        sketch.histogram(0)
+
+
+def test_merge_and_serialization():
+    left, right = QuantileSketch(), QuantileSketch()
+    for value in range(1, 51):
+        left.add(float(value))
+        right.add(float(value + 50))
+    left.merge(QuantileSketch.from_dict(right.to_dict()))
+    assert len(left) == 100
+    assert left.quantile(0.5) == pytest.approx(50, rel=0.02)
+    with pytest.raises(ValueError):
+        left.merge(QuantileSketch(relative_accuracy=0.05))
+
+
+def test_engine_keeps_sketch_in_step():
+    engine = ScoringEngine()
+    for i in range(1, 11):
+        engine.initialize_score(f"player{i}", float(i * 10))
+    assert engine.percentile_of(50.0) == pytest.approx(0.5)
+    engine.update_score("player1", 1000.0)
+    engine.reset_score("player2")
+    assert engine.quantile(1.0) == pytest.approx(1010.0, rel=0.01)
+    assert engine.quantile(0.0) == 0.0
+    with pytest.raises(ValueError):
+        with engine.transaction():
+            engine.update_score("player3", 5000.0)
+            raise ValueError("abort")
+    assert engine.quantile(1.0) == pytest.approx(1010.0, rel=0.01)
+
+
+def test_listeners_see_changes_after_commit():
+    engine = ScoringEngine()
+    changes = []
+    engine.add_listener(lambda *change: changes.append(change))
+    engine.initialize_score("player1", 1.0)
+    with engine.transaction():
+        engine.update_score("player1", 2.0)
+        assert len(changes) == 1
+    assert changes == [("player1", None, 1.0, None), ("player1", 1.0, 3.0, 2.0)]
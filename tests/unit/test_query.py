@@ -0,0 +1,70 @@
+# tests/unit/test_query.py
+
+import random
+
+import pytest
+from pyscored.core.scoring_engine import ScoringEngine
+from pyscored.storage.array import ArrayStore
+from pyscored.utils.fixed_point import FixedPoint
+
+
+def make_engines():
+    return [
+        ScoringEngine(),
+        ScoringEngine(store=ArrayStore("d", chunk_size=16)),
+        ScoringEngine(fixed_point=FixedPoint(scale=1000)),
+    ]
+
+
+@pytest.mark.parametrize("engine", make_engines())
+def test_query_matches_python(engine):
+    rng = random.Random(2)
+    for i in range(100):
+        engine.initialize_score(f"p{i}", rng.randrange(-500, 500) / 4)
+    for i in range(0, 100, 7):
+        engine.apply_changes({}, [f"p{i}"])  # freed array slots must not count as zero scores
+    scores = {player_id: engine.get_score(player_id) for player_id in engine.snapshot()}
+    query = engine.query()
+    engine.update_score("p1", 1000)  # the query keeps its snapshot
+    assert query.count() == len(scores)
+    assert query.sum() == pytest.approx(sum(scores.values()))
+    assert query.mean() == pytest.approx(sum(scores.values()) / len(scores))
+    assert query.min() == min(scores.values()) and query.max() == max(scores.values())
+    assert query.count_where(">", 10.25) == sum(score > 10.25 for score in scores.values())
+    assert query.count_where("<=", 0) == sum(score <= 0 for score in scores.values())
+    assert sorted(query.filter(">=", 50)) == sorted(item for item in scores.items() if item[1] >= 50)
+    assert len(query.filter("!=", 1e9, limit=5)) == 5
+    assert query.select(["p1", "p2", "p7", "nobody"]) == {"p1": scores["p1"], "p2": scores["p2"]}
+    histogram = query.histogram(4)
+    assert sum(count for _, _, count in histogram) == len(scores)
+    assert histogram[0][0] == min(scores.values()) and histogram[-1][1] == max(scores.values())
+    edges = [-100, 0, 100]
+    assert query.histogram(edges) == [
+        (-100, 0, sum(-100 <= s < 0 for s in scores.values())),
+        (0, 100, sum(0 <= s <= 100 for s in scores.values())),
+    ]
+
+
+def test_fixed_point_thresholds_are_quantized():
+    engine = ScoringEngine(fixed_point=FixedPoint(scale=100))
+    for i, score in enumerate([4.35, 0.29, 4.36, 1.15, 0.07]):
+        engine.initialize_score(f"p{i}", score)
+    query = engine.query()
+    assert query.count_where("==", 4.35) == 1
+    assert query.count_where("<=", 4.35) == 4
+    assert query.count_where(">=", 0.29) == 4
+    assert query.count_where("<", 0.29) == 1
+    assert query.count_where(">", 4.355) == 1 and query.count_where("<", 4.355) == 4
+    assert query.count_where("==", 4.355) == 0
+    assert [name for name, _ in query.filter("==", 1.15)] == ["p3"]
+    assert query.histogram([0.07, 0.29, 1.15, 4.35, 4.36]) == [
+        (0.07, 0.29, 1), (0.29, 1.15, 1), (1.15, 4.35, 1), (4.35, 4.36, 2)]
+
+
+def test_query_validation_and_empty_engine():
+    query = ScoringEngine().query()
+    assert query.count() == 0 and query.sum() == 0 and query.mean() == 0.0 and query.histogram() == []
+    with pytest.raises(ValueError):
+        query.count_where("~", 1)
+    with pytest.raises(ValueError):
+        query.histogram([3, 1])
@@ -0,0 +1,110 @@
+# tests/unit/test_replication.py
+
+import asyncio
+
+from pyscored.core.replication import ReplicationFollower, ReplicationLeader
+from pyscored.core.scoring_engine import ScoringEngine
+from pyscored.utils.fixed_point import FixedPoint
+
+
+def run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, 10))
+
+
+def test_follower_catches_up_from_snapshot_and_log():
+    async def scenario():
+        leader_engine, replica = ScoringEngine(), ScoringEngine()
+        for i in range(100):
+            leader_engine.initialize_score(f"player{i}", float(i))
+        leader = ReplicationLeader(leader_engine)
+        host, port = await leader.serve()
+        follower = ReplicationFollower(replica)
+        follower.connect(host, port)
+        await follower.wait_for(leader.sequence, timeout=5)
+        assert dict(replica.snapshot().items()) == dict(leader_engine.snapshot().items())
+
+        with leader_engine.transaction():
+            leader_engine.update_score("player1", 10)
+            leader_engine.initialize_score("newcomer", 5.0)
+        leader_engine.apply_changes({}, ["player2"])
+        await follower.wait_for(leader.sequence, timeout=5)
+        assert replica.get_score("player1") == 11.0
+        assert replica.get_score("newcomer") == 5.0
+        assert "player2" not in replica.snapshot()
+
+        await asyncio.sleep(0.05)
+        (status,) = leader.followers()
+        assert status.acked_sequence == leader.sequence and leader.lag == 0
+        await follower.close()
+        await leader.close()
+
+    run(scenario())
+
+
+def test_reconnecting_follower_receives_only_the_log_tail():
+    async def scenario():
+        leader_engine, replica = ScoringEngine(), ScoringEngine()
+        for i in range(50):
+            leader_engine.initialize_score(f"player{i}")
+        leader = ReplicationLeader(leader_engine)
+        host, port = await leader.serve()
+        follower = ReplicationFollower(replica)
+        follower.connect(host, port)
+        await follower.wait_for(leader.sequence, timeout=5)
+        await follower.close()
+
+        leader_engine.update_score("player3", 7)
+        applied = []
+        replica.add_listener(lambda player_id, old, new, points: applied.append(player_id))
+        follower.connect(host, port)
+        await follower.wait_for(leader.sequence, timeout=5)
+        assert applied == ["player3"]
+        assert replica.get_score("player3") == 7.0
+        await follower.close()
+        await leader.close()
+
+    run(scenario())
+
+
+def test_follower_behind_the_log_resyncs_from_snapshot():
+    async def scenario():
+        leader_engine, replica = ScoringEngine(), ScoringEngine()
+        leader_engine.initialize_score("alice")
+        leader = ReplicationLeader(leader_engine, log_size=4)
+        host, port = await leader.serve()
+        follower = ReplicationFollower(replica)
+        follower.connect(host, port)
+        await follower.wait_for(leader.sequence, timeout=5)
+        await follower.close()
+
+        for i in range(20):
+            leader_engine.initialize_score(f"player{i}", float(i))
+        follower.connect(host, port)
+        await follower.wait_for(leader.sequence, timeout=5)
+        assert dict(replica.snapshot().items()) == dict(leader_engine.snapshot().items())
+        await follower.close()
+        await leader.close()
+
+    run(scenario())
+
+
+def test_fixed_point_replication_over_unix_socket(tmp_path):
+    async def scenario():
+        fixed_point = FixedPoint(scale=1000)
+        leader_engine = ScoringEngine(fixed_point=fixed_point)
+        replica = ScoringEngine(fixed_point=fixed_point)
+        leader_engine.initialize_score("alice", 0.1)
+        leader = ReplicationLeader(leader_engine, heartbeat_interval=0.01)
+        path = str(tmp_path / "leader.sock")
+        await leader.serve_unix(path)
+        follower = ReplicationFollower(replica)
+        follower.connect_unix(path)
+        leader_engine.update_score("alice", 0.2)
+        await follower.wait_for(leader.sequence, timeout=5)
+        assert replica.get_raw_score("alice") == 300
+        await asyncio.sleep(0.05)
+        assert follower.connected and follower.staleness < 1.0
+        await follower.close()
+        await leader.close()
+
+    run(scenario())
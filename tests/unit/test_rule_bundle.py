@@ -0,0 +1,84 @@
+# tests/unit/test_rule_bundle.py
+
+import os
+
+import pytest
+from pyscored.core.rule_bundle import RuleBundle
+from pyscored.core.sandbox import Sandbox
+
+
+def write(path, source):
+    with open(path, "w") as f:
+        f.write(source)
+    # Make sure the change is visible even on filesystems with coarse timestamps.
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_bundle_loads_rules_and_caches_bytecode(tmp_path):
+    write(tmp_path / "combat.py", "import math\n\ndef kill(points):\n    return points * 2\n\n"
+                                  "def _helper():\n    pass\n")
+    sandbox = Sandbox()
+    bundle = RuleBundle(str(tmp_path))
+    bundle.install(sandbox)
+    assert set(sandbox.list_rules()) == {"kill"}
+    assert sandbox.execute_rule("kill", points=5) == 10
+    assert bundle.compiled == 1
+    warm = RuleBundle(str(tmp_path))
+    warm.reload()
+    assert warm.compiled == 0 and set(warm.rules) == {"kill"}
+
+
+def test_reload_swaps_changed_rules(tmp_path):
+    write(tmp_path / "combat.py", "def kill(points):\n    return points * 2\n\ndef assist(points):\n    return 1\n")
+    sandbox = Sandbox()
+    sandbox.add_rule("manual", lambda: 0)
+    bundle = RuleBundle(str(tmp_path))
+    bundle.install(sandbox)
+    write(tmp_path / "combat.py", "def kill(points):\n    return points * 3\n")
+    changed, removed = bundle.reload()
+    assert set(changed) == {"kill"} and removed == ["assist"]
+    assert sandbox.execute_rule("kill", points=5) == 15
+    assert set(sandbox.list_rules()) == {"kill", "manual"}
+    assert bundle.reload() == ({}, [])
+
+
+def test_broken_file_keeps_previous_rules(tmp_path):
+    write(tmp_path / "combat.py", "def kill(points):\n    return points * 2\n")
+    sandbox = Sandbox()
+    bundle = RuleBundle(str(tmp_path))
+    bundle.install(sandbox)
+    write(tmp_path / "combat.py", "def kill(points:\n")
+    with pytest.raises(SyntaxError):
+        bundle.reload()
+    assert sandbox.execute_rule("kill", points=5) == 10
+    assert bundle.reload() == ({}, [])
+    os.remove(tmp_path / "combat.py")
+    assert bundle.reload() == ({}, ["kill"])
+    assert sandbox.list_rules() == {}
+
+
+def test_removing_a_file_keeps_rules_other_files_define(tmp_path):
+    write(tmp_path / "a.py", "def kill(points):\n    return 1\n\ndef assist():\n    return 0\n")
+    write(tmp_path / "b.py", "def kill(points):\n    return 2\n")
+    sandbox = Sandbox()
+    bundle = RuleBundle(str(tmp_path))
+    bundle.install(sandbox)
+    assert sandbox.execute_rule("kill", points=5) == 2
+    os.remove(tmp_path / "b.py")
+    changed, removed = bundle.reload()
+    assert set(changed) == {"kill"} and removed == []
+    assert sandbox.execute_rule("kill", points=5) == 1
+    os.remove(tmp_path / "a.py")
+    changed, removed = bundle.reload()
+    assert changed == {} and sorted(removed) == ["assist", "kill"]
+
+
+def test_unwritable_cache_still_loads_rules(tmp_path):
+    rules = tmp_path / "rules"
+    rules.mkdir()
+    write(rules / "combat.py", "def kill(points):\n    return points * 2\n")
+    write(tmp_path / "not_a_directory", "")
+    bundle = RuleBundle(str(rules), cache_dir=str(tmp_path / "not_a_directory" / "cache"))
+    bundle.reload()
+    assert bundle.rules["kill"](points=5) == 10 and bundle.compiled == 1
@@ -44,4 +44,33 @@ def test_register_and_execute_plugin(scoring_engine, mocker):
     mock_plugin.name = "bonus_plugin"
     scoring_engine.register_plugin(mock_plugin)
     scoring_engine.execute_plugin("bonus_plugin", points=5)
-    mock_plugin.execute.assert_called_once_with(points=5)
\ No newline at end of file
+    mock_plugin.execute.assert_called_once_with(points=5)
+
+
+def test_snapshot_is_isolated_from_later_writes(scoring_engine):
+    scoring_engine.initialize_score("player1", 10.0)
+    snapshot = scoring_engine.snapshot()
+    scoring_engine.update_score("player1", 5.0)
+    scoring_engine.initialize_score("player2", 1.0)
+    assert snapshot["player1"] == 10.0
+    assert "player2" not in snapshot
+    assert dict(scoring_engine.snapshot()) == {"player1": 15.0, "player2": 1.0}
+
+
+def test_snapshot_iteration_survives_concurrent_inserts(scoring_engine):
+    for i in range(100):
+        scoring_engine.initialize_score(f"player{i}", float(i))
+    snapshot = scoring_engine.snapshot()
+    seen = 0
+    for player_id in snapshot:
+        scoring_engine.initialize_score(f"new-{player_id}")
+        seen += 1
+    assert seen == 100 == len(snapshot)
+
+
+def test_snapshot_excludes_uncommitted_transaction(scoring_engine):
+    scoring_engine.initialize_score("player1", 10.0)
+    with scoring_engine.transaction():
+        scoring_engine.update_score("player1", 5.0)
+        assert scoring_engine.snapshot()["player1"] == 10.0
+    assert scoring_engine.snapshot()["player1"] == 15.0
@@ -0,0 +1,41 @@
+# tests/unit/test_sorted_list.py
+
+import bisect
+import random
+
+import pytest
+from pyscored.utils.sorted_list import SortedList
+
+
+def test_matches_a_sorted_python_list():
+    rng = random.Random(5)
+    values = SortedList(load=4)
+    expected = []
+    for step in range(3000):
+        if rng.random() < 0.55 or not expected:
+            value = rng.randrange(100)
+            values.add(value)
+            bisect.insort(expected, value)
+        else:
+            value = rng.choice(expected)
+            values.remove(value)
+            expected.remove(value)
+        if step % 100 == 0:
+            assert list(values) == expected and len(values) == len(expected)
+            assert all(values.bisect_left(v) == bisect.bisect_left(expected, v) for v in range(-1, 102))
+            assert all(values.bisect_right(v) == bisect.bisect_right(expected, v) for v in range(-1, 102))
+            assert values.last(7) == expected[-7:]
+            assert [values[i] for i in range(-len(expected), len(expected))] == expected * 2
+    # Short sublists are merged, so their number follows the size.
+    assert len(values._lists) <= len(expected) // 2 + 1
+
+
+def test_update_remove_and_bounds():
+    values = SortedList([5, 1, 3], load=2)
+    values.update([4, 2, 6, 0])
+    assert list(values) == [0, 1, 2, 3, 4, 5, 6] and 4 in values and 7 not in values
+    with pytest.raises(ValueError):
+        values.remove(7)
+    with pytest.raises(IndexError):
+        values[7]
+    assert values.last(0) == [] and values.last(10) == list(range(7))
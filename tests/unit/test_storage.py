@@ -0,0 +1,286 @@
+# tests/unit/test_storage.py
+
+import multiprocessing
+import os
+import subprocess
+import sys
+
+import pytest
+from pyscored.core.scoring_engine import ScoringEngine
+from pyscored.storage.memory import InMemoryStore
+from pyscored.plugins.streak_reward_plugin import StreakRewardPlugin
+from pyscored.storage import shared
+from pyscored.storage.shared import SharedMemoryStore
+from pyscored.storage.sqlite import SQLiteStore
+from pyscored.storage.tiered import TieredStore
+from pyscored.utils.fixed_point import FixedPoint
+
+
+@pytest.fixture
+def sqlite_path(tmp_path):
+    return str(tmp_path / "scores.db")
+
+
+def test_sqlite_store_uses_wal(sqlite_path):
+    store = SQLiteStore(sqlite_path)
+    assert store._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    store.close()
+
+
+def test_sqlite_store_buffers_writes_until_flush(sqlite_path):
+    store = SQLiteStore(sqlite_path, batch_size=100, flush_interval=None)
+    store["player1"] = 10.0
+    assert store["player1"] == 10.0
+    reader = SQLiteStore(sqlite_path)
+    assert "player1" not in reader
+    store.flush()
+    assert reader["player1"] == 10.0
+    store.close()
+    reader.close()
+
+
+def test_sqlite_store_flushes_full_batches(sqlite_path):
+    store = SQLiteStore(sqlite_path, batch_size=10, flush_interval=None)
+    store.update((f"player{i}", float(i)) for i in range(25))
+    assert not store._dirty
+    assert len(store) == 25
+    store.close()
+
+
+def test_sqlite_store_delete(sqlite_path):
+    with SQLiteStore(sqlite_path) as store:
+        store["player1"] = 1.0
+        store.flush()
+        del store["player1"]
+        assert "player1" not in store
+        with pytest.raises(KeyError):
+            del store["player1"]
+    with SQLiteStore(sqlite_path) as store:
+        assert len(store) == 0
+
+
+def test_engine_persists_through_sqlite_store(sqlite_path):
+    engine = ScoringEngine(store=SQLiteStore(sqlite_path))
+    engine.initialize_score("player1", 5.0)
+    with engine.transaction():
+        engine.update_score("player1", 5.0)
+    engine.close()
+    engine = ScoringEngine(store=SQLiteStore(sqlite_path))
+    assert engine.get_score("player1") == 10.0
+    assert dict(engine.snapshot()) == {"player1": 10.0}
+    engine.close()
+
+
+def test_sqlite_store_round_trips_fixed_point_scores(sqlite_path):
+    store = SQLiteStore(sqlite_path)
+    engine = ScoringEngine(store=store, fixed_point=FixedPoint(scale=100))
+    engine.initialize_score("player1", 15.01)
+    store["player2"] = 2 ** 60 + 1
+    engine.close()
+    engine = ScoringEngine(store=SQLiteStore(sqlite_path), fixed_point=FixedPoint(scale=100))
+    raw = dict(engine.snapshot())
+    assert raw == {"player1": 1501, "player2": 2 ** 60 + 1}
+    assert all(type(score) is int for score in raw.values())
+    assert engine.query().sum() == (1501 + 2 ** 60 + 1) / 100
+    engine.close()
+
+
+def test_in_memory_store_requires_power_of_two_segments():
+    with pytest.raises(ValueError):
+        InMemoryStore(segments=3)
+
+
+def test_in_memory_store_splits_segments_as_it_grows():
+    store = InMemoryStore(segments=2, segment_size=8)
+    store.update((f"player{i}", float(i)) for i in range(10))
+    snapshot = store.snapshot()
+    for i in range(10, 200):
+        store[f"player{i}"] = float(i)
+    assert store.segments >= 16
+    assert max(map(len, store._segments)) <= 16
+    assert len(store) == 200 and store["player150"] == 150.0 and "player199" in store
+    assert dict(snapshot) == {f"player{i}": float(i) for i in range(10)}
+
+
+def test_tiered_store_pages_idle_players(sqlite_path, fake_clock):
+    store = TieredStore(sqlite_path, idle_after=10.0, evict_interval=5.0, batch_size=2, clock=fake_clock)
+    engine = ScoringEngine(store=store)
+    engine.register_plugin(StreakRewardPlugin("streak", reward_streak=3, reward_points=50))
+    for i in range(5):
+        engine.initialize_score(f"player{i}", float(i))
+    engine.execute_plugin("streak", player_id="player1", action_successful=True)
+    fake_clock.now = 8.0
+    engine.update_score("player4", 1.0)
+    fake_clock.now = 14.0
+    engine.update_score("player4", 1.0)
+    metrics = store.metrics()
+    assert (metrics.hot_players, metrics.cold_players, metrics.evictions) == (1, 4, 4)
+    assert engine.get_plugin("streak").streak_counts == {}
+    assert len(store) == 5 and dict(engine.snapshot())["player2"] == 2.0
+    engine.update_score("player1", 1.0)
+    assert engine.get_score("player1") == 2.0
+    assert engine.get_plugin("streak").streak_counts == {"player1": 1}
+    assert store.metrics().faults == 1 and store.metrics().cold_players == 3
+    with pytest.raises(ValueError):
+        engine.update_score("nobody", 1.0)
+    engine.close()
+
+
+def test_tiered_store_stamps_accesses_after_a_quiet_period(sqlite_path, fake_clock):
+    store = TieredStore(sqlite_path, idle_after=10.0, evict_interval=5.0, clock=fake_clock)
+    engine = ScoringEngine(store=store)
+    for player_id in ("x", "y", "z"):
+        engine.initialize_score(player_id)
+    fake_clock.now = 1000.0
+    assert engine.get_score("x") == 0.0
+    engine.update_score("y", 1.0)
+    metrics = store.metrics()
+    assert (metrics.hot_players, metrics.cold_players) == (2, 1)
+    engine.close()
+
+
+def test_tiered_store_keeps_cold_rows_of_faulted_players(sqlite_path, fake_clock):
+    store = TieredStore(sqlite_path, idle_after=10.0, clock=fake_clock)
+    store.update({"player1": 1.0, "player2": 2.0})
+    fake_clock.now = 20.0
+    assert store.evict() == 2
+    assert store["player1"] == 1.0 and store["player2"] == 2.0
+    assert len(store) == 2 and store.metrics().cold_players == 0
+    # Without a clean close, the players that were only read are still on disk.
+    crashed = TieredStore(sqlite_path)
+    assert dict(crashed.snapshot()) == {"player1": 1.0, "player2": 2.0}
+    crashed.close()
+    store["player1"] = 5.0
+    del store["player2"]
+    assert dict(store.snapshot()) == {"player1": 5.0}
+    store.close()
+    with TieredStore(sqlite_path) as reopened:
+        assert dict(reopened.snapshot()) == {"player1": 5.0} and len(reopened) == 1
+
+
+def test_tiered_store_spills_on_close(sqlite_path):
+    engine = ScoringEngine(store=TieredStore(sqlite_path), fixed_point=FixedPoint(scale=1000))
+    engine.initialize_score("player1", 1.5)
+    engine.close()
+    store = TieredStore(sqlite_path)
+    assert store.metrics().cold_players == 1 and store["player1"] == 1500
+    del store["player1"]
+    assert len(store) == 0
+    store.close()
+
+
+def test_shared_memory_store_mapping():
+    store = SharedMemoryStore(capacity=8, key_size=16)
+    for i in range(8):
+        store[f"player{i}"] = float(i)
+    with pytest.raises(ValueError):
+        store["player8"] = 8.0
+    del store["player3"]
+    store["player8"] = 8.0  # reuses the freed slot
+    store["player1"] += 10
+    assert len(store) == 8 and "player3" not in store and store.get("player3") is None
+    expected = {f"player{i}": float(i) for i in (0, 2, 4, 5, 6, 7, 8)}
+    expected["player1"] = 11.0
+    assert dict(store.snapshot().items()) == expected
+    assert store.increment("player2", 5.0) == (2.0, 7.0)
+    with pytest.raises(ValueError):
+        store["a" * 17] = 1.0
+    store.close()
+
+
+def _increment_worker(engine, players, count):
+    for i in range(count):
+        engine.update_score(players[i % len(players)], 1)
+
+
+def test_shared_memory_store_is_shared_by_forked_workers():
+    context = multiprocessing.get_context("fork")
+    engine = ScoringEngine(store=SharedMemoryStore(capacity=64, typecode="q"), fixed_point=FixedPoint(scale=1000))
+    players = [f"player{i}" for i in range(4)]
+    for player_id in players:
+        engine.initialize_score(player_id)
+    workers = [context.Process(target=_increment_worker, args=(engine, players, 2000)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert all(worker.exitcode == 0 for worker in workers)
+    assert [engine.get_score(player_id) for player_id in players] == [2000.0] * 4
+    engine.close()
+
+
+_ATTACHED_WORKER = """
+import sys
+from pyscored.storage.shared import SharedMemoryStore
+store = SharedMemoryStore.from_name(sys.argv[1])
+for i in range(1000):
+    store.increment(f"player{i % 4}", 1)
+store.close()
+"""
+
+
+def test_shared_memory_store_is_opened_by_name_in_spawned_workers():
+    store = SharedMemoryStore(capacity=64, typecode="q")
+    for i in range(4):
+        store[f"player{i}"] = 0
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(shared.__file__))))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")])))
+    workers = [subprocess.Popen([sys.executable, "-c", _ATTACHED_WORKER, store.name], env=env) for _ in range(3)]
+    for i in range(1000):
+        store.increment(f"player{i % 4}", 1)
+    assert [worker.wait() for worker in workers] == [0, 0, 0]
+    assert dict(store.items()) == {f"player{i}": 1000 for i in range(4)}
+    store.close()
+    with pytest.raises(FileNotFoundError):
+        SharedMemoryStore.from_name(store.name)
+
+
+def test_shared_memory_store_transactions_commit_increments():
+    store = SharedMemoryStore(capacity=8)
+    other = SharedMemoryStore.from_name(store.name)
+    engine, worker = ScoringEngine(store=store), ScoringEngine(store=other)
+    engine.initialize_score("p", 0)
+    engine.initialize_score("q", 0)
+    with engine.transaction():
+        engine.update_score("p", 5)
+        with engine.transaction():
+            engine.update_score("p", 1)
+            engine.initialize_score("q", 100)
+            engine.update_score("q", 1)
+        worker.update_score("p", 10)
+        worker.update_score("q", 10)
+    assert engine.update_scores([("p", 2), ("p", 3)]) == 2
+    # Increments of the other worker survive; an assignment in the transaction wins.
+    assert worker.get_score("p") == 21 and worker.get_score("q") == 101
+    with pytest.raises(RuntimeError):
+        with engine.transaction():
+            engine.update_score("p", 50)
+            raise RuntimeError
+    assert engine.get_score("p") == 21
+    other.close()
+    store.close()
+
+
+def test_shared_memory_store_reuses_index_entries_of_removed_players():
+    store = SharedMemoryStore(capacity=4, key_size=16)
+    for round in range(500):
+        for i in range(4):
+            store[f"p{round}-{i}"] = float(i)
+        assert [store[f"p{round}-{i}"] for i in range(4)] == [0.0, 1.0, 2.0, 3.0]
+        for i in (2, 0, 3, 1):
+            del store[f"p{round}-{i}"]
+            assert f"p{round}-{i}" not in store
+    with memoryview(store._buf)[store._index:] as index:
+        assert len(store) == 0 and not any(index)
+    store.close()
+
+
+def test_shared_memory_store_reads_give_up_on_a_stalled_slot(monkeypatch):
+    monkeypatch.setattr(shared, "_STALL_TIMEOUT", 0.01)
+    store = SharedMemoryStore(capacity=4)
+    store["player1"] = 1.0
+    # A writer that died inside the slot leaves its sequence counter odd.
+    shared._INT.pack_into(store._buf, store._records, 1)
+    with pytest.raises(TimeoutError):
+        store.get("player1")
+    store.close()
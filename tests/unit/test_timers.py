@@ -0,0 +1,113 @@
+# tests/unit/test_timers.py
+
+import asyncio
+import logging
+import random
+
+import pytest
+from pyscored.core.scoring_engine import ScoringEngine
+from pyscored.core.timers import TimerWheel
+
+
+def test_timers_fire_on_their_tick_across_levels():
+    rng = random.Random(5)
+    wheel = TimerWheel(tick=1.0, slots=4, levels=3)
+    fired = []
+    due = {}
+    timers = []
+    for i in range(300):
+        delay = rng.randrange(1, 200)  # some beyond the 64-tick span of the wheel
+        timers.append(wheel.schedule(delay, lambda i=i: fired.append((wheel.now, i))))
+        due[i] = wheel.now + delay
+        wheel.tick(rng.randrange(2))
+    for i in rng.sample(range(300), 50):
+        if timers[i].cancel():
+            del due[i]
+        assert not timers[i].cancel() and not timers[i].active
+    while len(wheel):
+        wheel.tick()
+    assert sorted(fired) == sorted((tick, i) for i, tick in due.items())
+
+
+def test_advance_follows_the_clock_and_batches_due_timers(fake_clock):
+    wheel = TimerWheel(tick=0.5, clock=fake_clock)
+    fired = []
+    for delay in (0.1, 0.5, 1.2, 30.0):
+        wheel.schedule(delay, fired.append, delay)
+    fake_clock.now = 1.0
+    assert wheel.advance() == 2 and fired == [0.1, 0.5]
+    fake_clock.now = 100.0
+    assert wheel.advance() == 2 and fired == [0.1, 0.5, 1.2, 30.0]
+    fake_clock.now = 500.0
+    assert wheel.advance() == 0 and wheel.now == 1000
+
+
+def test_callback_errors_do_not_stop_the_batch():
+    wheel = TimerWheel()
+    fired = []
+
+    def fail():
+        raise RuntimeError("boom")
+
+    wheel.schedule(1, fail)
+    wheel.schedule(1, fired.append, "ok")
+    with pytest.raises(RuntimeError):
+        wheel.tick()
+    assert fired == ["ok"]
+
+
+def test_schedule_counts_from_the_clock_once_driven_by_it(fake_clock):
+    wheel = TimerWheel(tick=1.0, clock=fake_clock)
+    fired = []
+    wheel.advance()
+    fake_clock.now = 10.0
+    wheel.schedule(5, fired.append, "late")
+    assert wheel.now == 10
+    fake_clock.now = 14.0
+    assert wheel.advance() == 0
+    fake_clock.now = 15.0
+    assert wheel.advance() == 1 and fired == ["late"]
+
+
+def test_run_logs_callback_errors(caplog):
+    wheel = TimerWheel(tick=0.001)
+
+    def fail():
+        raise RuntimeError("boom")
+
+    async def main():
+        wheel.schedule(0, fail)
+        task = asyncio.ensure_future(wheel.run())
+        while len(wheel):
+            await asyncio.sleep(0.001)
+        await asyncio.sleep(0.005)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    with caplog.at_level(logging.ERROR, logger="pyscored.core.timers"):
+        asyncio.run(main())
+    assert "RuntimeError: boom" in caplog.text
+
+
+def test_multipliers_and_deferred_updates(fake_clock):
+    engine = ScoringEngine()
+    engine.enable_timers(tick=1.0, clock=fake_clock)
+    engine.initialize_score("alice", 0)
+    engine.initialize_score("bob", 0)
+    engine.add_multiplier(2, 600, player_id="alice")
+    weekend = engine.add_multiplier(3, 3600)
+    engine.update_score("alice", 10)
+    engine.update_score("bob", 10)
+    assert engine.get_score("alice") == 60 and engine.get_score("bob") == 30
+    engine.defer_update(30, "bob", 5)
+    fake_clock.now = 30.0
+    engine.timers.advance()
+    assert engine.get_score("bob") == 45  # deferred points are multiplied when applied
+    fake_clock.now = 600.0
+    engine.timers.advance()
+    assert engine.multiplier("alice") == 3
+    engine.remove_multiplier(weekend)
+    engine.update_score("alice", 1)
+    assert engine.get_score("alice") == 61 and engine.multiplier("bob") == 1
+    assert len(engine.timers) == 0
@@ -0,0 +1,86 @@
+# tests/unit/test_transaction.py
+
+import pytest
+from pyscored.core.scoring_engine import ScoringEngine
+from pyscored.core.transaction import DeltaOverlay
+from pyscored.plugins.combo_bonus_plugin import ComboBonusPlugin
+
+
+@pytest.fixture
+def engine():
+    engine = ScoringEngine()
+    engine.initialize_score("player1", 10.0)
+    engine.initialize_score("player2", 20.0)
+    engine.register_plugin(ComboBonusPlugin("combo", bonus_threshold=1, bonus_multiplier=1.0))
+    return engine
+
+
+def test_commit_applies_all_writes(engine):
+    with engine.transaction():
+        engine.update_score("player1", 5.0)
+        engine.initialize_score("player3", 1.0)
+        assert engine.get_score("player1") == 15.0
+    assert engine.get_score("player1") == 15.0
+    assert engine.get_score("player3") == 1.0
+
+
+def test_error_discards_scores_and_plugin_state(engine):
+    with pytest.raises(ValueError):
+        with engine.transaction():
+            engine.update_score("player1", 5.0)
+            engine.execute_plugin("combo", player_id="player2", action_successful=True, base_points=3)
+            engine.update_score("missing", 1.0)
+    assert engine.get_score("player1") == 10.0
+    assert engine.get_score("player2") == 20.0
+    assert engine.get_plugin("combo").combo_counts == {}
+
+
+def test_base_is_untouched_until_commit(engine):
+    scores = engine._scores
+    with engine.transaction():
+        engine.update_score("player1", 5.0)
+        assert scores["player1"] == 10.0
+    assert scores["player1"] == 15.0
+
+
+def test_nested_rollback_keeps_outer_writes(engine):
+    with engine.transaction():
+        engine.update_score("player1", 1.0)
+        with pytest.raises(RuntimeError):
+            with engine.transaction():
+                engine.update_score("player2", 1.0)
+                raise RuntimeError("abort")
+    assert engine.get_score("player1") == 11.0
+    assert engine.get_score("player2") == 20.0
+
+
+def test_plugin_registered_in_rolled_back_transaction_is_dropped(engine):
+    with pytest.raises(RuntimeError):
+        with engine.transaction():
+            engine.register_plugin(ComboBonusPlugin("late", bonus_threshold=1, bonus_multiplier=1.0))
+            raise RuntimeError("abort")
+    with pytest.raises(ValueError):
+        engine.get_plugin("late")
+
+
+def test_rolled_back_transaction_restores_replaced_plugin(engine):
+    original = ComboBonusPlugin("combo", bonus_threshold=1, bonus_multiplier=1.0)
+    engine.register_plugin(original)
+    with pytest.raises(RuntimeError):
+        with engine.transaction():
+            engine.register_plugin(ComboBonusPlugin("combo", bonus_threshold=2, bonus_multiplier=2.0))
+            with engine.transaction():
+                engine.register_plugin(ComboBonusPlugin("combo", bonus_threshold=3, bonus_multiplier=3.0))
+            raise RuntimeError("abort")
+    assert engine.get_plugin("combo") is original
+
+
+def test_overlay_deletes_and_iteration():
+    base = {"a": 1, "b": 2}
+    overlay = DeltaOverlay(base)
+    del overlay["a"]
+    overlay["c"] = 3
+    assert sorted(overlay) == ["b", "c"]
+    assert "a" not in overlay and len(overlay) == 2
+    overlay.commit()
+    assert base == {"b": 2, "c": 3}
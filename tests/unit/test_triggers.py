@@ -0,0 +1,128 @@
+# tests/unit/test_triggers.py
+
+import random
+
+import pytest
+from pyscored.analytics.triggers import TriggerIndex
+from pyscored.core.scoring_engine import ScoringEngine
+
+
+def test_fires_on_crossing_once_per_player():
+    engine = ScoringEngine()
+    engine.initialize_score("alice", 0)
+    triggers = engine.triggers
+    triggers.add_trigger("bronze", 100)
+    triggers.add_trigger("silver", 200)
+    triggers.add_trigger("streak", 50, once=False)
+    batches = []
+    triggers.on_fire(batches.append)
+    engine.update_score("alice", 100)  # reaching a threshold exactly fires it
+    assert [[f.trigger.name for f in batch] for batch in batches] == [["streak", "bronze"]]
+    engine.update_score("alice", -80)
+    engine.update_score("alice", 80)
+    assert [f.trigger.name for f in batches[-1]] == ["streak"]
+    engine.update_score("alice", 500)
+    assert [f.trigger.name for f in batches[-1]] == ["silver"]
+    assert triggers.fired_for("bronze") == {"alice"}
+
+
+def test_down_triggers_and_transactions_are_batched():
+    engine = ScoringEngine()
+    for player_id in ("a", "b"):
+        engine.initialize_score(player_id, 100)
+    triggers = engine.triggers
+    triggers.add_trigger("demoted", 50, direction="down")
+    triggers.add_trigger("top", 150)
+    batches = []
+    triggers.on_fire(batches.append)
+    engine.update_scores([("a", -60), ("b", 60), ("a", 200)])
+    assert len(batches) == 1
+    assert sorted((f.player_id, f.trigger.name) for f in batches[0]) == [("a", "demoted"), ("a", "top"), ("b", "top")]
+    with pytest.raises(RuntimeError):
+        with engine.transaction():
+            engine.initialize_score("c", 0)
+            engine.update_score("c", 500)
+            raise RuntimeError
+    assert len(batches) == 1 and "c" not in triggers.fired_for("top")
+
+
+def test_matches_a_linear_scan():
+    rng = random.Random(3)
+    engine = ScoringEngine()
+    players = [f"p{i}" for i in range(20)]
+    for player_id in players:
+        engine.initialize_score(player_id, 0)
+    thresholds = sorted(rng.sample(range(-500, 500), 40))
+    triggers = engine.triggers
+    for threshold in thresholds:
+        triggers.add_trigger(f"t{threshold}", threshold, direction=rng.choice(("up", "down")), once=False)
+    fired = []
+    triggers.on_fire(fired.extend)
+    expected = []
+    for _ in range(1000):
+        player_id = rng.choice(players)
+        old = engine.get_score(player_id)
+        points = rng.randrange(-100, 100)
+        new = old + points
+        for threshold in thresholds:
+            trigger = triggers._triggers[f"t{threshold}"]
+            if (trigger.direction == "up" and old < threshold <= new) or (
+                    trigger.direction == "down" and new < threshold <= old):
+                expected.append((player_id, threshold))
+        engine.update_score(player_id, points)
+    assert sorted((f.player_id, f.trigger.threshold) for f in fired) == sorted(expected)
+
+
+def test_once_only_survives_restore():
+    engine = ScoringEngine()
+    engine.initialize_score("alice", 0)
+    engine.triggers.add_trigger("bronze", 100)
+    engine.update_score("alice", 150)
+    state = engine.triggers.to_dict()
+
+    restored = ScoringEngine()
+    restored.initialize_score("alice", 0)
+    restored.initialize_score("bob", 0)
+    triggers = restored.enable_triggers(state=state)
+    fired = []
+    triggers.on_fire(fired.extend)
+    restored.update_score("alice", 150)
+    restored.update_score("bob", 150)
+    assert [f.player_id for f in fired] == ["bob"]
+    assert TriggerIndex.from_dict(triggers.to_dict()).fired_for("bronze") == {"alice", "bob"}
+
+
+def test_engine_checkpoint_round_trip():
+    engine = ScoringEngine()
+    engine.initialize_score("alice", 0)
+    engine.initialize_score("bob", 0)
+    engine.triggers.add_trigger("bronze", 100)
+    engine.update_score("alice", 150)
+    with engine.transaction():
+        engine.update_score("bob", 150)
+        # Both halves of the checkpoint exclude the uncommitted change.
+        scores = engine.snapshot()
+        state = engine.triggers.to_dict()
+    assert engine.triggers.fired_for("bronze") == {"alice", "bob"}
+
+    restored = ScoringEngine()
+    fired = []
+    triggers = restored.enable_triggers(state=state)
+    triggers.on_fire(fired.extend)
+    restored.apply_changes(scores)
+    assert fired == []
+    assert restored.get_score("alice") == 150 and restored.get_score("bob") == 0
+    restored.update_score("alice", 100)
+    restored.update_score("bob", 150)
+    assert [f.player_id for f in fired] == ["bob"]
+
+
+def test_remove_trigger_and_validation():
+    triggers = TriggerIndex()
+    triggers.add_trigger("bronze", 100)
+    with pytest.raises(ValueError):
+        triggers.add_trigger("bronze", 200)
+    with pytest.raises(ValueError):
+        triggers.add_trigger("sideways", 10, direction="left")
+    triggers.remove_trigger("bronze")
+    assert "bronze" not in triggers and triggers.check("alice", 0, 500) == []
@@ -0,0 +1,58 @@
+# tests/unit/test_windows.py
+
+import random
+
+import pytest
+from pyscored.analytics.windows import WindowedScores
+from pyscored.core.scoring_engine import ScoringEngine
+
+
+def test_window_sums_slide_with_the_clock(fake_clock):
+    engine = ScoringEngine()
+    for player_id in ("alice", "bob"):
+        engine.initialize_score(player_id, 0)
+    recent = engine.enable_window("recent", window=60, buckets=6, clock=fake_clock)
+    engine.update_score("alice", 10)
+    fake_clock.now = 25.0
+    engine.update_score("alice", 5)
+    engine.update_score("bob", 12)
+    engine.initialize_score("bob", 100)  # assignments are not points earned
+    assert engine.window_score("recent", "alice") == 15
+    assert engine.window_top("recent", 1) == [("alice", 15.0)]
+    fake_clock.now = 60.0  # the bucket holding alice's first 10 points has slid out
+    assert recent.score("alice") == 5 and recent.score("bob") == 12
+    fake_clock.now = 200.0
+    assert recent.top() == [] and recent.compact() == 2 and len(recent) == 0
+    engine.update_score("bob", 3)
+    assert recent.scores() == {"bob": 3.0}
+
+
+def test_matches_raw_events(fake_clock):
+    rng = random.Random(11)
+    window = WindowedScores(window=100, buckets=10, clock=fake_clock)
+    events = []
+    players = [f"p{i}" for i in range(15)]
+    for _ in range(2000):
+        fake_clock.now += rng.random() * 2
+        player_id = rng.choice(players)
+        points = rng.randrange(1, 20)
+        window.add(player_id, points)
+        events.append((fake_clock.now, player_id, points))
+        if rng.random() < 0.05:
+            # Buckets are 10s wide: the window starts at the start of the oldest live bucket.
+            start = (fake_clock.now // 10 - 9) * 10
+            for player_id in players:
+                expected = sum(p for t, who, p in events if who == player_id and t >= start)
+                assert window.score(player_id) == pytest.approx(expected)
+
+
+def test_removed_players_release_their_slot():
+    engine = ScoringEngine()
+    engine.initialize_score("alice", 0)
+    window = engine.enable_window("day", window=86400, buckets=24)
+    engine.update_score("alice", 4)
+    engine.apply_changes({}, ["alice"])
+    assert "alice" not in window
+    engine.initialize_score("bob", 0)
+    engine.update_score("bob", 2)
+    assert window.score("bob") == 2 and len(window._totals) == 1
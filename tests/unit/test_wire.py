@@ -0,0 +1,91 @@
+# tests/unit/test_wire.py
+
+import pytest
+from pyscored.core.scoring_engine import ScoringEngine
+from pyscored.core.wire import (DELTA, EVENTS, SNAPSHOT, WireDecoder, WireEncoder, WireError, dumps_snapshot,
+                                loads_snapshot, snapshot_diff)
+from pyscored.utils.fixed_point import FixedPoint
+
+
+@pytest.mark.parametrize("scores", [
+    {},
+    {"alice": 10.0, "bob": -3.0, "carol": 10.0},
+    {"alice": 1.5, "bob": float("inf"), "ünï": -2.25},
+    {"alice": 2 ** 62, "bob": -(2 ** 62), "carol": 7},
+])
+@pytest.mark.parametrize("sort", [False, True])
+def test_snapshot_round_trip(scores, sort):
+    decoded = loads_snapshot(dumps_snapshot(scores, frame_size=2, sort=sort))
+    assert decoded == scores
+    assert [type(value) for value in decoded.values()] == [type(scores[key]) for key in decoded]
+
+
+def test_snapshot_is_smaller_than_json():
+    import json
+    scores = {f"player{i}": float(i * 7919 % 100_000) for i in range(10_000)}
+    unsorted, ordered = len(dumps_snapshot(scores)), len(dumps_snapshot(scores, sort=True))
+    assert ordered < unsorted
+    assert unsorted * 1.5 < len(json.dumps(scores))
+
+
+def test_events_reference_player_ids_after_first_use():
+    encoder, decoder = WireEncoder(), WireDecoder()
+    first = encoder.encode_events([("alice", 5), ("bob", -2)], sequence=1)
+    second = encoder.encode_events([("alice", 1.5), ("bob", 300)], sequence=2)
+    assert b"alice" in first and b"alice" not in second
+    frames = list(decoder.decode(first + second))
+    assert [frame.kind for frame in frames] == [EVENTS, EVENTS]
+    assert [frame.sequence for frame in frames] == [1, 2]
+    assert frames[0].entries == [("alice", 5), ("bob", -2)]
+    assert frames[1].entries == [("alice", 1.5), ("bob", 300.0)]
+
+
+def test_delta_frames_and_diff():
+    engine = ScoringEngine()
+    for player_id in ("alice", "bob", "carol"):
+        engine.initialize_score(player_id, 1.0)
+    before = engine.snapshot()
+    engine.update_score("alice", 4)
+    engine.initialize_score("dave", 2.0)
+    del engine._store["carol"]
+    changed, removed = snapshot_diff(before, engine.snapshot())
+    assert changed == {"alice": 5.0, "dave": 2.0}
+    assert removed == ["carol"]
+
+    encoder, decoder = WireEncoder(), WireDecoder()
+    data = encoder.encode_snapshot(before) + encoder.encode_delta(changed, removed, sequence=9)
+    snapshot, delta = decoder.decode(data)
+    assert snapshot.kind == SNAPSHOT and snapshot.reset
+    assert delta.kind == DELTA and delta.sequence == 9
+    assert dict(delta.entries) == changed and delta.removed == ["carol"]
+
+
+def test_fixed_point_values_stay_integers():
+    engine = ScoringEngine(fixed_point=FixedPoint(scale=1000))
+    engine.initialize_score("alice", 1.25)
+    engine.initialize_score("bob", 0.001)
+    assert loads_snapshot(dumps_snapshot(engine.snapshot())) == {"alice": 1250, "bob": 1}
+
+
+def test_streaming_decoder_accepts_partial_frames():
+    encoder, decoder = WireEncoder(), WireDecoder()
+    data = encoder.encode_snapshot({f"p{i}": i * 1.5 for i in range(100)}, frame_size=30)
+    data += encoder.encode_events([("p1", 2.0)])
+    frames = []
+    for start in range(0, len(data), 7):
+        frames.extend(decoder.feed(data[start:start + 7]))
+    assert [frame.kind for frame in frames] == [SNAPSHOT] * 4 + [EVENTS]
+    assert sum(len(frame.entries) for frame in frames[:4]) == 100
+    assert frames[-1].entries == [("p1", 2.0)]
+
+
+def test_invalid_frames_are_rejected():
+    with pytest.raises(WireError):
+        list(WireDecoder().decode(b"XX" + bytes(7)))
+    data = WireEncoder().encode_snapshot({"alice": 1.0})
+    with pytest.raises(WireError):
+        list(WireDecoder().decode(data[:-1]))
+    encoder = WireEncoder()
+    encoder.encode_events([("alice", 1)])
+    with pytest.raises(WireError):
+        list(WireDecoder().decode(encoder.encode_events([("alice", 1)])))